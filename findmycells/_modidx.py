@@ -62,22 +62,65 @@ d = { 'settings': { 'branch': 'main',
                                      'findmycells.configs.ProjectConfigs': ('api/configs.html#projectconfigs', 'findmycells/configs.py'),
                                      'findmycells.configs.ProjectConfigs.__init__': ( 'api/configs.html#projectconfigs.__init__',
                                                                                       'findmycells/configs.py'),
-                                     'findmycells.configs.ProjectConfigs._load_available_data_readers_and_their_default_configs': ( 'api/configs.html#projectconfigs._load_available_data_readers_and_their_default_configs',
-                                                                                                                                    'findmycells/configs.py'),
-                                     'findmycells.configs.ProjectConfigs._load_available_inspection_methods': ( 'api/configs.html#projectconfigs._load_available_inspection_methods',
-                                                                                                                'findmycells/configs.py'),
-                                     'findmycells.configs.ProjectConfigs._load_available_strategies_and_objects': ( 'api/configs.html#projectconfigs._load_available_strategies_and_objects',
-                                                                                                                    'findmycells/configs.py'),
+                                     'findmycells.configs.ProjectConfigs.__setstate__': ( 'api/configs.html#projectconfigs.__setstate__',
+                                                                                          'findmycells/configs.py'),
                                      'findmycells.configs.ProjectConfigs.add_processing_step_configs': ( 'api/configs.html#projectconfigs.add_processing_step_configs',
                                                                                                          'findmycells/configs.py'),
                                      'findmycells.configs.ProjectConfigs.add_reader_configs': ( 'api/configs.html#projectconfigs.add_reader_configs',
                                                                                                 'findmycells/configs.py'),
+                                     'findmycells.configs.ProjectConfigs.available_data_readers': ( 'api/configs.html#projectconfigs.available_data_readers',
+                                                                                                    'findmycells/configs.py'),
+                                     'findmycells.configs.ProjectConfigs.available_inspection_methods': ( 'api/configs.html#projectconfigs.available_inspection_methods',
+                                                                                                          'findmycells/configs.py'),
+                                     'findmycells.configs.ProjectConfigs.available_processing_modules': ( 'api/configs.html#projectconfigs.available_processing_modules',
+                                                                                                          'findmycells/configs.py'),
+                                     'findmycells.configs.ProjectConfigs.available_processing_objects': ( 'api/configs.html#projectconfigs.available_processing_objects',
+                                                                                                          'findmycells/configs.py'),
+                                     'findmycells.configs.ProjectConfigs.available_processing_strategies': ( 'api/configs.html#projectconfigs.available_processing_strategies',
+                                                                                                             'findmycells/configs.py'),
+                                     'findmycells.configs.ProjectConfigs.data_reader_default_configs': ( 'api/configs.html#projectconfigs.data_reader_default_configs',
+                                                                                                         'findmycells/configs.py'),
                                      'findmycells.configs.ProjectConfigs.load_available_processing_modules': ( 'api/configs.html#projectconfigs.load_available_processing_modules',
-                                                                                                               'findmycells/configs.py')},
+                                                                                                               'findmycells/configs.py'),
+                                     'findmycells.configs.Registry': ('api/configs.html#registry', 'findmycells/configs.py'),
+                                     'findmycells.configs.Registry.__init__': ( 'api/configs.html#registry.__init__',
+                                                                                'findmycells/configs.py'),
+                                     'findmycells.configs.Registry._fill_once': ( 'api/configs.html#registry._fill_once',
+                                                                                  'findmycells/configs.py'),
+                                     'findmycells.configs.Registry._load_plugins': ( 'api/configs.html#registry._load_plugins',
+                                                                                     'findmycells/configs.py'),
+                                     'findmycells.configs.Registry._register_data_reader': ( 'api/configs.html#registry._register_data_reader',
+                                                                                             'findmycells/configs.py'),
+                                     'findmycells.configs.Registry._register_plugin_class': ( 'api/configs.html#registry._register_plugin_class',
+                                                                                              'findmycells/configs.py'),
+                                     'findmycells.configs.Registry._screen_data_readers': ( 'api/configs.html#registry._screen_data_readers',
+                                                                                            'findmycells/configs.py'),
+                                     'findmycells.configs.Registry._screen_inspection_methods': ( 'api/configs.html#registry._screen_inspection_methods',
+                                                                                                  'findmycells/configs.py'),
+                                     'findmycells.configs.Registry._screen_processing_modules': ( 'api/configs.html#registry._screen_processing_modules',
+                                                                                                  'findmycells/configs.py'),
+                                     'findmycells.configs.Registry.data_reader_default_configs': ( 'api/configs.html#registry.data_reader_default_configs',
+                                                                                                   'findmycells/configs.py'),
+                                     'findmycells.configs.Registry.data_reader_specs': ( 'api/configs.html#registry.data_reader_specs',
+                                                                                         'findmycells/configs.py'),
+                                     'findmycells.configs.Registry.fill': ('api/configs.html#registry.fill', 'findmycells/configs.py'),
+                                     'findmycells.configs.Registry.get_reader_class': ( 'api/configs.html#registry.get_reader_class',
+                                                                                        'findmycells/configs.py'),
+                                     'findmycells.configs.Registry.inspection_methods': ( 'api/configs.html#registry.inspection_methods',
+                                                                                          'findmycells/configs.py'),
+                                     'findmycells.configs.Registry.processing_modules': ( 'api/configs.html#registry.processing_modules',
+                                                                                          'findmycells/configs.py'),
+                                     'findmycells.configs.Registry.processing_objects': ( 'api/configs.html#registry.processing_objects',
+                                                                                          'findmycells/configs.py'),
+                                     'findmycells.configs.Registry.processing_strategies': ( 'api/configs.html#registry.processing_strategies',
+                                                                                             'findmycells/configs.py')},
             'findmycells.core': { 'findmycells.core.DataLoader': ('api/core.html#dataloader', 'findmycells/core.py'),
                                   'findmycells.core.DataLoader.determine_reader': ( 'api/core.html#dataloader.determine_reader',
                                                                                     'findmycells/core.py'),
                                   'findmycells.core.DataLoader.load': ('api/core.html#dataloader.load', 'findmycells/core.py'),
+                                  'findmycells.core.DataLoader.load_planes': ( 'api/core.html#dataloader.load_planes',
+                                                                               'findmycells/core.py'),
+                                  'findmycells.core.DataLoader.load_shape': ('api/core.html#dataloader.load_shape', 'findmycells/core.py'),
                                   'findmycells.core.DataReader': ('api/core.html#datareader', 'findmycells/core.py'),
                                   'findmycells.core.DataReader.assert_correct_output_format': ( 'api/core.html#datareader.assert_correct_output_format',
                                                                                                 'findmycells/core.py'),
@@ -124,6 +167,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                                             'findmycells/core.py'),
                                   'findmycells.core.ProcessingStrategy.initialize_gui_configs_and_widget': ( 'api/core.html#processingstrategy.initialize_gui_configs_and_widget',
                                                                                                              'findmycells/core.py'),
+                                  'findmycells.core.ProcessingStrategy.processing_kind': ( 'api/core.html#processingstrategy.processing_kind',
+                                                                                           'findmycells/core.py'),
                                   'findmycells.core.ProcessingStrategy.processing_type': ( 'api/core.html#processingstrategy.processing_type',
                                                                                            'findmycells/core.py'),
                                   'findmycells.core.ProcessingStrategy.run': ( 'api/core.html#processingstrategy.run',
@@ -167,6 +212,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                                      'findmycells/database.py'),
                                       'findmycells.database.Database._get_results_overview_dataframe_for_export': ( 'api/database.html#database._get_results_overview_dataframe_for_export',
                                                                                                                     'findmycells/database.py'),
+                                      'findmycells.database.Database._get_zstack_stores': ( 'api/database.html#database._get_zstack_stores',
+                                                                                            'findmycells/database.py'),
                                       'findmycells.database.Database._identify_removed_files': ( 'api/database.html#database._identify_removed_files',
                                                                                                  'findmycells/database.py'),
                                       'findmycells.database.Database._initialize_all_top_level_subdirectories': ( 'api/database.html#database._initialize_all_top_level_subdirectories',
@@ -191,18 +238,71 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                      'findmycells/database.py'),
                                       'findmycells.database.Database.compute_file_infos': ( 'api/database.html#database.compute_file_infos',
                                                                                             'findmycells/database.py'),
+                                      'findmycells.database.Database.contains_zstack': ( 'api/database.html#database.contains_zstack',
+                                                                                         'findmycells/database.py'),
+                                      'findmycells.database.Database.create_zstack': ( 'api/database.html#database.create_zstack',
+                                                                                       'findmycells/database.py'),
                                       'findmycells.database.Database.export_quantification_results': ( 'api/database.html#database.export_quantification_results',
                                                                                                        'findmycells/database.py'),
                                       'findmycells.database.Database.get_file_ids_to_process': ( 'api/database.html#database.get_file_ids_to_process',
                                                                                                  'findmycells/database.py'),
                                       'findmycells.database.Database.get_file_infos': ( 'api/database.html#database.get_file_infos',
                                                                                         'findmycells/database.py'),
+                                      'findmycells.database.Database.get_subset': ( 'api/database.html#database.get_subset',
+                                                                                    'findmycells/database.py'),
                                       'findmycells.database.Database.import_rois_dict': ( 'api/database.html#database.import_rois_dict',
                                                                                           'findmycells/database.py'),
+                                      'findmycells.database.Database.load_zstack': ( 'api/database.html#database.load_zstack',
+                                                                                     'findmycells/database.py'),
+                                      'findmycells.database.Database.merge_subset': ( 'api/database.html#database.merge_subset',
+                                                                                      'findmycells/database.py'),
+                                      'findmycells.database.Database.merge_subsets': ( 'api/database.html#database.merge_subsets',
+                                                                                       'findmycells/database.py'),
                                       'findmycells.database.Database.remove_file_id_from_project': ( 'api/database.html#database.remove_file_id_from_project',
                                                                                                      'findmycells/database.py'),
+                                      'findmycells.database.Database.save_zstack': ( 'api/database.html#database.save_zstack',
+                                                                                     'findmycells/database.py'),
                                       'findmycells.database.Database.update_file_infos': ( 'api/database.html#database.update_file_infos',
                                                                                            'findmycells/database.py'),
+                                      'findmycells.database.DatabaseStore': ('api/database.html#databasestore', 'findmycells/database.py'),
+                                      'findmycells.database.DatabaseStore.__init__': ( 'api/database.html#databasestore.__init__',
+                                                                                       'findmycells/database.py'),
+                                      'findmycells.database.DatabaseStore._connect': ( 'api/database.html#databasestore._connect',
+                                                                                       'findmycells/database.py'),
+                                      'findmycells.database.DatabaseStore._get_database_without_file_id_specific_attributes': ( 'api/database.html#databasestore._get_database_without_file_id_specific_attributes',
+                                                                                                                                'findmycells/database.py'),
+                                      'findmycells.database.DatabaseStore._get_file_histories_with_unsaved_changes': ( 'api/database.html#databasestore._get_file_histories_with_unsaved_changes',
+                                                                                                                       'findmycells/database.py'),
+                                      'findmycells.database.DatabaseStore._get_file_id_specific_records': ( 'api/database.html#databasestore._get_file_id_specific_records',
+                                                                                                            'findmycells/database.py'),
+                                      'findmycells.database.DatabaseStore._serialize': ( 'api/database.html#databasestore._serialize',
+                                                                                         'findmycells/database.py'),
+                                      'findmycells.database.DatabaseStore._split_file_infos': ( 'api/database.html#databasestore._split_file_infos',
+                                                                                                'findmycells/database.py'),
+                                      'findmycells.database.DatabaseStore.load': ( 'api/database.html#databasestore.load',
+                                                                                   'findmycells/database.py'),
+                                      'findmycells.database.DatabaseStore.load_file_history': ( 'api/database.html#databasestore.load_file_history',
+                                                                                                'findmycells/database.py'),
+                                      'findmycells.database.DatabaseStore.save': ( 'api/database.html#databasestore.save',
+                                                                                   'findmycells/database.py'),
+                                      'findmycells.database.DecodedDataCache': ( 'api/database.html#decodeddatacache',
+                                                                                 'findmycells/database.py'),
+                                      'findmycells.database.DecodedDataCache.__init__': ( 'api/database.html#decodeddatacache.__init__',
+                                                                                          'findmycells/database.py'),
+                                      'findmycells.database.DecodedDataCache._create_key': ( 'api/database.html#decodeddatacache._create_key',
+                                                                                             'findmycells/database.py'),
+                                      'findmycells.database.DecodedDataCache._get': ( 'api/database.html#decodeddatacache._get',
+                                                                                      'findmycells/database.py'),
+                                      'findmycells.database.DecodedDataCache._put': ( 'api/database.html#decodeddatacache._put',
+                                                                                      'findmycells/database.py'),
+                                      'findmycells.database.DecodedDataCache._spill_to_disk': ( 'api/database.html#decodeddatacache._spill_to_disk',
+                                                                                                'findmycells/database.py'),
+                                      'findmycells.database.DecodedDataCache.configure': ( 'api/database.html#decodeddatacache.configure',
+                                                                                           'findmycells/database.py'),
+                                      'findmycells.database.DecodedDataCache.get_or_load': ( 'api/database.html#decodeddatacache.get_or_load',
+                                                                                             'findmycells/database.py'),
+                                      'findmycells.database.DecodedDataCache.is_enabled': ( 'api/database.html#decodeddatacache.is_enabled',
+                                                                                            'findmycells/database.py'),
                                       'findmycells.database.FileHistory': ('api/database.html#filehistory', 'findmycells/database.py'),
                                       'findmycells.database.FileHistory.__init__': ( 'api/database.html#filehistory.__init__',
                                                                                      'findmycells/database.py'),
@@ -215,7 +315,78 @@ d = { 'settings': { 'branch': 'main',
                                       'findmycells.database.FileHistory.mark_processing_step_as_completed': ( 'api/database.html#filehistory.mark_processing_step_as_completed',
                                                                                                               'findmycells/database.py'),
                                       'findmycells.database.FileHistory.track_processing_strat': ( 'api/database.html#filehistory.track_processing_strat',
-                                                                                                   'findmycells/database.py')},
+                                                                                                   'findmycells/database.py'),
+                                      'findmycells.database.LazyFileHistories': ( 'api/database.html#lazyfilehistories',
+                                                                                  'findmycells/database.py'),
+                                      'findmycells.database.LazyFileHistories.__contains__': ( 'api/database.html#lazyfilehistories.__contains__',
+                                                                                               'findmycells/database.py'),
+                                      'findmycells.database.LazyFileHistories.__delitem__': ( 'api/database.html#lazyfilehistories.__delitem__',
+                                                                                              'findmycells/database.py'),
+                                      'findmycells.database.LazyFileHistories.__getitem__': ( 'api/database.html#lazyfilehistories.__getitem__',
+                                                                                              'findmycells/database.py'),
+                                      'findmycells.database.LazyFileHistories.__init__': ( 'api/database.html#lazyfilehistories.__init__',
+                                                                                           'findmycells/database.py'),
+                                      'findmycells.database.LazyFileHistories.__iter__': ( 'api/database.html#lazyfilehistories.__iter__',
+                                                                                           'findmycells/database.py'),
+                                      'findmycells.database.LazyFileHistories.__len__': ( 'api/database.html#lazyfilehistories.__len__',
+                                                                                          'findmycells/database.py'),
+                                      'findmycells.database.LazyFileHistories.__setitem__': ( 'api/database.html#lazyfilehistories.__setitem__',
+                                                                                              'findmycells/database.py'),
+                                      'findmycells.database.LazyFileHistories.is_loaded': ( 'api/database.html#lazyfilehistories.is_loaded',
+                                                                                            'findmycells/database.py'),
+                                      'findmycells.database.NPYZStackStore': ( 'api/database.html#npyzstackstore',
+                                                                               'findmycells/database.py'),
+                                      'findmycells.database.NPYZStackStore.contains': ( 'api/database.html#npyzstackstore.contains',
+                                                                                        'findmycells/database.py'),
+                                      'findmycells.database.NPYZStackStore.create': ( 'api/database.html#npyzstackstore.create',
+                                                                                      'findmycells/database.py'),
+                                      'findmycells.database.NPYZStackStore.get_filepaths': ( 'api/database.html#npyzstackstore.get_filepaths',
+                                                                                             'findmycells/database.py'),
+                                      'findmycells.database.NPYZStackStore.load': ( 'api/database.html#npyzstackstore.load',
+                                                                                    'findmycells/database.py'),
+                                      'findmycells.database.NPYZStackStore.save': ( 'api/database.html#npyzstackstore.save',
+                                                                                    'findmycells/database.py'),
+                                      'findmycells.database.NPYZStackStore.storage_format': ( 'api/database.html#npyzstackstore.storage_format',
+                                                                                              'findmycells/database.py'),
+                                      'findmycells.database.PNGPlanesZStackStore': ( 'api/database.html#pngplaneszstackstore',
+                                                                                     'findmycells/database.py'),
+                                      'findmycells.database.PNGPlanesZStackStore.contains': ( 'api/database.html#pngplaneszstackstore.contains',
+                                                                                              'findmycells/database.py'),
+                                      'findmycells.database.PNGPlanesZStackStore.get_filepaths': ( 'api/database.html#pngplaneszstackstore.get_filepaths',
+                                                                                                   'findmycells/database.py'),
+                                      'findmycells.database.PNGPlanesZStackStore.load': ( 'api/database.html#pngplaneszstackstore.load',
+                                                                                          'findmycells/database.py'),
+                                      'findmycells.database.PNGPlanesZStackStore.save': ( 'api/database.html#pngplaneszstackstore.save',
+                                                                                          'findmycells/database.py'),
+                                      'findmycells.database.PNGPlanesZStackStore.storage_format': ( 'api/database.html#pngplaneszstackstore.storage_format',
+                                                                                                    'findmycells/database.py'),
+                                      'findmycells.database.ZStackStore': ('api/database.html#zstackstore', 'findmycells/database.py'),
+                                      'findmycells.database.ZStackStore.contains': ( 'api/database.html#zstackstore.contains',
+                                                                                     'findmycells/database.py'),
+                                      'findmycells.database.ZStackStore.create': ( 'api/database.html#zstackstore.create',
+                                                                                   'findmycells/database.py'),
+                                      'findmycells.database.ZStackStore.get_filepaths': ( 'api/database.html#zstackstore.get_filepaths',
+                                                                                          'findmycells/database.py'),
+                                      'findmycells.database.ZStackStore.load': ( 'api/database.html#zstackstore.load',
+                                                                                 'findmycells/database.py'),
+                                      'findmycells.database.ZStackStore.save': ( 'api/database.html#zstackstore.save',
+                                                                                 'findmycells/database.py'),
+                                      'findmycells.database.ZStackStore.storage_format': ( 'api/database.html#zstackstore.storage_format',
+                                                                                           'findmycells/database.py'),
+                                      'findmycells.database.ZarrZStackStore': ( 'api/database.html#zarrzstackstore',
+                                                                                'findmycells/database.py'),
+                                      'findmycells.database.ZarrZStackStore.contains': ( 'api/database.html#zarrzstackstore.contains',
+                                                                                         'findmycells/database.py'),
+                                      'findmycells.database.ZarrZStackStore.create': ( 'api/database.html#zarrzstackstore.create',
+                                                                                       'findmycells/database.py'),
+                                      'findmycells.database.ZarrZStackStore.get_filepaths': ( 'api/database.html#zarrzstackstore.get_filepaths',
+                                                                                              'findmycells/database.py'),
+                                      'findmycells.database.ZarrZStackStore.load': ( 'api/database.html#zarrzstackstore.load',
+                                                                                     'findmycells/database.py'),
+                                      'findmycells.database.ZarrZStackStore.save': ( 'api/database.html#zarrzstackstore.save',
+                                                                                     'findmycells/database.py'),
+                                      'findmycells.database.ZarrZStackStore.storage_format': ( 'api/database.html#zarrzstackstore.storage_format',
+                                                                                               'findmycells/database.py')},
             'findmycells.inspection.methods': { 'findmycells.inspection.methods.InspectSinglePlane': ( 'api/inspection_00_methods.html#inspectsingleplane',
                                                                                                        'findmycells/inspection/methods.py'),
                                                 'findmycells.inspection.methods.InspectSinglePlane._convert_image_and_mask_to_correct_2d_format': ( 'api/inspection_00_methods.html#inspectsingleplane._convert_image_and_mask_to_correct_2d_format',
@@ -311,6 +482,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                                       'findmycells/interfaces.py'),
                                         'findmycells.interfaces.API._assert_reader_configs_are_present': ( 'api/interfaces.html#api._assert_reader_configs_are_present',
                                                                                                            'findmycells/interfaces.py'),
+                                        'findmycells.interfaces.API._assert_tiled_processing_is_supported': ( 'api/interfaces.html#api._assert_tiled_processing_is_supported',
+                                                                                                              'findmycells/interfaces.py'),
                                         'findmycells.interfaces.API._check_if_all_files_have_finished_current_processing_step': ( 'api/interfaces.html#api._check_if_all_files_have_finished_current_processing_step',
                                                                                                                                   'findmycells/interfaces.py'),
                                         'findmycells.interfaces.API._fill_processing_configs_with_defaults_where_needed': ( 'api/interfaces.html#api._fill_processing_configs_with_defaults_where_needed',
@@ -319,16 +492,30 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                           'findmycells/interfaces.py'),
                                         'findmycells.interfaces.API._load_object_from_filepath': ( 'api/interfaces.html#api._load_object_from_filepath',
                                                                                                    'findmycells/interfaces.py'),
+                                        'findmycells.interfaces.API._load_status_from_pickled_files': ( 'api/interfaces.html#api._load_status_from_pickled_files',
+                                                                                                        'findmycells/interfaces.py'),
                                         'findmycells.interfaces.API._look_for_latest_status_file_in_dir': ( 'api/interfaces.html#api._look_for_latest_status_file_in_dir',
                                                                                                             'findmycells/interfaces.py'),
-                                        'findmycells.interfaces.API._save_attr_to_disk': ( 'api/interfaces.html#api._save_attr_to_disk',
-                                                                                           'findmycells/interfaces.py'),
+                                        'findmycells.interfaces.API._postprocess_and_quantify_file': ( 'api/interfaces.html#api._postprocess_and_quantify_file',
+                                                                                                       'findmycells/interfaces.py'),
+                                        'findmycells.interfaces.API._postprocess_file': ( 'api/interfaces.html#api._postprocess_file',
+                                                                                          'findmycells/interfaces.py'),
+                                        'findmycells.interfaces.API._preprocess_file': ( 'api/interfaces.html#api._preprocess_file',
+                                                                                         'findmycells/interfaces.py'),
+                                        'findmycells.interfaces.API._process_files': ( 'api/interfaces.html#api._process_files',
+                                                                                       'findmycells/interfaces.py'),
+                                        'findmycells.interfaces.API._quantify_file': ( 'api/interfaces.html#api._quantify_file',
+                                                                                       'findmycells/interfaces.py'),
                                         'findmycells.interfaces.API._segment_running_strategies_consecutively': ( 'api/interfaces.html#api._segment_running_strategies_consecutively',
                                                                                                                   'findmycells/interfaces.py'),
                                         'findmycells.interfaces.API._segment_running_strategies_individually': ( 'api/interfaces.html#api._segment_running_strategies_individually',
                                                                                                                  'findmycells/interfaces.py'),
                                         'findmycells.interfaces.API._split_file_ids_into_batches': ( 'api/interfaces.html#api._split_file_ids_into_batches',
                                                                                                      'findmycells/interfaces.py'),
+                                        'findmycells.interfaces.API.disable_data_cache': ( 'api/interfaces.html#api.disable_data_cache',
+                                                                                           'findmycells/interfaces.py'),
+                                        'findmycells.interfaces.API.enable_data_cache': ( 'api/interfaces.html#api.enable_data_cache',
+                                                                                          'findmycells/interfaces.py'),
                                         'findmycells.interfaces.API.export_quantification_results': ( 'api/interfaces.html#api.export_quantification_results',
                                                                                                       'findmycells/interfaces.py'),
                                         'findmycells.interfaces.API.initialize_inspection': ( 'api/interfaces.html#api.initialize_inspection',
@@ -343,16 +530,31 @@ d = { 'settings': { 'branch': 'main',
                                                                                    'findmycells/interfaces.py'),
                                         'findmycells.interfaces.API.quantify': ( 'api/interfaces.html#api.quantify',
                                                                                  'findmycells/interfaces.py'),
+                                        'findmycells.interfaces.API.run_pipeline': ( 'api/interfaces.html#api.run_pipeline',
+                                                                                     'findmycells/interfaces.py'),
                                         'findmycells.interfaces.API.save_status': ( 'api/interfaces.html#api.save_status',
                                                                                     'findmycells/interfaces.py'),
                                         'findmycells.interfaces.API.segment': ( 'api/interfaces.html#api.segment',
                                                                                 'findmycells/interfaces.py'),
+                                        'findmycells.interfaces.API.set_intermediate_storage_format': ( 'api/interfaces.html#api.set_intermediate_storage_format',
+                                                                                                        'findmycells/interfaces.py'),
                                         'findmycells.interfaces.API.set_microscopy_reader_configs': ( 'api/interfaces.html#api.set_microscopy_reader_configs',
                                                                                                       'findmycells/interfaces.py'),
                                         'findmycells.interfaces.API.set_roi_reader_configs': ( 'api/interfaces.html#api.set_roi_reader_configs',
                                                                                                'findmycells/interfaces.py'),
                                         'findmycells.interfaces.API.update_database_with_current_source_files': ( 'api/interfaces.html#api.update_database_with_current_source_files',
                                                                                                                   'findmycells/interfaces.py'),
+                                        'findmycells.interfaces.Autosaver': ('api/interfaces.html#autosaver', 'findmycells/interfaces.py'),
+                                        'findmycells.interfaces.Autosaver.__enter__': ( 'api/interfaces.html#autosaver.__enter__',
+                                                                                        'findmycells/interfaces.py'),
+                                        'findmycells.interfaces.Autosaver.__exit__': ( 'api/interfaces.html#autosaver.__exit__',
+                                                                                       'findmycells/interfaces.py'),
+                                        'findmycells.interfaces.Autosaver.__init__': ( 'api/interfaces.html#autosaver.__init__',
+                                                                                       'findmycells/interfaces.py'),
+                                        'findmycells.interfaces.Autosaver.files_processed': ( 'api/interfaces.html#autosaver.files_processed',
+                                                                                              'findmycells/interfaces.py'),
+                                        'findmycells.interfaces.Autosaver.save': ( 'api/interfaces.html#autosaver.save',
+                                                                                   'findmycells/interfaces.py'),
                                         'findmycells.interfaces.GUI': ('api/interfaces.html#gui', 'findmycells/interfaces.py'),
                                         'findmycells.interfaces.GUI.__init__': ( 'api/interfaces.html#gui.__init__',
                                                                                  'findmycells/interfaces.py'),
@@ -540,6 +742,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                              'findmycells/postprocessing/specs.py'),
                                                   'findmycells.postprocessing.specs.PostprocessingObject.descriptions': ( 'api/postprocessing_00_specs.html#postprocessingobject.descriptions',
                                                                                                                           'findmycells/postprocessing/specs.py'),
+                                                  'findmycells.postprocessing.specs.PostprocessingObject.get_label_geometry_index': ( 'api/postprocessing_00_specs.html#postprocessingobject.get_label_geometry_index',
+                                                                                                                                      'findmycells/postprocessing/specs.py'),
                                                   'findmycells.postprocessing.specs.PostprocessingObject.load_segmentations_masks_for_postprocessing': ( 'api/postprocessing_00_specs.html#postprocessingobject.load_segmentations_masks_for_postprocessing',
                                                                                                                                                          'findmycells/postprocessing/specs.py'),
                                                   'findmycells.postprocessing.specs.PostprocessingObject.processing_type': ( 'api/postprocessing_00_specs.html#postprocessingobject.processing_type',
@@ -594,6 +798,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                                                          'findmycells/postprocessing/strategies.py'),
                                                        'findmycells.postprocessing.strategies.FillHolesStrat._fill_holes_in_all_planes_of_mask_stack': ( 'api/postprocessing_01_strategies.html#fillholesstrat._fill_holes_in_all_planes_of_mask_stack',
                                                                                                                                                          'findmycells/postprocessing/strategies.py'),
+                                                       'findmycells.postprocessing.strategies.FillHolesStrat._fill_holes_in_single_plane': ( 'api/postprocessing_01_strategies.html#fillholesstrat._fill_holes_in_single_plane',
+                                                                                                                                             'findmycells/postprocessing/strategies.py'),
                                                        'findmycells.postprocessing.strategies.FillHolesStrat.default_configs': ( 'api/postprocessing_01_strategies.html#fillholesstrat.default_configs',
                                                                                                                                  'findmycells/postprocessing/strategies.py'),
                                                        'findmycells.postprocessing.strategies.FillHolesStrat.descriptions': ( 'api/postprocessing_01_strategies.html#fillholesstrat.descriptions',
@@ -610,22 +816,32 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                                                 'findmycells/postprocessing/strategies.py'),
                                                        'findmycells.postprocessing.strategies.ReconstructCellsIn3DFrom2DInstanceLabelsStrat._add_strategy_specific_infos_to_updates': ( 'api/postprocessing_01_strategies.html#reconstructcellsin3dfrom2dinstancelabelsstrat._add_strategy_specific_infos_to_updates',
                                                                                                                                                                                         'findmycells/postprocessing/strategies.py'),
+                                                       'findmycells.postprocessing.strategies.ReconstructCellsIn3DFrom2DInstanceLabelsStrat._find_best_match': ( 'api/postprocessing_01_strategies.html#reconstructcellsin3dfrom2dinstancelabelsstrat._find_best_match',
+                                                                                                                                                                 'findmycells/postprocessing/strategies.py'),
                                                        'findmycells.postprocessing.strategies.ReconstructCellsIn3DFrom2DInstanceLabelsStrat._find_best_matches': ( 'api/postprocessing_01_strategies.html#reconstructcellsin3dfrom2dinstancelabelsstrat._find_best_matches',
                                                                                                                                                                    'findmycells/postprocessing/strategies.py'),
+                                                       'findmycells.postprocessing.strategies.ReconstructCellsIn3DFrom2DInstanceLabelsStrat._find_root': ( 'api/postprocessing_01_strategies.html#reconstructcellsin3dfrom2dinstancelabelsstrat._find_root',
+                                                                                                                                                           'findmycells/postprocessing/strategies.py'),
                                                        'findmycells.postprocessing.strategies.ReconstructCellsIn3DFrom2DInstanceLabelsStrat._get_final_id_assignments': ( 'api/postprocessing_01_strategies.html#reconstructcellsin3dfrom2dinstancelabelsstrat._get_final_id_assignments',
                                                                                                                                                                           'findmycells/postprocessing/strategies.py'),
+                                                       'findmycells.postprocessing.strategies.ReconstructCellsIn3DFrom2DInstanceLabelsStrat._get_label_ids_and_areas': ( 'api/postprocessing_01_strategies.html#reconstructcellsin3dfrom2dinstancelabelsstrat._get_label_ids_and_areas',
+                                                                                                                                                                         'findmycells/postprocessing/strategies.py'),
+                                                       'findmycells.postprocessing.strategies.ReconstructCellsIn3DFrom2DInstanceLabelsStrat._get_matches_in_adjacent_plane': ( 'api/postprocessing_01_strategies.html#reconstructcellsin3dfrom2dinstancelabelsstrat._get_matches_in_adjacent_plane',
+                                                                                                                                                                               'findmycells/postprocessing/strategies.py'),
+                                                       'findmycells.postprocessing.strategies.ReconstructCellsIn3DFrom2DInstanceLabelsStrat._get_matches_of_roi': ( 'api/postprocessing_01_strategies.html#reconstructcellsin3dfrom2dinstancelabelsstrat._get_matches_of_roi',
+                                                                                                                                                                    'findmycells/postprocessing/strategies.py'),
+                                                       'findmycells.postprocessing.strategies.ReconstructCellsIn3DFrom2DInstanceLabelsStrat._get_multi_matches_traceback': ( 'api/postprocessing_01_strategies.html#reconstructcellsin3dfrom2dinstancelabelsstrat._get_multi_matches_traceback',
+                                                                                                                                                                             'findmycells/postprocessing/strategies.py'),
+                                                       'findmycells.postprocessing.strategies.ReconstructCellsIn3DFrom2DInstanceLabelsStrat._get_overlapping_areas_of_adjacent_planes': ( 'api/postprocessing_01_strategies.html#reconstructcellsin3dfrom2dinstancelabelsstrat._get_overlapping_areas_of_adjacent_planes',
+                                                                                                                                                                                          'findmycells/postprocessing/strategies.py'),
                                                        'findmycells.postprocessing.strategies.ReconstructCellsIn3DFrom2DInstanceLabelsStrat._get_plane_to_plane_roi_matching_results': ( 'api/postprocessing_01_strategies.html#reconstructcellsin3dfrom2dinstancelabelsstrat._get_plane_to_plane_roi_matching_results',
                                                                                                                                                                                          'findmycells/postprocessing/strategies.py'),
-                                                       'findmycells.postprocessing.strategies.ReconstructCellsIn3DFrom2DInstanceLabelsStrat._roi_matching': ( 'api/postprocessing_01_strategies.html#reconstructcellsin3dfrom2dinstancelabelsstrat._roi_matching',
-                                                                                                                                                              'findmycells/postprocessing/strategies.py'),
                                                        'findmycells.postprocessing.strategies.ReconstructCellsIn3DFrom2DInstanceLabelsStrat._run_3d_instance_reconstruction': ( 'api/postprocessing_01_strategies.html#reconstructcellsin3dfrom2dinstancelabelsstrat._run_3d_instance_reconstruction',
                                                                                                                                                                                 'findmycells/postprocessing/strategies.py'),
                                                        'findmycells.postprocessing.strategies.ReconstructCellsIn3DFrom2DInstanceLabelsStrat._save_multimatches_traceback_to_database': ( 'api/postprocessing_01_strategies.html#reconstructcellsin3dfrom2dinstancelabelsstrat._save_multimatches_traceback_to_database',
                                                                                                                                                                                          'findmycells/postprocessing/strategies.py'),
                                                        'findmycells.postprocessing.strategies.ReconstructCellsIn3DFrom2DInstanceLabelsStrat._set_new_label_ids': ( 'api/postprocessing_01_strategies.html#reconstructcellsin3dfrom2dinstancelabelsstrat._set_new_label_ids',
                                                                                                                                                                    'findmycells/postprocessing/strategies.py'),
-                                                       'findmycells.postprocessing.strategies.ReconstructCellsIn3DFrom2DInstanceLabelsStrat._trace_matches': ( 'api/postprocessing_01_strategies.html#reconstructcellsin3dfrom2dinstancelabelsstrat._trace_matches',
-                                                                                                                                                               'findmycells/postprocessing/strategies.py'),
                                                        'findmycells.postprocessing.strategies.ReconstructCellsIn3DFrom2DInstanceLabelsStrat.default_configs': ( 'api/postprocessing_01_strategies.html#reconstructcellsin3dfrom2dinstancelabelsstrat.default_configs',
                                                                                                                                                                 'findmycells/postprocessing/strategies.py'),
                                                        'findmycells.postprocessing.strategies.ReconstructCellsIn3DFrom2DInstanceLabelsStrat.descriptions': ( 'api/postprocessing_01_strategies.html#reconstructcellsin3dfrom2dinstancelabelsstrat.descriptions',
@@ -642,24 +858,62 @@ d = { 'settings': { 'branch': 'main',
                                                                                                           'findmycells/preprocessing/specs.py'),
                                                  'findmycells.preprocessing.specs.PreprocessingObject._add_processing_specific_infos_to_updates': ( 'api/preprocessing_00_specs.html#preprocessingobject._add_processing_specific_infos_to_updates',
                                                                                                                                                     'findmycells/preprocessing/specs.py'),
+                                                 'findmycells.preprocessing.specs.PreprocessingObject._apply_lookup_tables_to_histograms': ( 'api/preprocessing_00_specs.html#preprocessingobject._apply_lookup_tables_to_histograms',
+                                                                                                                                             'findmycells/preprocessing/specs.py'),
+                                                 'findmycells.preprocessing.specs.PreprocessingObject._compile_lookup_tables': ( 'api/preprocessing_00_specs.html#preprocessingobject._compile_lookup_tables',
+                                                                                                                                 'findmycells/preprocessing/specs.py'),
+                                                 'findmycells.preprocessing.specs.PreprocessingObject._compile_processing_chain': ( 'api/preprocessing_00_specs.html#preprocessingobject._compile_processing_chain',
+                                                                                                                                    'findmycells/preprocessing/specs.py'),
+                                                 'findmycells.preprocessing.specs.PreprocessingObject._compute_histograms_of_plane': ( 'api/preprocessing_00_specs.html#preprocessingobject._compute_histograms_of_plane',
+                                                                                                                                       'findmycells/preprocessing/specs.py'),
+                                                 'findmycells.preprocessing.specs.PreprocessingObject._finish_plane_streaming': ( 'api/preprocessing_00_specs.html#preprocessingobject._finish_plane_streaming',
+                                                                                                                                  'findmycells/preprocessing/specs.py'),
+                                                 'findmycells.preprocessing.specs.PreprocessingObject._gather_streamed_planes': ( 'api/preprocessing_00_specs.html#preprocessingobject._gather_streamed_planes',
+                                                                                                                                  'findmycells/preprocessing/specs.py'),
+                                                 'findmycells.preprocessing.specs.PreprocessingObject._iterate_planes_mapped_by_lookup_tables': ( 'api/preprocessing_00_specs.html#preprocessingobject._iterate_planes_mapped_by_lookup_tables',
+                                                                                                                                                  'findmycells/preprocessing/specs.py'),
                                                  'findmycells.preprocessing.specs.PreprocessingObject._load_microscopy_image': ( 'api/preprocessing_00_specs.html#preprocessingobject._load_microscopy_image',
                                                                                                                                  'findmycells/preprocessing/specs.py'),
                                                  'findmycells.preprocessing.specs.PreprocessingObject._load_rois': ( 'api/preprocessing_00_specs.html#preprocessingobject._load_rois',
                                                                                                                      'findmycells/preprocessing/specs.py'),
+                                                 'findmycells.preprocessing.specs.PreprocessingObject._map_plane_by_lookup_tables': ( 'api/preprocessing_00_specs.html#preprocessingobject._map_plane_by_lookup_tables',
+                                                                                                                                      'findmycells/preprocessing/specs.py'),
+                                                 'findmycells.preprocessing.specs.PreprocessingObject._prepare_tiled_microscopy_image': ( 'api/preprocessing_00_specs.html#preprocessingobject._prepare_tiled_microscopy_image',
+                                                                                                                                          'findmycells/preprocessing/specs.py'),
                                                  'findmycells.preprocessing.specs.PreprocessingObject._processing_specific_preparations': ( 'api/preprocessing_00_specs.html#preprocessingobject._processing_specific_preparations',
                                                                                                                                             'findmycells/preprocessing/specs.py'),
+                                                 'findmycells.preprocessing.specs.PreprocessingObject._run_all_strategies_on_tiles': ( 'api/preprocessing_00_specs.html#preprocessingobject._run_all_strategies_on_tiles',
+                                                                                                                                       'findmycells/preprocessing/specs.py'),
+                                                 'findmycells.preprocessing.specs.PreprocessingObject._run_fused_pointwise_strategies': ( 'api/preprocessing_00_specs.html#preprocessingobject._run_fused_pointwise_strategies',
+                                                                                                                                          'findmycells/preprocessing/specs.py'),
+                                                 'findmycells.preprocessing.specs.PreprocessingObject._run_pointwise_strategies_on_tiles': ( 'api/preprocessing_00_specs.html#preprocessingobject._run_pointwise_strategies_on_tiles',
+                                                                                                                                             'findmycells/preprocessing/specs.py'),
+                                                 'findmycells.preprocessing.specs.PreprocessingObject._run_single_strategy': ( 'api/preprocessing_00_specs.html#preprocessingobject._run_single_strategy',
+                                                                                                                               'findmycells/preprocessing/specs.py'),
+                                                 'findmycells.preprocessing.specs.PreprocessingObject._save_preprocessed_tiles_on_disk': ( 'api/preprocessing_00_specs.html#preprocessingobject._save_preprocessed_tiles_on_disk',
+                                                                                                                                           'findmycells/preprocessing/specs.py'),
+                                                 'findmycells.preprocessing.specs.PreprocessingObject._save_streamed_planes_on_disk': ( 'api/preprocessing_00_specs.html#preprocessingobject._save_streamed_planes_on_disk',
+                                                                                                                                        'findmycells/preprocessing/specs.py'),
+                                                 'findmycells.preprocessing.specs.PreprocessingObject._write_streamed_planes': ( 'api/preprocessing_00_specs.html#preprocessingobject._write_streamed_planes',
+                                                                                                                                 'findmycells/preprocessing/specs.py'),
                                                  'findmycells.preprocessing.specs.PreprocessingObject.adjust_rois': ( 'api/preprocessing_00_specs.html#preprocessingobject.adjust_rois',
                                                                                                                       'findmycells/preprocessing/specs.py'),
                                                  'findmycells.preprocessing.specs.PreprocessingObject.crop_rgb_zstack': ( 'api/preprocessing_00_specs.html#preprocessingobject.crop_rgb_zstack',
                                                                                                                           'findmycells/preprocessing/specs.py'),
+                                                 'findmycells.preprocessing.specs.PreprocessingObject.crop_streamed_planes': ( 'api/preprocessing_00_specs.html#preprocessingobject.crop_streamed_planes',
+                                                                                                                               'findmycells/preprocessing/specs.py'),
                                                  'findmycells.preprocessing.specs.PreprocessingObject.default_configs': ( 'api/preprocessing_00_specs.html#preprocessingobject.default_configs',
                                                                                                                           'findmycells/preprocessing/specs.py'),
                                                  'findmycells.preprocessing.specs.PreprocessingObject.descriptions': ( 'api/preprocessing_00_specs.html#preprocessingobject.descriptions',
                                                                                                                        'findmycells/preprocessing/specs.py'),
+                                                 'findmycells.preprocessing.specs.PreprocessingObject.get_rows_and_cols_of_image': ( 'api/preprocessing_00_specs.html#preprocessingobject.get_rows_and_cols_of_image',
+                                                                                                                                     'findmycells/preprocessing/specs.py'),
                                                  'findmycells.preprocessing.specs.PreprocessingObject.load_image_and_rois': ( 'api/preprocessing_00_specs.html#preprocessingobject.load_image_and_rois',
                                                                                                                               'findmycells/preprocessing/specs.py'),
                                                  'findmycells.preprocessing.specs.PreprocessingObject.processing_type': ( 'api/preprocessing_00_specs.html#preprocessingobject.processing_type',
                                                                                                                           'findmycells/preprocessing/specs.py'),
+                                                 'findmycells.preprocessing.specs.PreprocessingObject.run_all_strategies': ( 'api/preprocessing_00_specs.html#preprocessingobject.run_all_strategies',
+                                                                                                                             'findmycells/preprocessing/specs.py'),
                                                  'findmycells.preprocessing.specs.PreprocessingObject.save_preprocessed_images_on_disk': ( 'api/preprocessing_00_specs.html#preprocessingobject.save_preprocessed_images_on_disk',
                                                                                                                                            'findmycells/preprocessing/specs.py'),
                                                  'findmycells.preprocessing.specs.PreprocessingObject.save_preprocessed_rois_in_database': ( 'api/preprocessing_00_specs.html#preprocessingobject.save_preprocessed_rois_in_database',
@@ -670,22 +924,72 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                        'findmycells/preprocessing/specs.py'),
                                                  'findmycells.preprocessing.specs.PreprocessingStrategy': ( 'api/preprocessing_00_specs.html#preprocessingstrategy',
                                                                                                             'findmycells/preprocessing/specs.py'),
+                                                 'findmycells.preprocessing.specs.PreprocessingStrategy.compute_lookup_tables': ( 'api/preprocessing_00_specs.html#preprocessingstrategy.compute_lookup_tables',
+                                                                                                                                  'findmycells/preprocessing/specs.py'),
+                                                 'findmycells.preprocessing.specs.PreprocessingStrategy.determine_reading_window': ( 'api/preprocessing_00_specs.html#preprocessingstrategy.determine_reading_window',
+                                                                                                                                     'findmycells/preprocessing/specs.py'),
+                                                 'findmycells.preprocessing.specs.PreprocessingStrategy.process_tiles': ( 'api/preprocessing_00_specs.html#preprocessingstrategy.process_tiles',
+                                                                                                                          'findmycells/preprocessing/specs.py'),
                                                  'findmycells.preprocessing.specs.PreprocessingStrategy.processing_type': ( 'api/preprocessing_00_specs.html#preprocessingstrategy.processing_type',
-                                                                                                                            'findmycells/preprocessing/specs.py')},
+                                                                                                                            'findmycells/preprocessing/specs.py'),
+                                                 'findmycells.preprocessing.specs.PreprocessingStrategy.stream_planes': ( 'api/preprocessing_00_specs.html#preprocessingstrategy.stream_planes',
+                                                                                                                          'findmycells/preprocessing/specs.py'),
+                                                 'findmycells.preprocessing.specs.PreprocessingStrategy.supports_plane_streaming': ( 'api/preprocessing_00_specs.html#preprocessingstrategy.supports_plane_streaming',
+                                                                                                                                     'findmycells/preprocessing/specs.py'),
+                                                 'findmycells.preprocessing.specs.PreprocessingStrategy.supports_tiled_processing': ( 'api/preprocessing_00_specs.html#preprocessingstrategy.supports_tiled_processing',
+                                                                                                                                      'findmycells/preprocessing/specs.py'),
+                                                 'findmycells.preprocessing.specs.TiledZStack': ( 'api/preprocessing_00_specs.html#tiledzstack',
+                                                                                                  'findmycells/preprocessing/specs.py'),
+                                                 'findmycells.preprocessing.specs.TiledZStack.__init__': ( 'api/preprocessing_00_specs.html#tiledzstack.__init__',
+                                                                                                           'findmycells/preprocessing/specs.py'),
+                                                 'findmycells.preprocessing.specs.TiledZStack.crop': ( 'api/preprocessing_00_specs.html#tiledzstack.crop',
+                                                                                                       'findmycells/preprocessing/specs.py'),
+                                                 'findmycells.preprocessing.specs.TiledZStack.get_tile_slices': ( 'api/preprocessing_00_specs.html#tiledzstack.get_tile_slices',
+                                                                                                                  'findmycells/preprocessing/specs.py'),
+                                                 'findmycells.preprocessing.specs.TiledZStack.iter_tiles': ( 'api/preprocessing_00_specs.html#tiledzstack.iter_tiles',
+                                                                                                             'findmycells/preprocessing/specs.py'),
+                                                 'findmycells.preprocessing.specs.TiledZStack.map_tiles': ( 'api/preprocessing_00_specs.html#tiledzstack.map_tiles',
+                                                                                                            'findmycells/preprocessing/specs.py')},
             'findmycells.preprocessing.strategies': { 'findmycells.preprocessing.strategies.AdjustBrightnessAndContrastStrat': ( 'api/preprocessing_01_strategies.html#adjustbrightnessandcontraststrat',
                                                                                                                                  'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.AdjustBrightnessAndContrastStrat._add_strategy_specific_infos_to_updates': ( 'api/preprocessing_01_strategies.html#adjustbrightnessandcontraststrat._add_strategy_specific_infos_to_updates',
                                                                                                                                                                          'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.AdjustBrightnessAndContrastStrat._adjust_brightness_and_contrast': ( 'api/preprocessing_01_strategies.html#adjustbrightnessandcontraststrat._adjust_brightness_and_contrast',
                                                                                                                                                                  'findmycells/preprocessing/strategies.py'),
+                                                      'findmycells.preprocessing.strategies.AdjustBrightnessAndContrastStrat._adjust_plane': ( 'api/preprocessing_01_strategies.html#adjustbrightnessandcontraststrat._adjust_plane',
+                                                                                                                                               'findmycells/preprocessing/strategies.py'),
+                                                      'findmycells.preprocessing.strategies.AdjustBrightnessAndContrastStrat._assert_valid_configs': ( 'api/preprocessing_01_strategies.html#adjustbrightnessandcontraststrat._assert_valid_configs',
+                                                                                                                                                       'findmycells/preprocessing/strategies.py'),
+                                                      'findmycells.preprocessing.strategies.AdjustBrightnessAndContrastStrat._compute_histogram': ( 'api/preprocessing_01_strategies.html#adjustbrightnessandcontraststrat._compute_histogram',
+                                                                                                                                                    'findmycells/preprocessing/strategies.py'),
+                                                      'findmycells.preprocessing.strategies.AdjustBrightnessAndContrastStrat._determine_in_range': ( 'api/preprocessing_01_strategies.html#adjustbrightnessandcontraststrat._determine_in_range',
+                                                                                                                                                     'findmycells/preprocessing/strategies.py'),
+                                                      'findmycells.preprocessing.strategies.AdjustBrightnessAndContrastStrat._get_in_range_from_histogram': ( 'api/preprocessing_01_strategies.html#adjustbrightnessandcontraststrat._get_in_range_from_histogram',
+                                                                                                                                                              'findmycells/preprocessing/strategies.py'),
+                                                      'findmycells.preprocessing.strategies.AdjustBrightnessAndContrastStrat._get_lookup_table': ( 'api/preprocessing_01_strategies.html#adjustbrightnessandcontraststrat._get_lookup_table',
+                                                                                                                                                   'findmycells/preprocessing/strategies.py'),
+                                                      'findmycells.preprocessing.strategies.AdjustBrightnessAndContrastStrat._get_percentile_from_cumulative_histogram': ( 'api/preprocessing_01_strategies.html#adjustbrightnessandcontraststrat._get_percentile_from_cumulative_histogram',
+                                                                                                                                                                           'findmycells/preprocessing/strategies.py'),
+                                                      'findmycells.preprocessing.strategies.AdjustBrightnessAndContrastStrat._get_writeable_array': ( 'api/preprocessing_01_strategies.html#adjustbrightnessandcontraststrat._get_writeable_array',
+                                                                                                                                                      'findmycells/preprocessing/strategies.py'),
+                                                      'findmycells.preprocessing.strategies.AdjustBrightnessAndContrastStrat._rescale_intensity_in_place': ( 'api/preprocessing_01_strategies.html#adjustbrightnessandcontraststrat._rescale_intensity_in_place',
+                                                                                                                                                             'findmycells/preprocessing/strategies.py'),
+                                                      'findmycells.preprocessing.strategies.AdjustBrightnessAndContrastStrat.compute_lookup_tables': ( 'api/preprocessing_01_strategies.html#adjustbrightnessandcontraststrat.compute_lookup_tables',
+                                                                                                                                                       'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.AdjustBrightnessAndContrastStrat.default_configs': ( 'api/preprocessing_01_strategies.html#adjustbrightnessandcontraststrat.default_configs',
                                                                                                                                                  'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.AdjustBrightnessAndContrastStrat.descriptions': ( 'api/preprocessing_01_strategies.html#adjustbrightnessandcontraststrat.descriptions',
                                                                                                                                               'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.AdjustBrightnessAndContrastStrat.dropdown_option_value_for_gui': ( 'api/preprocessing_01_strategies.html#adjustbrightnessandcontraststrat.dropdown_option_value_for_gui',
                                                                                                                                                                'findmycells/preprocessing/strategies.py'),
+                                                      'findmycells.preprocessing.strategies.AdjustBrightnessAndContrastStrat.processing_kind': ( 'api/preprocessing_01_strategies.html#adjustbrightnessandcontraststrat.processing_kind',
+                                                                                                                                                 'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.AdjustBrightnessAndContrastStrat.run': ( 'api/preprocessing_01_strategies.html#adjustbrightnessandcontraststrat.run',
                                                                                                                                      'findmycells/preprocessing/strategies.py'),
+                                                      'findmycells.preprocessing.strategies.AdjustBrightnessAndContrastStrat.stream_planes': ( 'api/preprocessing_01_strategies.html#adjustbrightnessandcontraststrat.stream_planes',
+                                                                                                                                               'findmycells/preprocessing/strategies.py'),
+                                                      'findmycells.preprocessing.strategies.AdjustBrightnessAndContrastStrat.supports_plane_streaming': ( 'api/preprocessing_01_strategies.html#adjustbrightnessandcontraststrat.supports_plane_streaming',
+                                                                                                                                                          'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.AdjustBrightnessAndContrastStrat.tooltips': ( 'api/preprocessing_01_strategies.html#adjustbrightnessandcontraststrat.tooltips',
                                                                                                                                           'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.AdjustBrightnessAndContrastStrat.widget_names': ( 'api/preprocessing_01_strategies.html#adjustbrightnessandcontraststrat.widget_names',
@@ -696,14 +1000,28 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                                                            'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.ConvertTo8BitStrat._convert_to_8bit': ( 'api/preprocessing_01_strategies.html#convertto8bitstrat._convert_to_8bit',
                                                                                                                                     'findmycells/preprocessing/strategies.py'),
+                                                      'findmycells.preprocessing.strategies.ConvertTo8BitStrat._determine_bit_depth': ( 'api/preprocessing_01_strategies.html#convertto8bitstrat._determine_bit_depth',
+                                                                                                                                        'findmycells/preprocessing/strategies.py'),
+                                                      'findmycells.preprocessing.strategies.ConvertTo8BitStrat._get_lookup_table': ( 'api/preprocessing_01_strategies.html#convertto8bitstrat._get_lookup_table',
+                                                                                                                                     'findmycells/preprocessing/strategies.py'),
+                                                      'findmycells.preprocessing.strategies.ConvertTo8BitStrat._rescale_to_8bit': ( 'api/preprocessing_01_strategies.html#convertto8bitstrat._rescale_to_8bit',
+                                                                                                                                    'findmycells/preprocessing/strategies.py'),
+                                                      'findmycells.preprocessing.strategies.ConvertTo8BitStrat.compute_lookup_tables': ( 'api/preprocessing_01_strategies.html#convertto8bitstrat.compute_lookup_tables',
+                                                                                                                                         'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.ConvertTo8BitStrat.default_configs': ( 'api/preprocessing_01_strategies.html#convertto8bitstrat.default_configs',
                                                                                                                                    'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.ConvertTo8BitStrat.descriptions': ( 'api/preprocessing_01_strategies.html#convertto8bitstrat.descriptions',
                                                                                                                                 'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.ConvertTo8BitStrat.dropdown_option_value_for_gui': ( 'api/preprocessing_01_strategies.html#convertto8bitstrat.dropdown_option_value_for_gui',
                                                                                                                                                  'findmycells/preprocessing/strategies.py'),
+                                                      'findmycells.preprocessing.strategies.ConvertTo8BitStrat.processing_kind': ( 'api/preprocessing_01_strategies.html#convertto8bitstrat.processing_kind',
+                                                                                                                                   'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.ConvertTo8BitStrat.run': ( 'api/preprocessing_01_strategies.html#convertto8bitstrat.run',
                                                                                                                        'findmycells/preprocessing/strategies.py'),
+                                                      'findmycells.preprocessing.strategies.ConvertTo8BitStrat.stream_planes': ( 'api/preprocessing_01_strategies.html#convertto8bitstrat.stream_planes',
+                                                                                                                                 'findmycells/preprocessing/strategies.py'),
+                                                      'findmycells.preprocessing.strategies.ConvertTo8BitStrat.supports_plane_streaming': ( 'api/preprocessing_01_strategies.html#convertto8bitstrat.supports_plane_streaming',
+                                                                                                                                            'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.ConvertTo8BitStrat.tooltips': ( 'api/preprocessing_01_strategies.html#convertto8bitstrat.tooltips',
                                                                                                                             'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.ConvertTo8BitStrat.widget_names': ( 'api/preprocessing_01_strategies.html#convertto8bitstrat.widget_names',
@@ -712,18 +1030,36 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                                'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.CropStitchingArtefactsRGBStrat._add_strategy_specific_infos_to_updates': ( 'api/preprocessing_01_strategies.html#cropstitchingartefactsrgbstrat._add_strategy_specific_infos_to_updates',
                                                                                                                                                                        'findmycells/preprocessing/strategies.py'),
+                                                      'findmycells.preprocessing.strategies.CropStitchingArtefactsRGBStrat._count_artefact_pixels_per_row_and_column': ( 'api/preprocessing_01_strategies.html#cropstitchingartefactsrgbstrat._count_artefact_pixels_per_row_and_column',
+                                                                                                                                                                         'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.CropStitchingArtefactsRGBStrat._determine_cropping_indices_for_entire_zstack': ( 'api/preprocessing_01_strategies.html#cropstitchingartefactsrgbstrat._determine_cropping_indices_for_entire_zstack',
                                                                                                                                                                              'findmycells/preprocessing/strategies.py'),
+                                                      'findmycells.preprocessing.strategies.CropStitchingArtefactsRGBStrat._determine_cropping_indices_from_tiles': ( 'api/preprocessing_01_strategies.html#cropstitchingartefactsrgbstrat._determine_cropping_indices_from_tiles',
+                                                                                                                                                                      'findmycells/preprocessing/strategies.py'),
+                                                      'findmycells.preprocessing.strategies.CropStitchingArtefactsRGBStrat._get_artefact_value': ( 'api/preprocessing_01_strategies.html#cropstitchingartefactsrgbstrat._get_artefact_value',
+                                                                                                                                                   'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.CropStitchingArtefactsRGBStrat._get_cropping_indices': ( 'api/preprocessing_01_strategies.html#cropstitchingartefactsrgbstrat._get_cropping_indices',
                                                                                                                                                      'findmycells/preprocessing/strategies.py'),
+                                                      'findmycells.preprocessing.strategies.CropStitchingArtefactsRGBStrat._get_cropping_indices_for_all_planes': ( 'api/preprocessing_01_strategies.html#cropstitchingartefactsrgbstrat._get_cropping_indices_for_all_planes',
+                                                                                                                                                                    'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.CropStitchingArtefactsRGBStrat.default_configs': ( 'api/preprocessing_01_strategies.html#cropstitchingartefactsrgbstrat.default_configs',
                                                                                                                                                'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.CropStitchingArtefactsRGBStrat.descriptions': ( 'api/preprocessing_01_strategies.html#cropstitchingartefactsrgbstrat.descriptions',
                                                                                                                                             'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.CropStitchingArtefactsRGBStrat.dropdown_option_value_for_gui': ( 'api/preprocessing_01_strategies.html#cropstitchingartefactsrgbstrat.dropdown_option_value_for_gui',
                                                                                                                                                              'findmycells/preprocessing/strategies.py'),
+                                                      'findmycells.preprocessing.strategies.CropStitchingArtefactsRGBStrat.process_tiles': ( 'api/preprocessing_01_strategies.html#cropstitchingartefactsrgbstrat.process_tiles',
+                                                                                                                                             'findmycells/preprocessing/strategies.py'),
+                                                      'findmycells.preprocessing.strategies.CropStitchingArtefactsRGBStrat.processing_kind': ( 'api/preprocessing_01_strategies.html#cropstitchingartefactsrgbstrat.processing_kind',
+                                                                                                                                               'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.CropStitchingArtefactsRGBStrat.run': ( 'api/preprocessing_01_strategies.html#cropstitchingartefactsrgbstrat.run',
                                                                                                                                    'findmycells/preprocessing/strategies.py'),
+                                                      'findmycells.preprocessing.strategies.CropStitchingArtefactsRGBStrat.stream_planes': ( 'api/preprocessing_01_strategies.html#cropstitchingartefactsrgbstrat.stream_planes',
+                                                                                                                                             'findmycells/preprocessing/strategies.py'),
+                                                      'findmycells.preprocessing.strategies.CropStitchingArtefactsRGBStrat.supports_plane_streaming': ( 'api/preprocessing_01_strategies.html#cropstitchingartefactsrgbstrat.supports_plane_streaming',
+                                                                                                                                                        'findmycells/preprocessing/strategies.py'),
+                                                      'findmycells.preprocessing.strategies.CropStitchingArtefactsRGBStrat.supports_tiled_processing': ( 'api/preprocessing_01_strategies.html#cropstitchingartefactsrgbstrat.supports_tiled_processing',
+                                                                                                                                                         'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.CropStitchingArtefactsRGBStrat.tooltips': ( 'api/preprocessing_01_strategies.html#cropstitchingartefactsrgbstrat.tooltips',
                                                                                                                                         'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.CropStitchingArtefactsRGBStrat.widget_names': ( 'api/preprocessing_01_strategies.html#cropstitchingartefactsrgbstrat.widget_names',
@@ -734,14 +1070,28 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                                                                    'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.CropToROIsBoundingBoxStrat._determine_bounding_box': ( 'api/preprocessing_01_strategies.html#croptoroisboundingboxstrat._determine_bounding_box',
                                                                                                                                                    'findmycells/preprocessing/strategies.py'),
+                                                      'findmycells.preprocessing.strategies.CropToROIsBoundingBoxStrat._get_cropping_indices_from_rois': ( 'api/preprocessing_01_strategies.html#croptoroisboundingboxstrat._get_cropping_indices_from_rois',
+                                                                                                                                                           'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.CropToROIsBoundingBoxStrat.default_configs': ( 'api/preprocessing_01_strategies.html#croptoroisboundingboxstrat.default_configs',
                                                                                                                                            'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.CropToROIsBoundingBoxStrat.descriptions': ( 'api/preprocessing_01_strategies.html#croptoroisboundingboxstrat.descriptions',
                                                                                                                                         'findmycells/preprocessing/strategies.py'),
+                                                      'findmycells.preprocessing.strategies.CropToROIsBoundingBoxStrat.determine_reading_window': ( 'api/preprocessing_01_strategies.html#croptoroisboundingboxstrat.determine_reading_window',
+                                                                                                                                                    'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.CropToROIsBoundingBoxStrat.dropdown_option_value_for_gui': ( 'api/preprocessing_01_strategies.html#croptoroisboundingboxstrat.dropdown_option_value_for_gui',
                                                                                                                                                          'findmycells/preprocessing/strategies.py'),
+                                                      'findmycells.preprocessing.strategies.CropToROIsBoundingBoxStrat.process_tiles': ( 'api/preprocessing_01_strategies.html#croptoroisboundingboxstrat.process_tiles',
+                                                                                                                                         'findmycells/preprocessing/strategies.py'),
+                                                      'findmycells.preprocessing.strategies.CropToROIsBoundingBoxStrat.processing_kind': ( 'api/preprocessing_01_strategies.html#croptoroisboundingboxstrat.processing_kind',
+                                                                                                                                           'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.CropToROIsBoundingBoxStrat.run': ( 'api/preprocessing_01_strategies.html#croptoroisboundingboxstrat.run',
                                                                                                                                'findmycells/preprocessing/strategies.py'),
+                                                      'findmycells.preprocessing.strategies.CropToROIsBoundingBoxStrat.stream_planes': ( 'api/preprocessing_01_strategies.html#croptoroisboundingboxstrat.stream_planes',
+                                                                                                                                         'findmycells/preprocessing/strategies.py'),
+                                                      'findmycells.preprocessing.strategies.CropToROIsBoundingBoxStrat.supports_plane_streaming': ( 'api/preprocessing_01_strategies.html#croptoroisboundingboxstrat.supports_plane_streaming',
+                                                                                                                                                    'findmycells/preprocessing/strategies.py'),
+                                                      'findmycells.preprocessing.strategies.CropToROIsBoundingBoxStrat.supports_tiled_processing': ( 'api/preprocessing_01_strategies.html#croptoroisboundingboxstrat.supports_tiled_processing',
+                                                                                                                                                     'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.CropToROIsBoundingBoxStrat.tooltips': ( 'api/preprocessing_01_strategies.html#croptoroisboundingboxstrat.tooltips',
                                                                                                                                     'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.CropToROIsBoundingBoxStrat.widget_names': ( 'api/preprocessing_01_strategies.html#croptoroisboundingboxstrat.widget_names',
@@ -760,8 +1110,18 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                                              'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.MaximumIntensityProjectionStrat.dropdown_option_value_for_gui': ( 'api/preprocessing_01_strategies.html#maximumintensityprojectionstrat.dropdown_option_value_for_gui',
                                                                                                                                                               'findmycells/preprocessing/strategies.py'),
+                                                      'findmycells.preprocessing.strategies.MaximumIntensityProjectionStrat.process_tiles': ( 'api/preprocessing_01_strategies.html#maximumintensityprojectionstrat.process_tiles',
+                                                                                                                                              'findmycells/preprocessing/strategies.py'),
+                                                      'findmycells.preprocessing.strategies.MaximumIntensityProjectionStrat.processing_kind': ( 'api/preprocessing_01_strategies.html#maximumintensityprojectionstrat.processing_kind',
+                                                                                                                                                'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.MaximumIntensityProjectionStrat.run': ( 'api/preprocessing_01_strategies.html#maximumintensityprojectionstrat.run',
                                                                                                                                     'findmycells/preprocessing/strategies.py'),
+                                                      'findmycells.preprocessing.strategies.MaximumIntensityProjectionStrat.stream_planes': ( 'api/preprocessing_01_strategies.html#maximumintensityprojectionstrat.stream_planes',
+                                                                                                                                              'findmycells/preprocessing/strategies.py'),
+                                                      'findmycells.preprocessing.strategies.MaximumIntensityProjectionStrat.supports_plane_streaming': ( 'api/preprocessing_01_strategies.html#maximumintensityprojectionstrat.supports_plane_streaming',
+                                                                                                                                                         'findmycells/preprocessing/strategies.py'),
+                                                      'findmycells.preprocessing.strategies.MaximumIntensityProjectionStrat.supports_tiled_processing': ( 'api/preprocessing_01_strategies.html#maximumintensityprojectionstrat.supports_tiled_processing',
+                                                                                                                                                          'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.MaximumIntensityProjectionStrat.tooltips': ( 'api/preprocessing_01_strategies.html#maximumintensityprojectionstrat.tooltips',
                                                                                                                                          'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.MaximumIntensityProjectionStrat.widget_names': ( 'api/preprocessing_01_strategies.html#maximumintensityprojectionstrat.widget_names',
@@ -780,8 +1140,18 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                                              'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.MinimumIntensityProjectionStrat.dropdown_option_value_for_gui': ( 'api/preprocessing_01_strategies.html#minimumintensityprojectionstrat.dropdown_option_value_for_gui',
                                                                                                                                                               'findmycells/preprocessing/strategies.py'),
+                                                      'findmycells.preprocessing.strategies.MinimumIntensityProjectionStrat.process_tiles': ( 'api/preprocessing_01_strategies.html#minimumintensityprojectionstrat.process_tiles',
+                                                                                                                                              'findmycells/preprocessing/strategies.py'),
+                                                      'findmycells.preprocessing.strategies.MinimumIntensityProjectionStrat.processing_kind': ( 'api/preprocessing_01_strategies.html#minimumintensityprojectionstrat.processing_kind',
+                                                                                                                                                'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.MinimumIntensityProjectionStrat.run': ( 'api/preprocessing_01_strategies.html#minimumintensityprojectionstrat.run',
                                                                                                                                     'findmycells/preprocessing/strategies.py'),
+                                                      'findmycells.preprocessing.strategies.MinimumIntensityProjectionStrat.stream_planes': ( 'api/preprocessing_01_strategies.html#minimumintensityprojectionstrat.stream_planes',
+                                                                                                                                              'findmycells/preprocessing/strategies.py'),
+                                                      'findmycells.preprocessing.strategies.MinimumIntensityProjectionStrat.supports_plane_streaming': ( 'api/preprocessing_01_strategies.html#minimumintensityprojectionstrat.supports_plane_streaming',
+                                                                                                                                                         'findmycells/preprocessing/strategies.py'),
+                                                      'findmycells.preprocessing.strategies.MinimumIntensityProjectionStrat.supports_tiled_processing': ( 'api/preprocessing_01_strategies.html#minimumintensityprojectionstrat.supports_tiled_processing',
+                                                                                                                                                          'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.MinimumIntensityProjectionStrat.tooltips': ( 'api/preprocessing_01_strategies.html#minimumintensityprojectionstrat.tooltips',
                                                                                                                                          'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.MinimumIntensityProjectionStrat.widget_names': ( 'api/preprocessing_01_strategies.html#minimumintensityprojectionstrat.widget_names',
@@ -844,14 +1214,36 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                                                    'findmycells/quantification/strategies.py')},
             'findmycells.readers.microscopy_images': { 'findmycells.readers.microscopy_images.CZIReader': ( 'api/readers_01_microscopy_images.html#czireader',
                                                                                                             'findmycells/readers/microscopy_images.py'),
+                                                       'findmycells.readers.microscopy_images.CZIReader._get_selected_ranges': ( 'api/readers_01_microscopy_images.html#czireader._get_selected_ranges',
+                                                                                                                                 'findmycells/readers/microscopy_images.py'),
+                                                       'findmycells.readers.microscopy_images.CZIReader._get_selection': ( 'api/readers_01_microscopy_images.html#czireader._get_selection',
+                                                                                                                           'findmycells/readers/microscopy_images.py'),
+                                                       'findmycells.readers.microscopy_images.CZIReader._read_selected_subblocks': ( 'api/readers_01_microscopy_images.html#czireader._read_selected_subblocks',
+                                                                                                                                     'findmycells/readers/microscopy_images.py'),
+                                                       'findmycells.readers.microscopy_images.CZIReader.iter_planes': ( 'api/readers_01_microscopy_images.html#czireader.iter_planes',
+                                                                                                                        'findmycells/readers/microscopy_images.py'),
                                                        'findmycells.readers.microscopy_images.CZIReader.read': ( 'api/readers_01_microscopy_images.html#czireader.read',
                                                                                                                  'findmycells/readers/microscopy_images.py'),
+                                                       'findmycells.readers.microscopy_images.CZIReader.read_shape': ( 'api/readers_01_microscopy_images.html#czireader.read_shape',
+                                                                                                                       'findmycells/readers/microscopy_images.py'),
                                                        'findmycells.readers.microscopy_images.CZIReader.readable_filetype_extensions': ( 'api/readers_01_microscopy_images.html#czireader.readable_filetype_extensions',
                                                                                                                                          'findmycells/readers/microscopy_images.py'),
                                                        'findmycells.readers.microscopy_images.FromExcelReader': ( 'api/readers_01_microscopy_images.html#fromexcelreader',
                                                                                                                   'findmycells/readers/microscopy_images.py'),
+                                                       'findmycells.readers.microscopy_images.FromExcelReader._get_plane_reader_configs': ( 'api/readers_01_microscopy_images.html#fromexcelreader._get_plane_reader_configs',
+                                                                                                                                            'findmycells/readers/microscopy_images.py'),
+                                                       'findmycells.readers.microscopy_images.FromExcelReader._get_readers_per_extension': ( 'api/readers_01_microscopy_images.html#fromexcelreader._get_readers_per_extension',
+                                                                                                                                             'findmycells/readers/microscopy_images.py'),
+                                                       'findmycells.readers.microscopy_images.FromExcelReader._get_selected_plane_filepaths': ( 'api/readers_01_microscopy_images.html#fromexcelreader._get_selected_plane_filepaths',
+                                                                                                                                                'findmycells/readers/microscopy_images.py'),
+                                                       'findmycells.readers.microscopy_images.FromExcelReader._load_plane_image': ( 'api/readers_01_microscopy_images.html#fromexcelreader._load_plane_image',
+                                                                                                                                    'findmycells/readers/microscopy_images.py'),
+                                                       'findmycells.readers.microscopy_images.FromExcelReader.iter_planes': ( 'api/readers_01_microscopy_images.html#fromexcelreader.iter_planes',
+                                                                                                                              'findmycells/readers/microscopy_images.py'),
                                                        'findmycells.readers.microscopy_images.FromExcelReader.read': ( 'api/readers_01_microscopy_images.html#fromexcelreader.read',
                                                                                                                        'findmycells/readers/microscopy_images.py'),
+                                                       'findmycells.readers.microscopy_images.FromExcelReader.read_shape': ( 'api/readers_01_microscopy_images.html#fromexcelreader.read_shape',
+                                                                                                                             'findmycells/readers/microscopy_images.py'),
                                                        'findmycells.readers.microscopy_images.FromExcelReader.readable_filetype_extensions': ( 'api/readers_01_microscopy_images.html#fromexcelreader.readable_filetype_extensions',
                                                                                                                                                'findmycells/readers/microscopy_images.py'),
                                                        'findmycells.readers.microscopy_images.MicroscopyImageReaders': ( 'api/readers_01_microscopy_images.html#microscopyimagereaders',
@@ -860,8 +1252,14 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                                                   'findmycells/readers/microscopy_images.py'),
                                                        'findmycells.readers.microscopy_images.MicroscopyImageReaders._get_plane_idx_slice': ( 'api/readers_01_microscopy_images.html#microscopyimagereaders._get_plane_idx_slice',
                                                                                                                                               'findmycells/readers/microscopy_images.py'),
+                                                       'findmycells.readers.microscopy_images.MicroscopyImageReaders._get_spatial_window_slices': ( 'api/readers_01_microscopy_images.html#microscopyimagereaders._get_spatial_window_slices',
+                                                                                                                                                    'findmycells/readers/microscopy_images.py'),
                                                        'findmycells.readers.microscopy_images.MicroscopyImageReaders.assert_correct_output_format': ( 'api/readers_01_microscopy_images.html#microscopyimagereaders.assert_correct_output_format',
                                                                                                                                                       'findmycells/readers/microscopy_images.py'),
+                                                       'findmycells.readers.microscopy_images.MicroscopyImageReaders.iter_planes': ( 'api/readers_01_microscopy_images.html#microscopyimagereaders.iter_planes',
+                                                                                                                                     'findmycells/readers/microscopy_images.py'),
+                                                       'findmycells.readers.microscopy_images.MicroscopyImageReaders.read_shape': ( 'api/readers_01_microscopy_images.html#microscopyimagereaders.read_shape',
+                                                                                                                                    'findmycells/readers/microscopy_images.py'),
                                                        'findmycells.readers.microscopy_images.RegularImageFiletypeReader': ( 'api/readers_01_microscopy_images.html#regularimagefiletypereader',
                                                                                                                              'findmycells/readers/microscopy_images.py'),
                                                        'findmycells.readers.microscopy_images.RegularImageFiletypeReader._attempt_to_load_image_at_correct_format': ( 'api/readers_01_microscopy_images.html#regularimagefiletypereader._attempt_to_load_image_at_correct_format',
@@ -869,7 +1267,25 @@ d = { 'settings': { 'branch': 'main',
                                                        'findmycells.readers.microscopy_images.RegularImageFiletypeReader.read': ( 'api/readers_01_microscopy_images.html#regularimagefiletypereader.read',
                                                                                                                                   'findmycells/readers/microscopy_images.py'),
                                                        'findmycells.readers.microscopy_images.RegularImageFiletypeReader.readable_filetype_extensions': ( 'api/readers_01_microscopy_images.html#regularimagefiletypereader.readable_filetype_extensions',
-                                                                                                                                                          'findmycells/readers/microscopy_images.py')},
+                                                                                                                                                          'findmycells/readers/microscopy_images.py'),
+                                                       'findmycells.readers.microscopy_images.TiffStackReader': ( 'api/readers_01_microscopy_images.html#tiffstackreader',
+                                                                                                                  'findmycells/readers/microscopy_images.py'),
+                                                       'findmycells.readers.microscopy_images.TiffStackReader._get_selection': ( 'api/readers_01_microscopy_images.html#tiffstackreader._get_selection',
+                                                                                                                                 'findmycells/readers/microscopy_images.py'),
+                                                       'findmycells.readers.microscopy_images.TiffStackReader._get_standardized_axes': ( 'api/readers_01_microscopy_images.html#tiffstackreader._get_standardized_axes',
+                                                                                                                                         'findmycells/readers/microscopy_images.py'),
+                                                       'findmycells.readers.microscopy_images.TiffStackReader._open_image_data': ( 'api/readers_01_microscopy_images.html#tiffstackreader._open_image_data',
+                                                                                                                                   'findmycells/readers/microscopy_images.py'),
+                                                       'findmycells.readers.microscopy_images.TiffStackReader._read_selection': ( 'api/readers_01_microscopy_images.html#tiffstackreader._read_selection',
+                                                                                                                                  'findmycells/readers/microscopy_images.py'),
+                                                       'findmycells.readers.microscopy_images.TiffStackReader.iter_planes': ( 'api/readers_01_microscopy_images.html#tiffstackreader.iter_planes',
+                                                                                                                              'findmycells/readers/microscopy_images.py'),
+                                                       'findmycells.readers.microscopy_images.TiffStackReader.read': ( 'api/readers_01_microscopy_images.html#tiffstackreader.read',
+                                                                                                                       'findmycells/readers/microscopy_images.py'),
+                                                       'findmycells.readers.microscopy_images.TiffStackReader.read_shape': ( 'api/readers_01_microscopy_images.html#tiffstackreader.read_shape',
+                                                                                                                             'findmycells/readers/microscopy_images.py'),
+                                                       'findmycells.readers.microscopy_images.TiffStackReader.readable_filetype_extensions': ( 'api/readers_01_microscopy_images.html#tiffstackreader.readable_filetype_extensions',
+                                                                                                                                               'findmycells/readers/microscopy_images.py')},
             'findmycells.readers.rois': { 'findmycells.readers.rois.ImageJROIReader': ( 'api/readers_02_rois.html#imagejroireader',
                                                                                         'findmycells/readers/rois.py'),
                                           'findmycells.readers.rois.ImageJROIReader.read': ( 'api/readers_02_rois.html#imagejroireader.read',
@@ -962,6 +1378,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                                                                                'findmycells/segmentation/strategies.py'),
                                                      'findmycells.segmentation.strategies.Deepflash2SemanticSegmentationStrat._delete_temp_files_in_sys_tmp_dir': ( 'api/segmentation_01_strategies.html#deepflash2semanticsegmentationstrat._delete_temp_files_in_sys_tmp_dir',
                                                                                                                                                                     'findmycells/segmentation/strategies.py'),
+                                                     'findmycells.segmentation.strategies.Deepflash2SemanticSegmentationStrat._export_preprocessed_image_as_png_planes': ( 'api/segmentation_01_strategies.html#deepflash2semanticsegmentationstrat._export_preprocessed_image_as_png_planes',
+                                                                                                                                                                           'findmycells/segmentation/strategies.py'),
                                                      'findmycells.segmentation.strategies.Deepflash2SemanticSegmentationStrat._move_files': ( 'api/segmentation_01_strategies.html#deepflash2semanticsegmentationstrat._move_files',
                                                                                                                                               'findmycells/segmentation/strategies.py'),
                                                      'findmycells.segmentation.strategies.Deepflash2SemanticSegmentationStrat._run_semantic_segmentations': ( 'api/segmentation_01_strategies.html#deepflash2semanticsegmentationstrat._run_semantic_segmentations',
@@ -1016,12 +1434,25 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                                                                   'findmycells/segmentation/strategies.py'),
                                                      'findmycells.segmentation.strategies.LosslessConversionOfDF2SemanticSegToInstanceSegWithCPStrat.widget_names': ( 'api/segmentation_01_strategies.html#losslessconversionofdf2semanticsegtoinstancesegwithcpstrat.widget_names',
                                                                                                                                                                       'findmycells/segmentation/strategies.py')},
-            'findmycells.utils': { 'findmycells.utils.download_sample_data': ( 'api/utils.html#download_sample_data',
+            'findmycells.utils': { 'findmycells.utils.LabelGeometryIndex': ('api/utils.html#labelgeometryindex', 'findmycells/utils.py'),
+                                   'findmycells.utils.LabelGeometryIndex.__init__': ( 'api/utils.html#labelgeometryindex.__init__',
+                                                                                      'findmycells/utils.py'),
+                                   'findmycells.utils.LabelGeometryIndex.get_bounding_boxes': ( 'api/utils.html#labelgeometryindex.get_bounding_boxes',
+                                                                                                'findmycells/utils.py'),
+                                   'findmycells.utils.LabelGeometryIndex.get_plane_indices_with_label_id': ( 'api/utils.html#labelgeometryindex.get_plane_indices_with_label_id',
+                                                                                                             'findmycells/utils.py'),
+                                   'findmycells.utils.LabelGeometryIndex.get_polygon': ( 'api/utils.html#labelgeometryindex.get_polygon',
+                                                                                         'findmycells/utils.py'),
+                                   'findmycells.utils.LabelGeometryIndex.reset': ( 'api/utils.html#labelgeometryindex.reset',
+                                                                                   'findmycells/utils.py'),
+                                   'findmycells.utils.download_sample_data': ( 'api/utils.html#download_sample_data',
                                                                                'findmycells/utils.py'),
                                    'findmycells.utils.get_polygon_from_instance_segmentation': ( 'api/utils.html#get_polygon_from_instance_segmentation',
                                                                                                  'findmycells/utils.py'),
+                                   'findmycells.utils.get_row_chunks': ('api/utils.html#get_row_chunks', 'findmycells/utils.py'),
                                    'findmycells.utils.list_dir_no_hidden': ('api/utils.html#list_dir_no_hidden', 'findmycells/utils.py'),
                                    'findmycells.utils.load_zstack_as_array_from_single_planes': ( 'api/utils.html#load_zstack_as_array_from_single_planes',
                                                                                                   'findmycells/utils.py'),
+                                   'findmycells.utils.remap_label_ids': ('api/utils.html#remap_label_ids', 'findmycells/utils.py'),
                                    'findmycells.utils.unpad_x_y_dims_in_3d_array': ( 'api/utils.html#unpad_x_y_dims_in_3d_array',
                                                                                      'findmycells/utils.py')}}}
@@ -1,7 +1,7 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/api/00_configs.ipynb.
 
 # %% auto 0
-__all__ = ['ProjectConfigs', 'DefaultConfigs', 'GUIConfigs']
+__all__ = ['registry', 'ProjectConfigs', 'DefaultConfigs', 'GUIConfigs', 'Registry']
 
 # %% ../nbs/api/00_configs.ipynb 2
 from pathlib import Path, PosixPath, WindowsPath
@@ -12,6 +12,9 @@ from ipyfilechooser import FileChooser
 import os
 import inspect
 import pickle
+import warnings
+from types import ModuleType
+from importlib.metadata import entry_points
 from datetime import datetime
 
 import findmycells
@@ -29,72 +32,56 @@ class ProjectConfigs:
         assert type(root_dir) in [PosixPath, WindowsPath], '"root_dir" must be pathlib.Path referring to an existing directory.'
         assert root_dir.is_dir(), '"root_dir" must be pathlib.Path referring to an existing directory.'
         self.root_dir = root_dir
-        self.load_available_processing_modules()
-        self._load_available_strategies_and_objects()
-        self._load_available_data_readers_and_their_default_configs()
-        self._load_available_inspection_methods()
-            
-    
-    def load_available_processing_modules(self) -> None:
-        """
-        Screens the findmycells package for all available processing modules. 
-        Processing modules will be recognized if it contain a "specs" and a "strategies" 
-        submodule. For developers who would like to add a new processing module, 
-        please check out one of the implemented ones (e.g. findmycells.preprocessing) 
-        to see how this can be done. The list of detected processing modules will be used 
-        for instance by the `GUI` to automatically create a `ProcessingStepPage` in the 
-        GUI for each available processing module. When adding new processing modules, 
-        developers also have to add them to the '_expected_processing_step_modules' 
-        property of the GUI class in findmycells.interfaces.
-        """
-        available_processing_modules = {}
-        for module_name, module in inspect.getmembers(findmycells, inspect.ismodule):
-            if hasattr(module, 'specs') & hasattr(module, 'strategies'):
-                available_processing_modules[module_name] = module
-        setattr(self, 'available_processing_modules', available_processing_modules)
+        self.intermediate_storage_format = 'npy'
         
         
-    def _load_available_inspection_methods(self) -> None:
-        available_inspection_methods = []
-        for class_name, obj in inspect.getmembers(findmycells.inspection.methods, inspect.isclass):
-            if (class_name.startswith('Inspect') == True) & (class_name.startswith('Inspection') == False):
-                available_inspection_methods.append(obj)
-        setattr(self, 'available_inspection_methods', available_inspection_methods)
-
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        # projects created with previous versions stored the screened modules, classes & readers as attributes:
+        for attribute_name in ['available_processing_modules', 'available_processing_objects', 'available_processing_strategies',
+                               'available_data_readers', 'data_reader_default_configs', 'available_inspection_methods']:
+            state.pop(attribute_name, None)
+        self.__dict__.update(state)
+        
     
-    def _load_available_data_readers_and_their_default_configs(self) -> None:
-        available_data_readers = {}
-        data_reader_default_configs = {}
-        for reader_specs_class_name, reader_specs_class in inspect.getmembers(findmycells.readers.specs, inspect.isclass):
-            if reader_specs_class_name.endswith('Specs'):
-                reader_specs = reader_specs_class()
-                available_data_readers[reader_specs.reader_type] = reader_specs_class
-                data_reader_default_configs[reader_specs.reader_type] = reader_specs.default_configs
-        setattr(self, 'available_data_readers', available_data_readers)
-        setattr(self, 'data_reader_default_configs', data_reader_default_configs)
+    @property
+    def available_processing_modules(self) -> Dict[str, ModuleType]:
+        return registry.processing_modules
+    
+    @property
+    def available_processing_objects(self) -> Dict[str, type]:
+        return registry.processing_objects
+    
+    @property
+    def available_processing_strategies(self) -> Dict[str, List[type]]:
+        return registry.processing_strategies
+    
+    @property
+    def available_data_readers(self) -> Dict[str, type]:
+        return registry.data_reader_specs
+    
+    @property
+    def data_reader_default_configs(self) -> Dict[str, 'DefaultConfigs']:
+        return registry.data_reader_default_configs
     
+    @property
+    def available_inspection_methods(self) -> List[type]:
+        return registry.inspection_methods
+            
     
-    def _load_available_strategies_and_objects(self) -> None:
+    def load_available_processing_modules(self) -> None:
         """
-        Screens for all available strategies and objects. Classes will only be recognized, 
-        if their names end with 'Obejct' or 'Strat', respectively. 
-        For developers who would like to add a new reader, please check out one of the 
-        implemented ones (e.g. findmycells.preprocessing.specs.PreprocessingObject or
-        findmycells.preprocessing.strategies.CropStitchingArtefactsRGBStrat).
+        All available processing modules, processing objects and strategies, data readers, and inspection 
+        methods are provided by the `Registry` of findmycells, which screens the findmycells package (and 
+        all registered plugins) only once. Processing modules will be recognized if they contain a "specs" 
+        and a "strategies" submodule. For developers who would like to add a new processing module, 
+        please check out one of the implemented ones (e.g. findmycells.preprocessing) to see how this 
+        can be done. The list of detected processing modules will be used for instance by the `GUI` to 
+        automatically create a `ProcessingStepPage` in the GUI for each available processing module. 
+        When adding new processing modules, developers also have to add them to the 
+        '_expected_processing_step_modules' property of the GUI class in findmycells.interfaces. Calling
+        this method is only required, if new modules were added after the registry was filled.
         """
-        available_processing_objects = {}
-        available_processing_strategies = {}
-        for processing_type, module in self.available_processing_modules.items():
-            for class_name, obj in inspect.getmembers(module.specs, inspect.isclass):
-                if (class_name.endswith('Object')) & (class_name != 'ProcessingObject'):
-                    available_processing_objects[processing_type] = obj
-            strats = []
-            for class_name, obj in inspect.getmembers(module.strategies, inspect.isclass):
-                if class_name.endswith('Strat'):
-                    strats.append(obj)
-            available_processing_strategies[processing_type] = strats
-        self.available_processing_objects = available_processing_objects
-        self.available_processing_strategies = available_processing_strategies
+        registry.fill()
             
             
     def add_processing_step_configs(self, 
@@ -128,7 +115,7 @@ class ProjectConfigs:
         reader_configs = self.data_reader_default_configs[reader_type].fill_user_input_with_defaults_where_needed(user_input = reader_configs)
         setattr(self, reader_type, reader_configs)
 
-# %% ../nbs/api/00_configs.ipynb 14
+# %% ../nbs/api/00_configs.ipynb 12
 class DefaultConfigs:
     
     """
@@ -187,6 +174,8 @@ class DefaultConfigs:
             if type(value) in [int, float]:
                 lower_border, upper_border = self.valid_ranges[key][:2]
                 assert lower_border <= value <= upper_border, f'Value for {key} is not within valid ranges!'
+            if key in self.valid_options.keys():
+                assert value in self.valid_options[key], f'Value for {key} is not among the valid options: {self.valid_options[key]}!'
                 
                 
     def fill_user_input_with_defaults_where_needed(self, user_input: Dict[str, Any]) -> Dict[str, Any]:
@@ -232,7 +221,7 @@ class DefaultConfigs:
                 else:
                     continue
 
-# %% ../nbs/api/00_configs.ipynb 22
+# %% ../nbs/api/00_configs.ipynb 20
 class GUIConfigs:
     
     """
@@ -469,3 +458,171 @@ class GUIConfigs:
         for config_key in self.widget_names.keys():
             all_widgets.append(getattr(self, config_key))
         return w.VBox(all_widgets)
+
+# %% ../nbs/api/00_configs.ipynb 25
+class Registry:
+    
+    """
+    Central registry of all processing modules, processing objects and strategies, data readers (and their 
+    specs), as well as inspection methods that are available in *findmycells*. It is filled only once (upon 
+    first access) by screening the findmycells package and all plugins that were registered by third-party 
+    packages via the "findmycells.plugins" entry point group. Afterwards, looking up for instance the reader 
+    for a specific file extension, or loading a project, does not require any reflection anymore.
+    For developers of plugins: an entry point of the "findmycells.plugins" group can either refer to a single
+    class or to an entire module. DataReaders have to subclass one of the reader base classes (e.g. 
+    `MicroscopyImageReaders`), strategies have to subclass one of the processing type specific strategy 
+    classes (e.g. `PreprocessingStrategy`), and inspection methods have to subclass `InspectionMethod`.
+    """
+    
+    plugin_entry_point_group = 'findmycells.plugins'
+    
+    def __init__(self) -> None:
+        self.is_filled = False
+        
+    
+    @property
+    def processing_modules(self) -> Dict[str, ModuleType]:
+        self._fill_once()
+        return self._processing_modules
+    
+    @property
+    def processing_objects(self) -> Dict[str, type]:
+        self._fill_once()
+        return self._processing_objects
+    
+    @property
+    def processing_strategies(self) -> Dict[str, List[type]]:
+        self._fill_once()
+        return self._processing_strategies
+    
+    @property
+    def data_reader_specs(self) -> Dict[str, type]:
+        self._fill_once()
+        return self._data_reader_specs
+    
+    @property
+    def data_reader_default_configs(self) -> Dict[str, 'DefaultConfigs']:
+        self._fill_once()
+        return self._data_reader_default_configs
+    
+    @property
+    def inspection_methods(self) -> List[type]:
+        self._fill_once()
+        return self._inspection_methods
+    
+    
+    def get_reader_class(self, file_extension: str, data_reader_module_name: str) -> Optional[type]:
+        """
+        Returns the DataReader class of the specified reader module (e.g. "findmycells.readers.microscopy_images")
+        that can handle files with the given extension, or None if there is no such reader.
+        """
+        self._fill_once()
+        if data_reader_module_name in self._readers_per_module_and_extension.keys():
+            reader_class = self._readers_per_module_and_extension[data_reader_module_name].get(file_extension)
+        else:
+            reader_class = None
+        return reader_class
+    
+    
+    def fill(self) -> None:
+        """
+        (Re-)screens the findmycells package and all registered plugins. This only has to be called 
+        explicitly, if new modules or plugins were added after the registry was filled.
+        """
+        self._processing_modules = {}
+        self._processing_objects = {}
+        self._processing_strategies = {}
+        self._readers_per_module_and_extension = {}
+        self._data_reader_specs = {}
+        self._data_reader_default_configs = {}
+        self._inspection_methods = []
+        self._screen_processing_modules()
+        self._screen_data_readers()
+        self._screen_inspection_methods()
+        self._load_plugins()
+        self.is_filled = True
+        
+        
+    def _fill_once(self) -> None:
+        if self.is_filled == False:
+            self.fill()
+    
+    
+    def _screen_processing_modules(self) -> None:
+        # Processing modules are recognized, if they contain a "specs" and a "strategies" submodule, and
+        # objects and strategies, if their class names end with 'Object' or 'Strat', respectively.
+        for module_name, module in inspect.getmembers(findmycells, inspect.ismodule):
+            if hasattr(module, 'specs') & hasattr(module, 'strategies'):
+                self._processing_modules[module_name] = module
+        for processing_type, module in self._processing_modules.items():
+            for class_name, obj in inspect.getmembers(module.specs, inspect.isclass):
+                if (class_name.endswith('Object')) & (class_name != 'ProcessingObject'):
+                    self._processing_objects[processing_type] = obj
+            strats = []
+            for class_name, obj in inspect.getmembers(module.strategies, inspect.isclass):
+                if class_name.endswith('Strat'):
+                    strats.append(obj)
+            self._processing_strategies[processing_type] = strats
+    
+    
+    def _screen_data_readers(self) -> None:
+        for reader_specs_class_name, reader_specs_class in inspect.getmembers(findmycells.readers.specs, inspect.isclass):
+            if reader_specs_class_name.endswith('Specs'):
+                reader_specs = reader_specs_class()
+                self._data_reader_specs[reader_specs.reader_type] = reader_specs_class
+                self._data_reader_default_configs[reader_specs.reader_type] = reader_specs.default_configs
+        for data_reader_module in [findmycells.readers.microscopy_images, findmycells.readers.rois]:
+            for class_name, data_reader in inspect.getmembers(data_reader_module, inspect.isclass):
+                if (class_name.endswith('Reader') == True) & (class_name != 'DataReader'):
+                    self._register_data_reader(data_reader = data_reader, data_reader_module_name = data_reader_module.__name__)
+                    
+                    
+    def _register_data_reader(self, data_reader: type, data_reader_module_name: str) -> None:
+        if data_reader_module_name not in self._readers_per_module_and_extension.keys():
+            self._readers_per_module_and_extension[data_reader_module_name] = {}
+        for file_extension in data_reader().readable_filetype_extensions:
+            self._readers_per_module_and_extension[data_reader_module_name][file_extension] = data_reader
+            
+    
+    def _screen_inspection_methods(self) -> None:
+        for class_name, obj in inspect.getmembers(findmycells.inspection.methods, inspect.isclass):
+            if (class_name.startswith('Inspect') == True) & (class_name.startswith('Inspection') == False):
+                self._inspection_methods.append(obj)
+                
+                
+    def _load_plugins(self) -> None:
+        all_entry_points = entry_points()
+        if hasattr(all_entry_points, 'select'): # Python >= 3.10
+            plugin_entry_points = all_entry_points.select(group = self.plugin_entry_point_group)
+        else:
+            plugin_entry_points = all_entry_points.get(self.plugin_entry_point_group, [])
+        for entry_point in plugin_entry_points:
+            try:
+                plugin = entry_point.load()
+            except Exception as e:
+                warnings.warn(f'The findmycells plugin "{entry_point.name}" could not be loaded and will be ignored: {e}')
+            else:
+                if inspect.ismodule(plugin):
+                    plugin_classes = [obj for class_name, obj in inspect.getmembers(plugin, inspect.isclass) if obj.__module__ == plugin.__name__]
+                else:
+                    plugin_classes = [plugin]
+                for plugin_class in plugin_classes:
+                    self._register_plugin_class(plugin_class = plugin_class)
+                    
+                    
+    def _register_plugin_class(self, plugin_class: type) -> None:
+        if inspect.isabstract(plugin_class) == False:
+            reader_base_classes = [findmycells.readers.microscopy_images.MicroscopyImageReaders, findmycells.readers.rois.ROIReaders]
+            for reader_base_class in reader_base_classes:
+                if issubclass(plugin_class, reader_base_class):
+                    self._register_data_reader(data_reader = plugin_class, data_reader_module_name = reader_base_class.__module__)
+            if issubclass(plugin_class, findmycells.core.ProcessingStrategy):
+                processing_type = plugin_class().processing_type
+                if (processing_type in self._processing_strategies.keys()) and (plugin_class not in self._processing_strategies[processing_type]):
+                    self._processing_strategies[processing_type].append(plugin_class)
+            if issubclass(plugin_class, findmycells.inspection.methods.InspectionMethod):
+                if plugin_class not in self._inspection_methods:
+                    self._inspection_methods.append(plugin_class)
+
+
+registry = Registry()
@@ -5,12 +5,13 @@ __all__ = ['ProcessingObject', 'ProcessingStrategy', 'DataReader', 'DataLoader']
 
 # %% ../nbs/api/01_core.ipynb 2
 from abc import ABC, abstractmethod
-from .database import Database
-from .configs import DefaultConfigs, GUIConfigs
-from typing import List, Dict, Tuple, Optional, Any, Union
+from .database import Database, decoded_data_cache
+from .configs import DefaultConfigs, GUIConfigs, registry
+from typing import List, Dict, Tuple, Optional, Any, Union, Iterator
 from types import ModuleType
 from pathlib import Path, PosixPath, WindowsPath
-import inspect
+from functools import partial
+import numpy as np
 
 # %% ../nbs/api/01_core.ipynb 6
 class ProcessingObject(ABC):
@@ -274,6 +275,18 @@ class ProcessingStrategy(ABC):
     def strategy_name(self):
         return self.__class__.__name__ 
 
+
+    @property
+    def processing_kind(self) -> Optional[str]:
+        """
+        Capability that a strategy can declare about how it processes the data, which allows the
+        `ProcessingObject` to combine it with other strategies (e.g. `PreprocessingObject.run_all_strategies()`):
+        "crop" (selects a window of the data), "pointwise" (maps each value independently of all other
+        values, e.g. via a lookup table), or "reduction" (reduces an axis of the data, e.g. intensity
+        projections). Defaults to None, i.e. no assumptions can be made about the strategy.
+        """
+        return None
+
     
     def initialize_gui_configs_and_widget(self) -> None:
         """
@@ -336,7 +349,7 @@ class ProcessingStrategy(ABC):
         html_converted_docstring = partially_converted_docstring.replace('  ', '')
         return html_converted_docstring
 
-# %% ../nbs/api/01_core.ipynb 41
+# %% ../nbs/api/01_core.ipynb 42
 class DataReader(ABC):
     
     """
@@ -372,7 +385,7 @@ class DataReader(ABC):
         """
         pass
 
-# %% ../nbs/api/01_core.ipynb 46
+# %% ../nbs/api/01_core.ipynb 47
 class DataLoader:
     
     """
@@ -384,28 +397,54 @@ class DataLoader:
     def determine_reader(self, file_extension: str, data_reader_module: ModuleType) -> DataReader:
         """
         Check whether there is a reader implemented in the requested reader submodule that 
-        can handle the specified filetype inferred from its extension.
+        can handle the specified filetype inferred from its extension. The readers are looked up 
+        in the `Registry`, which screens the reader submodules only once.
         For developers: new readers will only be recognized, if their class names end with 
         'Reader'. Please check out one of the implemented ones (e.g. 
-        findmycells.readers.microscopy_images.CZIReader).
+        findmycells.readers.microscopy_images.CZIReader). Readers of other packages can be 
+        added as plugins (see `Registry`).
         """
-        available_reader = None
-        for name, data_reader in inspect.getmembers(data_reader_module):
-            if (name.endswith('Reader') == True) & (name != 'DataReader'):
-                if file_extension in data_reader().readable_filetype_extensions:
-                    available_reader = data_reader
+        available_reader = registry.get_reader_class(file_extension = file_extension, data_reader_module_name = data_reader_module.__name__)
         if available_reader == None:
             raise NotImplementedError(f'Unfortunately, there is no DataReader implemented in {data_reader_module} '
                                       f'which can handle your filetype ("{file_extension}").')
         return available_reader
     
     
-    def load(self, data_reader_class: DataReader, filepath: Union[PosixPath, WindowsPath], reader_configs: Dict) -> Any:
+    def load(self, data_reader_class: DataReader, filepath: Union[PosixPath, WindowsPath], reader_configs: Dict, use_cache: bool=True) -> Any:
         """
-        Uses the provided `DataReader` subclass to import the data.
+        Uses the provided `DataReader` subclass to import the data. If the `DecodedDataCache` was
+        enabled (see `API.enable_data_cache()`), data that was already read before with identical 
+        reader configs (and that was not modified since) will be served from the cache instead - 
+        unless "use_cache" is False (e.g. for the many small windows that are read in tiled processing).
         """
         data_reader = data_reader_class()
         # data_reader.set_optional_configs(database = database)
-        data = data_reader.read(filepath = filepath, reader_configs = reader_configs)
+        if use_cache == True:
+            data = decoded_data_cache.get_or_load(source_filepaths = [filepath],
+                                                  configs = {'data_reader_class': data_reader_class.__name__, **reader_configs},
+                                                  load_data = partial(data_reader.read, filepath = filepath, reader_configs = reader_configs))
+        else:
+            data = data_reader.read(filepath = filepath, reader_configs = reader_configs)
         data_reader.assert_correct_output_format(output = data)
-        return data                 
+        return data
+    
+    
+    def load_shape(self, data_reader_class: DataReader, filepath: Union[PosixPath, WindowsPath], reader_configs: Dict) -> Tuple[int, ...]:
+        """
+        Uses the `read_shape()` method of the provided `DataReader` subclass to determine the shape of the data 
+        that would be imported, without necessarily reading it (only available for `MicroscopyImageReaders`).
+        """
+        data_reader = data_reader_class()
+        return tuple(data_reader.read_shape(filepath = filepath, reader_configs = reader_configs))
+    
+    
+    def load_planes(self, data_reader_class: DataReader, filepath: Union[PosixPath, WindowsPath], reader_configs: Dict) -> Iterator[Any]:
+        """
+        Uses the `iter_planes()` method of the provided `DataReader` subclass to import the data plane by 
+        plane (only available for readers of z-stacks, i.e. `MicroscopyImageReaders`). The planes are not cached.
+        """
+        data_reader = data_reader_class()
+        for plane in data_reader.iter_planes(filepath = filepath, reader_configs = reader_configs):
+            data_reader.assert_correct_output_format(output = plane[np.newaxis])
+            yield plane
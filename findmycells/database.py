@@ -1,15 +1,30 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/api/02_database.ipynb.
 
 # %% auto 0
-__all__ = ['Database', 'FileHistory']
+__all__ = ['decoded_data_cache', 'Database', 'FileHistory', 'LazyFileHistories', 'DatabaseStore', 'ZStackStore',
+           'PNGPlanesZStackStore', 'NPYZStackStore', 'ZarrZStackStore', 'DecodedDataCache']
 
 # %% ../nbs/api/02_database.ipynb 2
 from pathlib import Path, PosixPath, WindowsPath
-from typing import Optional, Dict, List, Union
+from typing import Optional, Dict, List, Union, Tuple, Any, Iterator, Callable
+from abc import ABC, abstractmethod
+from collections.abc import MutableMapping
+from contextlib import closing
+import numpy as np
 import pandas as pd
 from datetime import datetime
 from shapely.geometry import Polygon
+from skimage import io
 import pickle
+import sqlite3
+import hashlib
+import copy
+import shutil
+import os
+import threading
+import zarr
+from collections import OrderedDict
+from functools import partial
 
 
 from .configs import ProjectConfigs
@@ -307,6 +322,123 @@ class Database:
         self.area_rois_for_quantification[file_id] = rois_dict
 
 
+    def _get_zstack_stores(self) -> List['ZStackStore']:
+        # the store of the format specified in the project configs comes first, the others are only needed for reading
+        zstack_stores = [PNGPlanesZStackStore(), NPYZStackStore(), ZarrZStackStore()]
+        storage_format = getattr(self.project_configs, 'intermediate_storage_format', 'png')
+        return sorted(zstack_stores, key = lambda zstack_store: zstack_store.storage_format != storage_format)
+    
+    
+    def save_zstack(self, zstack: np.ndarray, dir_path: Union[PosixPath, WindowsPath], file_id: str, plane_filename_suffix: str='') -> None:
+        """
+        Saves an intermediate z-stack of a file_id (e.g. preprocessed images or segmentation masks) 
+        in "dir_path", using the format specified as "intermediate_storage_format" in the project configs.
+        """
+        self._get_zstack_stores()[0].save(zstack = zstack, dir_path = dir_path, file_id = file_id, plane_filename_suffix = plane_filename_suffix)
+        
+        
+    def create_zstack(self, 
+                      dir_path: Union[PosixPath, WindowsPath], 
+                      file_id: str, 
+                      shape: Tuple[int, ...], 
+                      dtype: Union[str, np.dtype], 
+                      tile_size: int
+                     ) -> Union[np.memmap, zarr.Array]:
+        """
+        Creates an (empty) intermediate z-stack of a file_id in "dir_path", which can then be written region 
+        by region (e.g. tile by tile in the tiled preprocessing of whole-slide images), such that it never has 
+        to be kept in memory entirely. Requires "npy" or "zarr" as "intermediate_storage_format" in the project configs.
+        """
+        return self._get_zstack_stores()[0].create(dir_path = dir_path, file_id = file_id, shape = shape, dtype = dtype, tile_size = tile_size)
+        
+        
+    def contains_zstack(self, dir_path: Union[PosixPath, WindowsPath], file_id: str) -> bool:
+        return any(zstack_store.contains(dir_path = dir_path, file_id = file_id) for zstack_store in self._get_zstack_stores())
+        
+        
+    def load_zstack(self, dir_path: Union[PosixPath, WindowsPath], file_id: str, memory_mapped: bool=False) -> np.ndarray:
+        """
+        Loads an intermediate z-stack of a file_id from "dir_path", regardless of the format it was 
+        saved in (e.g. also the individual PNG files per plane of projects from previous versions).
+        """
+        # stop at the first store that contains the z-stack, such that e.g. no directory listing is required for PNG planes in "npy" projects
+        zstack_store = next((zstack_store for zstack_store in self._get_zstack_stores() if zstack_store.contains(dir_path = dir_path, file_id = file_id)), None)
+        if zstack_store == None:
+            raise FileNotFoundError(f'Could not find any z-stack of file_id {file_id} in {dir_path}.')
+        if decoded_data_cache.is_enabled == True:
+            zstack = decoded_data_cache.get_or_load(source_filepaths = zstack_store.get_filepaths(dir_path = dir_path, file_id = file_id),
+                                                    configs = {'storage_format': zstack_store.storage_format, 'memory_mapped': memory_mapped},
+                                                    load_data = partial(zstack_store.load, dir_path = dir_path, file_id = file_id, memory_mapped = memory_mapped))
+        else:
+            zstack = zstack_store.load(dir_path = dir_path, file_id = file_id, memory_mapped = memory_mapped)
+        return zstack
+
+
+    def get_subset(self, file_ids: List[str]) -> 'Database':
+        """
+        Returns a copy of the database that only holds the information of the specified file_ids, 
+        e.g. to process them in a separate process. Use merge_subset() to merge the changes back.
+        """
+        subset = copy.copy(self)
+        indices = [self.file_infos['file_id'].index(file_id) for file_id in file_ids]
+        subset.file_infos = {}
+        for key, list_of_values in self.file_infos.items():
+            if len(list_of_values) == len(self.file_infos['file_id']):
+                subset.file_infos[key] = [list_of_values[idx] for idx in indices]
+            else:
+                subset.file_infos[key] = list_of_values.copy()
+        subset.file_histories = {file_id: self.file_histories[file_id] for file_id in file_ids}
+        for attr_id in ['area_rois_for_quantification', 'multi_matches_traceback']:
+            if hasattr(self, attr_id):
+                setattr(subset, attr_id, {file_id: value for file_id, value in getattr(self, attr_id).items() if file_id in file_ids})
+        if hasattr(self, 'quantification_results'):
+            subset.quantification_results = {}
+            for strategy_name, results_per_file_id in self.quantification_results.items():
+                subset.quantification_results[strategy_name] = {file_id: results for file_id, results in results_per_file_id.items() if file_id in file_ids}
+        return subset
+    
+    
+    def merge_subset(self, subset: 'Database') -> None:
+        """
+        Merges all file_id-specific information of a database subset (see get_subset()) 
+        back into the database, i.e. file infos, file histories, area ROIs, quantification 
+        results, and multi-match tracebacks.
+        """
+        self.merge_subsets(subsets = [subset])
+        
+        
+    def merge_subsets(self, subsets: List['Database']) -> None:
+        """
+        Merges multiple database subsets in a single bulk update. The subsets are merged 
+        in the order in which they are passed.
+        """
+        merged_attributes = {'area_rois_for_quantification': {}, 'multi_matches_traceback': {}, 'quantification_results': {}}
+        for subset in subsets:
+            for file_id in subset.file_infos['file_id']:
+                self.update_file_infos(file_id = file_id, updates = subset.get_file_infos(file_id = file_id))
+                self.file_histories[file_id] = subset.file_histories[file_id]
+            for attr_id in ['area_rois_for_quantification', 'multi_matches_traceback']:
+                if hasattr(subset, attr_id):
+                    merged_attributes[attr_id].update(getattr(subset, attr_id))
+            if hasattr(subset, 'quantification_results'):
+                for strategy_name, results_per_file_id in subset.quantification_results.items():
+                    if strategy_name not in merged_attributes['quantification_results'].keys():
+                        merged_attributes['quantification_results'][strategy_name] = {}
+                    merged_attributes['quantification_results'][strategy_name].update(results_per_file_id)
+        for attr_id in ['area_rois_for_quantification', 'multi_matches_traceback']:
+            if any([hasattr(subset, attr_id) for subset in subsets]):
+                if hasattr(self, attr_id) == False:
+                    setattr(self, attr_id, {})
+                getattr(self, attr_id).update(merged_attributes[attr_id])
+        if any([hasattr(subset, 'quantification_results') for subset in subsets]):
+            if hasattr(self, 'quantification_results') == False:
+                self.quantification_results = {}
+            for strategy_name, results_per_file_id in merged_attributes['quantification_results'].items():
+                if strategy_name not in self.quantification_results.keys():
+                    self.quantification_results[strategy_name] = {}
+                self.quantification_results[strategy_name].update(results_per_file_id)
+
+
     def remove_file_id_from_project(self, file_id: str) -> None:
         self._remove_file_id_from_file_infos(file_id = file_id)
         self._remove_file_id_from_file_histories(file_id = file_id)
@@ -351,10 +483,13 @@ class Database:
             
             
     def _delete_matching_files_from_subdir(self, subdir_path: Union[PosixPath, WindowsPath], file_id: str) -> None:
-        all_filepaths_in_subdir = utils.list_dir_no_hidden(path = subdir_path, only_files = True)
+        all_filepaths_in_subdir = utils.list_dir_no_hidden(path = subdir_path)
         associated_filepaths = [filepath for filepath in all_filepaths_in_subdir if filepath.name.startswith(file_id)]
         for filepath_to_delete in associated_filepaths:
-            filepath_to_delete.delete()
+            if filepath_to_delete.is_dir(): # e.g. z-stacks saved in zarr format
+                shutil.rmtree(filepath_to_delete)
+            else:
+                filepath_to_delete.unlink()
 
             
     def export_quantification_results(self,
@@ -417,6 +552,7 @@ class FileHistory:
         self._initialize_tracked_history()
         self._initialize_tracked_settings()
         self._initialize_completed_processing_steps()
+        self.unsaved_changes = True
         
         
     def _initialize_tracked_history(self) -> None:
@@ -444,8 +580,511 @@ class FileHistory:
         tracked_details_df = pd.DataFrame(data = tracked_details)
         self.tracked_history = pd.concat([self.tracked_history, tracked_details_df], ignore_index = True)
         self.tracked_settings[self.tracked_history.index[-1]] = strategy_configs
+        self.unsaved_changes = True
         
     
     def mark_processing_step_as_completed(self, processing_step_id: str) -> None:
         assert processing_step_id in self.completed_processing_steps.keys(), 'This processing step has not been started yet!'
         self.completed_processing_steps[processing_step_id] = True
+        self.unsaved_changes = True
+
+# %% ../nbs/api/02_database.ipynb 6
+class LazyFileHistories(MutableMapping):
+    
+    """
+    Dictionary-like container for the `FileHistory` objects of a project that was loaded 
+    from a `DatabaseStore`. The `FileHistory` of a file_id is only read from disk when 
+    it is accessed for the first time.
+    """
+    
+    def __init__(self, database_store: 'DatabaseStore', file_ids: List[str]) -> None:
+        self.database_store = database_store
+        self._file_histories = {file_id: None for file_id in file_ids}
+        
+        
+    def __getitem__(self, file_id: str) -> FileHistory:
+        if self._file_histories[file_id] == None:
+            self._file_histories[file_id] = self.database_store.load_file_history(file_id = file_id)
+        return self._file_histories[file_id]
+    
+    
+    def __setitem__(self, file_id: str, file_history: FileHistory) -> None:
+        self._file_histories[file_id] = file_history
+        
+        
+    def __delitem__(self, file_id: str) -> None:
+        del self._file_histories[file_id]
+        
+        
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._file_histories)
+    
+    
+    def __len__(self) -> int:
+        return len(self._file_histories)
+    
+    
+    def __contains__(self, file_id: str) -> bool:
+        return file_id in self._file_histories
+    
+    
+    def is_loaded(self, file_id: str) -> bool:
+        return self._file_histories[file_id] != None
+
+# %% ../nbs/api/02_database.ipynb 7
+class DatabaseStore:
+    
+    """
+    Indexed on-disk storage of a *findmycells* project (`Database` and `ProjectConfigs`) 
+    as SQLite file in the project root directory. All file_id-specific information 
+    (file infos, file history, area ROIs, quantification results, and multi-match 
+    tracebacks) is stored as individual rows, of which only those that changed since 
+    the last save are written. When loading, file histories are only read on demand 
+    (see `LazyFileHistories`).
+    """
+    
+    filename = 'findmycells_project.fmcdb'
+    file_id_specific_attributes = ['area_rois_for_quantification', 'quantification_results', 'multi_matches_traceback']
+    
+    def __init__(self, root_dir: Union[PosixPath, WindowsPath]) -> None:
+        self.filepath = root_dir.joinpath(self.filename)
+        
+        
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.filepath)
+        connection.execute(('CREATE TABLE IF NOT EXISTS file_records (file_id TEXT, record_type TEXT, '
+                            'digest TEXT, data BLOB, PRIMARY KEY (file_id, record_type))'))
+        connection.execute('CREATE TABLE IF NOT EXISTS project_records (record_id TEXT PRIMARY KEY, digest TEXT, data BLOB)')
+        return connection
+    
+    
+    def _serialize(self, record: Any) -> Tuple[str, bytes]:
+        data = pickle.dumps(record)
+        return hashlib.blake2b(data, digest_size = 16).hexdigest(), data
+    
+    
+    def save(self, database: Database, project_configs: ProjectConfigs) -> None:
+        file_ids = list(database.file_infos['file_id'])
+        file_infos_keys_per_row, irregular_file_infos = self._split_file_infos(file_infos = database.file_infos)
+        project_records = {'project_configs': project_configs,
+                           'database_attributes': self._get_database_without_file_id_specific_attributes(database = database),
+                           'layout': {'file_ids': file_ids,
+                                      'file_infos_keys': list(database.file_infos.keys()),
+                                      'irregular_file_infos': irregular_file_infos,
+                                      'present_attributes': [attr_id for attr_id in self.file_id_specific_attributes if hasattr(database, attr_id)],
+                                      'quantification_strategies': list(getattr(database, 'quantification_results', {}).keys())}}
+        file_histories_to_save = self._get_file_histories_with_unsaved_changes(database = database)
+        with closing(self._connect()) as connection:
+            with connection:
+                stored_digests = {(file_id, record_type): digest for file_id, record_type, digest 
+                                  in connection.execute('SELECT file_id, record_type, digest FROM file_records')}
+                stored_project_digests = dict(connection.execute('SELECT record_id, digest FROM project_records'))
+                for record_id, record in project_records.items():
+                    digest, data = self._serialize(record = record)
+                    if stored_project_digests.get(record_id) != digest:
+                        connection.execute('INSERT OR REPLACE INTO project_records VALUES (?, ?, ?)', (record_id, digest, data))
+                rows_to_write = []
+                for file_id in file_ids:
+                    for record_type, record in self._get_file_id_specific_records(database, file_id, file_infos_keys_per_row).items():
+                        digest, data = self._serialize(record = record)
+                        if stored_digests.get((file_id, record_type)) != digest:
+                            rows_to_write.append((file_id, record_type, digest, data))
+                for file_id, file_history in file_histories_to_save.items():
+                    # pickle a copy that is flagged as saved, so that loaded histories start clean:
+                    file_history_to_save = copy.copy(file_history)
+                    file_history_to_save.unsaved_changes = False
+                    digest, data = self._serialize(record = file_history_to_save)
+                    rows_to_write.append((file_id, 'file_history', digest, data))
+                connection.executemany('INSERT OR REPLACE INTO file_records VALUES (?, ?, ?, ?)', rows_to_write)
+                removed_file_ids = set(file_id for file_id, record_type in stored_digests.keys()) - set(file_ids)
+                connection.executemany('DELETE FROM file_records WHERE file_id = ?', [(file_id,) for file_id in removed_file_ids])
+        # only reached once the transaction was committed successfully:
+        for file_history in file_histories_to_save.values():
+            file_history.unsaved_changes = False
+                    
+                    
+    def _split_file_infos(self, file_infos: Dict[str, List]) -> Tuple[List[str], Dict[str, List]]:
+        file_infos_keys_per_row, irregular_file_infos = [], {}
+        for key, list_of_values in file_infos.items():
+            if len(list_of_values) == len(file_infos['file_id']):
+                file_infos_keys_per_row.append(key)
+            else:
+                irregular_file_infos[key] = list_of_values
+        return file_infos_keys_per_row, irregular_file_infos
+        
+        
+    def _get_database_without_file_id_specific_attributes(self, database: Database) -> Database:
+        database_to_save = copy.copy(database)
+        for attr_id in ['project_configs', 'file_infos', 'file_histories'] + self.file_id_specific_attributes:
+            if hasattr(database_to_save, attr_id):
+                delattr(database_to_save, attr_id)
+        return database_to_save
+    
+    
+    def _get_file_histories_with_unsaved_changes(self, database: Database) -> Dict[str, FileHistory]:
+        file_histories_to_save = {}
+        for file_id in database.file_infos['file_id']:
+            if file_id not in database.file_histories.keys():
+                continue
+            if isinstance(database.file_histories, LazyFileHistories):
+                if database.file_histories.is_loaded(file_id = file_id) == False:
+                    continue
+            if getattr(database.file_histories[file_id], 'unsaved_changes', True) == True:
+                file_histories_to_save[file_id] = database.file_histories[file_id]
+        return file_histories_to_save
+    
+    
+    def _get_file_id_specific_records(self, database: Database, file_id: str, file_infos_keys_per_row: List[str]) -> Dict[str, Any]:
+        index = database.file_infos['file_id'].index(file_id)
+        records = {'file_infos': {key: database.file_infos[key][index] for key in file_infos_keys_per_row}}
+        if hasattr(database, 'area_rois_for_quantification') and (file_id in database.area_rois_for_quantification.keys()):
+            records['area_rois_for_quantification'] = database.area_rois_for_quantification[file_id]
+        if hasattr(database, 'quantification_results'):
+            records['quantification_results'] = {strategy_name: results[file_id] for strategy_name, results 
+                                                 in database.quantification_results.items() if file_id in results.keys()}
+        if hasattr(database, 'multi_matches_traceback') and (file_id in database.multi_matches_traceback.keys()):
+            records['multi_matches_traceback'] = database.multi_matches_traceback[file_id]
+        return records
+    
+    
+    def load(self) -> Tuple[ProjectConfigs, Database]:
+        assert self.filepath.is_file(), f'Could not find a "{self.filename}" file in {self.filepath.parent}!'
+        with closing(self._connect()) as connection:
+            project_records = {record_id: pickle.loads(data) for record_id, data 
+                               in connection.execute('SELECT record_id, data FROM project_records')}
+            file_records = {(file_id, record_type): pickle.loads(data) for file_id, record_type, data 
+                            in connection.execute("SELECT file_id, record_type, data FROM file_records WHERE record_type != 'file_history'")}
+        layout = project_records['layout']
+        database = project_records['database_attributes']
+        database.file_infos = {key: [] for key in layout['file_infos_keys']}
+        for file_id in layout['file_ids']:
+            for key, value in file_records[(file_id, 'file_infos')].items():
+                database.file_infos[key].append(value)
+        database.file_infos.update(layout['irregular_file_infos'])
+        database.file_histories = LazyFileHistories(database_store = self, file_ids = layout['file_ids'])
+        for attr_id in layout['present_attributes']:
+            setattr(database, attr_id, {})
+        if 'quantification_results' in layout['present_attributes']:
+            database.quantification_results = {strategy_name: {} for strategy_name in layout['quantification_strategies']}
+        for file_id in layout['file_ids']:
+            if (file_id, 'area_rois_for_quantification') in file_records.keys():
+                database.area_rois_for_quantification[file_id] = file_records[(file_id, 'area_rois_for_quantification')]
+            if (file_id, 'multi_matches_traceback') in file_records.keys():
+                database.multi_matches_traceback[file_id] = file_records[(file_id, 'multi_matches_traceback')]
+            for strategy_name, results in file_records.get((file_id, 'quantification_results'), {}).items():
+                database.quantification_results[strategy_name][file_id] = results
+        return project_records['project_configs'], database
+    
+    
+    def load_file_history(self, file_id: str) -> FileHistory:
+        with closing(self._connect()) as connection:
+            row = connection.execute("SELECT data FROM file_records WHERE file_id = ? AND record_type = 'file_history'", (file_id,)).fetchone()
+        assert row != None, f'No file history for file_id {file_id} found in {self.filepath}!'
+        return pickle.loads(row[0])
+
+# %% ../nbs/api/02_database.ipynb 8
+class ZStackStore(ABC):
+    
+    """
+    Abstract base class that defines how intermediate z-stacks of a file_id (i.e. preprocessed 
+    images and segmentation masks) are saved in and loaded from a processing subdirectory of 
+    the project. Which store is used for saving is specified by "intermediate_storage_format" 
+    in the `ProjectConfigs`.
+    """
+    
+    @property
+    @abstractmethod
+    def storage_format(self) -> str:
+        pass
+    
+    
+    @abstractmethod
+    def save(self, zstack: np.ndarray, dir_path: Union[PosixPath, WindowsPath], file_id: str, plane_filename_suffix: str='') -> None:
+        pass
+    
+    
+    @abstractmethod
+    def contains(self, dir_path: Union[PosixPath, WindowsPath], file_id: str) -> bool:
+        pass
+    
+    
+    @abstractmethod
+    def load(self, dir_path: Union[PosixPath, WindowsPath], file_id: str, memory_mapped: bool=False) -> np.ndarray:
+        pass
+    
+    
+    @abstractmethod
+    def get_filepaths(self, dir_path: Union[PosixPath, WindowsPath], file_id: str) -> List[Union[PosixPath, WindowsPath]]:
+        """
+        Returns the filepaths of all files in which the z-stack is stored (e.g. to identify it in the `DecodedDataCache`).
+        """
+        pass
+    
+    
+    def create(self, 
+               dir_path: Union[PosixPath, WindowsPath], 
+               file_id: str, 
+               shape: Tuple[int, ...], 
+               dtype: Union[str, np.dtype], 
+               tile_size: int # edge length of the regions in which the z-stack will be written
+              ) -> Union[np.memmap, zarr.Array]:
+        """
+        Creates the z-stack on disk and returns it as array that can be written region by region. Only 
+        supported by formats that do not require the entire z-stack (or plane) in memory for saving.
+        """
+        raise NotImplementedError(f'Z-stacks can not be written region by region in the "{self.storage_format}" format. '
+                                  'Please set the "intermediate_storage_format" in the project configs to "npy" or "zarr".')
+
+# %% ../nbs/api/02_database.ipynb 9
+class PNGPlanesZStackStore(ZStackStore):
+    
+    """
+    Stores each plane of a z-stack as individual PNG file ("{file_id}-{plane_idx:03d}.png"). 
+    This was the only available format in previous versions of *findmycells* and is also 
+    the format in which deepflash2 expects its input images and exports its semantic masks.
+    """
+    
+    @property
+    def storage_format(self) -> str:
+        return 'png'
+    
+    
+    def save(self, zstack: np.ndarray, dir_path: Union[PosixPath, WindowsPath], file_id: str, plane_filename_suffix: str='') -> None:
+        for plane_index in range(zstack.shape[0]):
+            filepath = dir_path.joinpath(f'{file_id}-{str(plane_index).zfill(3)}{plane_filename_suffix}.png')
+            io.imsave(filepath, zstack[plane_index], check_contrast=False)
+            
+            
+    def contains(self, dir_path: Union[PosixPath, WindowsPath], file_id: str) -> bool:
+        # check for the file of the first plane directly, instead of listing the entire directory:
+        if dir_path.joinpath(f'{file_id}-000.png').is_file() == True:
+            first_plane_found = True
+        else: # e.g. with a plane filename suffix, like "_postprocessed_segmentations"
+            first_plane_found = next(dir_path.glob(f'{file_id}-000*.png'), None) != None
+        return first_plane_found
+    
+    
+    def load(self, dir_path: Union[PosixPath, WindowsPath], file_id: str, memory_mapped: bool=False) -> np.ndarray:
+        return utils.load_zstack_as_array_from_single_planes(path = dir_path, file_id = file_id)
+    
+    
+    def get_filepaths(self, dir_path: Union[PosixPath, WindowsPath], file_id: str) -> List[Union[PosixPath, WindowsPath]]:
+        return sorted([filepath for filepath in utils.list_dir_no_hidden(path = dir_path, only_files = True) 
+                       if filepath.name.startswith(file_id) and filepath.suffix == '.png'])
+
+# %% ../nbs/api/02_database.ipynb 10
+class NPYZStackStore(ZStackStore):
+    
+    """
+    Stores the entire z-stack as a single NumPy file ("{file_id}.npy"), which can be 
+    loaded memory-mapped, e.g. to access individual planes without reading the full stack.
+    """
+    
+    @property
+    def storage_format(self) -> str:
+        return 'npy'
+    
+    
+    def save(self, zstack: np.ndarray, dir_path: Union[PosixPath, WindowsPath], file_id: str, plane_filename_suffix: str='') -> None:
+        np.save(dir_path.joinpath(f'{file_id}.npy'), zstack)
+        
+        
+    def contains(self, dir_path: Union[PosixPath, WindowsPath], file_id: str) -> bool:
+        return dir_path.joinpath(f'{file_id}.npy').is_file()
+    
+    
+    def load(self, dir_path: Union[PosixPath, WindowsPath], file_id: str, memory_mapped: bool=False) -> np.ndarray:
+        if memory_mapped == True:
+            zstack = np.load(dir_path.joinpath(f'{file_id}.npy'), mmap_mode = 'r')
+        else:
+            zstack = np.load(dir_path.joinpath(f'{file_id}.npy'))
+        return zstack
+    
+    
+    def get_filepaths(self, dir_path: Union[PosixPath, WindowsPath], file_id: str) -> List[Union[PosixPath, WindowsPath]]:
+        return [dir_path.joinpath(f'{file_id}.npy')]
+    
+    
+    def create(self, dir_path: Union[PosixPath, WindowsPath], file_id: str, shape: Tuple[int, ...], dtype: Union[str, np.dtype], tile_size: int) -> np.memmap:
+        return np.lib.format.open_memmap(dir_path.joinpath(f'{file_id}.npy'), mode = 'w+', shape = shape, dtype = dtype)
+
+# %% ../nbs/api/02_database.ipynb 11
+class ZarrZStackStore(ZStackStore):
+    
+    """
+    Stores the entire z-stack as a compressed Zarr array ("{file_id}.zarr"), chunked per plane. 
+    If loaded "memory_mapped", the Zarr array is returned as is, and only the planes that are 
+    accessed will be read from disk and decompressed.
+    """
+    
+    @property
+    def storage_format(self) -> str:
+        return 'zarr'
+    
+    
+    def save(self, zstack: np.ndarray, dir_path: Union[PosixPath, WindowsPath], file_id: str, plane_filename_suffix: str='') -> None:
+        zarr_array = zarr.open_array(str(dir_path.joinpath(f'{file_id}.zarr')),
+                                     mode = 'w',
+                                     shape = zstack.shape,
+                                     chunks = (1,) + zstack.shape[1:],
+                                     dtype = zstack.dtype)
+        zarr_array[:] = zstack
+        
+        
+    def contains(self, dir_path: Union[PosixPath, WindowsPath], file_id: str) -> bool:
+        return dir_path.joinpath(f'{file_id}.zarr').is_dir()
+    
+    
+    def load(self, dir_path: Union[PosixPath, WindowsPath], file_id: str, memory_mapped: bool=False) -> np.ndarray:
+        zarr_array = zarr.open_array(str(dir_path.joinpath(f'{file_id}.zarr')), mode = 'r')
+        if memory_mapped == True:
+            zstack = zarr_array
+        else:
+            zstack = zarr_array[:]
+        return zstack
+    
+    
+    def get_filepaths(self, dir_path: Union[PosixPath, WindowsPath], file_id: str) -> List[Union[PosixPath, WindowsPath]]:
+        return sorted([filepath for filepath in dir_path.joinpath(f'{file_id}.zarr').rglob('*') if filepath.is_file()])
+    
+    
+    def create(self, dir_path: Union[PosixPath, WindowsPath], file_id: str, shape: Tuple[int, ...], dtype: Union[str, np.dtype], tile_size: int) -> zarr.Array:
+        # chunked in tiles (instead of planes), such that each written tile only has to be compressed once:
+        return zarr.open_array(str(dir_path.joinpath(f'{file_id}.zarr')),
+                               mode = 'w',
+                               shape = shape,
+                               chunks = (1, min(tile_size, shape[1]), min(tile_size, shape[2])) + tuple(shape[3:]),
+                               dtype = dtype)
+
+# %% ../nbs/api/02_database.ipynb 12
+class DecodedDataCache:
+    
+    """
+    Opt-in LRU cache for decoded image data (e.g. microscopy images read by the `DataLoader`, or z-stacks of 
+    preprocessed images and segmentation masks), bounded by its total size in bytes. Entries are identified 
+    by path, modification time, and size of the source file(s), as well as by the configs that were used for
+    reading. Hence, modified files will never be served from the cache. Optionally, entries that are evicted 
+    from memory can be spilled to a directory on disk (again bounded in bytes), from where they are loaded 
+    upon the next request. Only fully decoded numpy arrays are cached (memory-mapped or other lazily loaded 
+    arrays are cheap to load again anyways), and copies are returned, such that the cached data can not be
+    modified by in-place operations of the processing strategies. The cache is disabled by default and 
+    can be enabled via `API.enable_data_cache()`.
+    """
+    
+    def __init__(self) -> None:
+        self.configure(max_size_in_bytes = 0)
+        
+    
+    @property
+    def is_enabled(self) -> bool:
+        return self.max_size_in_bytes > 0
+    
+    
+    def configure(self, 
+                  max_size_in_bytes: int, # maximal total size of all arrays kept in memory; 0 disables the cache
+                  spill_dir_path: Optional[Union[PosixPath, WindowsPath]]=None, # directory to which evicted arrays are saved (optional)
+                  max_spill_size_in_bytes: int=0 # maximal total size of all arrays saved in "spill_dir_path"
+                 ) -> None:
+        """
+        (Re-)configures the cache. Note: all entries that were kept in memory will be cleared.
+        """
+        self.max_size_in_bytes = max_size_in_bytes
+        self.spill_dir_path = spill_dir_path
+        self.max_spill_size_in_bytes = max_spill_size_in_bytes
+        self._entries = OrderedDict()
+        self._current_size_in_bytes = 0
+        self._lock = threading.Lock()
+        if spill_dir_path != None:
+            spill_dir_path.mkdir(exist_ok = True)
+            
+            
+    def get_or_load(self, 
+                    source_filepaths: List[Union[PosixPath, WindowsPath]], # all files from which the data is read
+                    configs: Dict[str, Any], # all configs that affect the read data (e.g. reader configs)
+                    load_data: Callable[[], Any] # function that loads the data if it can not be served from the cache
+                   ) -> Any:
+        if self.is_enabled == False:
+            data = load_data()
+        else:
+            key = self._create_key(source_filepaths = source_filepaths, configs = configs)
+            data = self._get(key = key)
+            if data is None:
+                data = load_data()
+                if type(data) == np.ndarray:
+                    self._put(key = key, data = data)
+        return data
+    
+    
+    def _create_key(self, source_filepaths: List[Union[PosixPath, WindowsPath]], configs: Dict[str, Any]) -> str:
+        key_components = []
+        for filepath in source_filepaths:
+            file_stats = os.stat(filepath)
+            key_components.append(f'{Path(filepath).resolve()}|{file_stats.st_mtime_ns}|{file_stats.st_size}')
+        key_components.append(repr(sorted(configs.items())))
+        return hashlib.blake2b('\n'.join(key_components).encode(), digest_size = 16).hexdigest()
+    
+    
+    def _get(self, key: str) -> Optional[np.ndarray]:
+        with self._lock:
+            if key in self._entries.keys():
+                self._entries.move_to_end(key)
+                data = self._entries[key].copy()
+            else:
+                data = None
+        if (data is None) and (self.spill_dir_path != None):
+            spilled_filepath = self.spill_dir_path.joinpath(f'{key}.npy')
+            if spilled_filepath.is_file():
+                try:
+                    spilled_data = np.load(spilled_filepath)
+                except (OSError, ValueError): # e.g. removed in the meantime by another process
+                    spilled_data = None
+                if spilled_data is not None:
+                    try:
+                        os.utime(spilled_filepath)
+                    except FileNotFoundError:
+                        pass
+                    self._put(key = key, data = spilled_data)
+                    data = spilled_data.copy()
+        return data
+    
+    
+    def _put(self, key: str, data: np.ndarray) -> None:
+        if data.nbytes <= self.max_size_in_bytes:
+            with self._lock:
+                if key not in self._entries.keys():
+                    self._entries[key] = data.copy()
+                    self._current_size_in_bytes += data.nbytes
+                evicted_entries = []
+                while self._current_size_in_bytes > self.max_size_in_bytes:
+                    evicted_key, evicted_data = self._entries.popitem(last = False)
+                    self._current_size_in_bytes -= evicted_data.nbytes
+                    evicted_entries.append((evicted_key, evicted_data))
+            for evicted_key, evicted_data in evicted_entries:
+                self._spill_to_disk(key = evicted_key, data = evicted_data)
+                
+                
+    def _spill_to_disk(self, key: str, data: np.ndarray) -> None:
+        if (self.spill_dir_path != None) and (data.nbytes <= self.max_spill_size_in_bytes):
+            spilled_filepath = self.spill_dir_path.joinpath(f'{key}.npy')
+            if spilled_filepath.is_file() == False:
+                temp_filepath = self.spill_dir_path.joinpath(f'{key}.{os.getpid()}.tmp')
+                with open(temp_filepath, 'wb') as temp_file:
+                    np.save(temp_file, data)
+                os.replace(temp_filepath, spilled_filepath)
+            # remove the least recently used files, until the size of the spill directory is within its limit again
+            # (other worker processes share the spill directory, so files may vanish at any time in between):
+            spilled_files = []
+            for filepath in self.spill_dir_path.glob('*.npy'):
+                try:
+                    spilled_files.append((filepath, filepath.stat()))
+                except FileNotFoundError:
+                    continue
+            spilled_files.sort(key = lambda spilled_file: spilled_file[1].st_mtime)
+            total_spilled_size_in_bytes = sum([file_stats.st_size for filepath, file_stats in spilled_files])
+            while (total_spilled_size_in_bytes > self.max_spill_size_in_bytes) and (len(spilled_files) > 0):
+                oldest_filepath, oldest_file_stats = spilled_files.pop(0)
+                total_spilled_size_in_bytes -= oldest_file_stats.st_size
+                oldest_filepath.unlink(missing_ok = True)
+
+
+decoded_data_cache = DecodedDataCache()
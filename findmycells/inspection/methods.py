@@ -57,18 +57,18 @@ class InspectionMethod(ABC):
     
     def _load_preprocessed_image(self) -> np.ndarray:
         preprocessed_images_dir_path = self.database.project_configs.root_dir.joinpath(self.database.preprocessed_images_dir)
-        preprocessed_image = utils.load_zstack_as_array_from_single_planes(path = preprocessed_images_dir_path, file_id = self.file_id)
+        preprocessed_image = self.database.load_zstack(dir_path = preprocessed_images_dir_path, file_id = self.file_id, memory_mapped = True)
         if type(self.plane_idx) == int:
             preprocessed_image = preprocessed_image[self.plane_idx]
-        return preprocessed_image
+        return np.asarray(preprocessed_image)
 
 
     def _load_postprocessed_segmentation_mask(self) -> np.ndarray:
         postprocessed_masks_dir_path = self.database.project_configs.root_dir.joinpath(self.database.quantified_segmentations_dir, self.area_roi_id)
-        postprocessed_mask = utils.load_zstack_as_array_from_single_planes(path = postprocessed_masks_dir_path, file_id = self.file_id)
+        postprocessed_mask = self.database.load_zstack(dir_path = postprocessed_masks_dir_path, file_id = self.file_id, memory_mapped = True)
         if type(self.plane_idx) == int:
             postprocessed_mask = postprocessed_mask[self.plane_idx]
-        return postprocessed_mask
+        return np.asarray(postprocessed_mask)
     
       
     def _create_rgb_color_coded_2d_overlay_of_image_and_mask(self) -> np.ndarray:
@@ -1,19 +1,23 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/api/03_interfaces.ipynb.
 
 # %% auto 0
-__all__ = ['GUI_SPACER', 'API', 'StrategyConfigurator', 'PageButtonBundle', 'SettingsPage', 'ProcessingStepPage',
+__all__ = ['GUI_SPACER', 'Autosaver', 'API', 'StrategyConfigurator', 'PageButtonBundle', 'SettingsPage', 'ProcessingStepPage',
            'InspectionPage', 'GUI', 'launch_gui']
 
 # %% ../nbs/api/03_interfaces.ipynb 2
 from abc import ABC, abstractmethod
 from pathlib import Path, PosixPath, WindowsPath
 import pathlib
-from typing import List, Dict, Tuple, Optional, Union, Any
+from typing import List, Dict, Tuple, Optional, Union, Any, Callable
 from traitlets.traitlets import MetaHasTraits as WidgetType
 
 import os
 import pickle
 import random
+import shutil
+import time
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import pandas as pd
 from datetime import datetime
 import ipywidgets as w
@@ -22,7 +26,7 @@ from ipyfilechooser import FileChooser
 from tqdm.notebook import tqdm
 
 from .configs import ProjectConfigs
-from .database import Database
+from .database import Database, DatabaseStore, decoded_data_cache
 from .core import ProcessingStrategy, ProcessingObject
 from .preprocessing.specs import PreprocessingStrategy, PreprocessingObject
 from .segmentation.specs import SegmentationStrategy, SegmentationObject
@@ -31,7 +35,50 @@ from .quantification.specs import QuantificationStrategy, QuantificationObject
 from .inspection.methods import InspectionMethod
 from . import utils
 
-# %% ../nbs/api/03_interfaces.ipynb 6
+# %% ../nbs/api/03_interfaces.ipynb 3
+class Autosaver:
+    
+    """
+    Saves the progress of a processing step according to the "autosave" and "autosave_policy" 
+    processing configs: after every N processed files, after every T seconds, or only once all 
+    files are processed. In either case, the progress is also saved if an exception is raised 
+    during processing. Saving only writes the changes since the last save (see `DatabaseStore`) 
+    and does not reload any data.
+    """
+    
+    def __init__(self, api: 'API', processing_configs: Dict) -> None:
+        self.api = api
+        self.enabled = processing_configs['autosave']
+        self.policy = processing_configs['autosave_policy']
+        self.interval = processing_configs['autosave_interval']
+        self.files_since_last_save = 0
+        self.time_of_last_save = time.monotonic()
+        
+        
+    def __enter__(self) -> 'Autosaver':
+        return self
+    
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if self.enabled == True:
+            self.save()
+            
+            
+    def files_processed(self, file_count: int=1) -> None:
+        self.files_since_last_save += file_count
+        if self.enabled == True:
+            if (self.policy == 'every N files') and (self.files_since_last_save >= self.interval):
+                self.save()
+            elif (self.policy == 'every T seconds') and (time.monotonic() - self.time_of_last_save >= self.interval):
+                self.save()
+                
+                
+    def save(self) -> None:
+        self.api.save_status()
+        self.files_since_last_save = 0
+        self.time_of_last_save = time.monotonic()
+
+# %% ../nbs/api/03_interfaces.ipynb 7
 class API:
     
     """
@@ -80,16 +127,60 @@ class API:
     
     
     
+    def set_intermediate_storage_format(self,
+                                        storage_format: str='npy' # "npy", "zarr", or "png"
+                                       ) -> None:
+        """
+        Specifies the format in which intermediate results (i.e. preprocessed images and segmentation 
+        masks) will be saved: a single (memory-mappable) NumPy file per file ID ("npy"), a compressed 
+        Zarr array per file ID ("zarr"), or one PNG file per plane ("png"), as in previous versions 
+        of *findmycells*. Results that were already saved in any of these formats remain readable.
+        """
+        assert storage_format in ['npy', 'zarr', 'png'], f'"storage_format" has to be "npy", "zarr", or "png", not {storage_format}!'
+        self.project_configs.intermediate_storage_format = storage_format
+    
+    
+    def enable_data_cache(self,
+                          max_cache_size_in_mb: int=1024, # maximal size of all decoded arrays that are kept in memory
+                          spill_to_disk: bool=False, # whether arrays that are evicted from memory shall be saved in a hidden cache directory
+                          max_spill_size_in_mb: int=4096 # maximal size of the cache directory, if "spill_to_disk" = True
+                         ) -> None:
+        """
+        Enables an in-memory cache of decoded image data (microscopy images, preprocessed images, and
+        segmentation masks), which speeds up repeated loading of the same files, e.g. when re-running the 
+        preprocessing with different configs, or when inspecting results. Files that were modified in 
+        the meantime will always be read again. Optionally, arrays that have to be evicted from memory 
+        can be spilled into a hidden ".findmycells_cache" directory within the project root directory.
+        Note: the cache is not saved with the project and has to be enabled again in every session.
+        """
+        if spill_to_disk == True:
+            spill_dir_path = self.project_configs.root_dir.joinpath('.findmycells_cache')
+        else:
+            spill_dir_path = None
+        decoded_data_cache.configure(max_size_in_bytes = max_cache_size_in_mb * 1024**2,
+                                     spill_dir_path = spill_dir_path,
+                                     max_spill_size_in_bytes = max_spill_size_in_mb * 1024**2)
+        
+        
+    def disable_data_cache(self) -> None:
+        """
+        Disables the cache of decoded image data (see `API.enable_data_cache()`) and removes all 
+        of its entries, including the ".findmycells_cache" directory, if it exists.
+        """
+        decoded_data_cache.configure(max_size_in_bytes = 0)
+        spill_dir_path = self.project_configs.root_dir.joinpath('.findmycells_cache')
+        if spill_dir_path.is_dir() == True:
+            shutil.rmtree(spill_dir_path)
+    
+    
     def save_status(self) -> None:
         """
         Saves the current status of the *findmycells* project in the project root directory. 
-        The data will be split into two files and current date will be used as prefix.
+        All data are stored in a single, indexed database file (see `DatabaseStore`), in which 
+        only the entries that changed since the last save will be updated.
         """
-        date = f'{datetime.now():%Y_%m_%d}'
-        dbase_filename = f'{date}_findmycells_database.dbase'
-        self._save_attr_to_disk(attr_id = 'database', filename = dbase_filename, child_attr_ids_to_del = ['project_configs'])
-        configs_filename = f'{date}_findmycells_project.configs'
-        self._save_attr_to_disk(attr_id = 'project_configs', filename = configs_filename, child_attr_ids_to_del = ['available_processing_modules'])
+        database_store = DatabaseStore(root_dir = self.project_configs.root_dir)
+        database_store.save(database = self.database, project_configs = self.project_configs)
         
         
     def load_status(self,
@@ -97,30 +188,26 @@ class API:
                     database_filepath: Optional[Union[PosixPath, WindowsPath]]=None
                    ) -> None:
         """
-        Loads the project status of a *findmycells* project from the two files (see save_status()) 
-        from the project root directory.
+        Loads the project status of a *findmycells* project from the project root directory (see save_status()). 
+        Projects that were saved as ".configs" and ".dbase" files with previous versions of *findmycells* 
+        can still be loaded by specifying the respective filepaths, or if no database file is present yet.
         """
         if type(Path("test")) == pathlib.PosixPath:
             pathlib.WindowsPath = pathlib.PosixPath
-        if project_configs_filepath != None:
-            assert type(project_configs_filepath) in [PosixPath, WindowsPath], '"project_configs_filepath" must be pathlib.Path object referring to a .configs file.'
-            assert project_configs_filepath.suffix == '.configs', '"project_configs_filepath" must be pathlib.Path object referring to a .configs file.'
-        else:
-            project_configs_filepath = self._look_for_latest_status_file_in_dir(suffix = '.configs', dir_path = self.project_configs.root_dir)
-        if database_filepath != None:
-            assert type(database_filepath) in [PosixPath, WindowsPath], '"database_filepath" must be pathlib.Path object referring to a .dbase file'
-            assert database_filepath.suffix == '.dbase', '"database_filepath" must be pathlib.Path object referring to a .dbase file'
+        database_store = DatabaseStore(root_dir = self.project_configs.root_dir)
+        if (project_configs_filepath == None) and (database_filepath == None) and database_store.filepath.is_file():
+            project_configs, database = database_store.load()
         else:
-            database_filepath = self._look_for_latest_status_file_in_dir(suffix = '.dbase', dir_path = self.project_configs.root_dir)
+            project_configs, database = self._load_status_from_pickled_files(project_configs_filepath = project_configs_filepath,
+                                                                             database_filepath = database_filepath)
         old_root_dir = self.project_configs.root_dir
         if hasattr(self, 'project_configs'):
             delattr(self, 'project_configs')
         if hasattr(self, 'database'):
             delattr(self, 'database')
-        self.project_configs = self._load_object_from_filepath(filepath = project_configs_filepath)
-        self.project_configs.load_available_processing_modules()
+        self.project_configs = project_configs
         self.project_configs.root_dir = old_root_dir
-        self.database = self._load_object_from_filepath(filepath = database_filepath)
+        self.database = database
         setattr(self.database, 'project_configs', self.project_configs)
         
         
@@ -144,18 +231,58 @@ class API:
         self._assert_reader_configs_are_present()
         microscopy_reader_configs = getattr(self.project_configs, 'microscopy_images')
         roi_reader_configs = getattr(self.project_configs, 'rois')
-        for file_id in tqdm(file_ids, display = processing_configs['show_progress']):
-            preprocessing_object = PreprocessingObject()
-            preprocessing_object.prepare_for_processing(file_ids = [file_id], database = self.database)
-            preprocessing_object.load_image_and_rois(microscopy_reader_configs = microscopy_reader_configs, roi_reader_configs = roi_reader_configs)
-            preprocessing_object.run_all_strategies(strategies = strategies, strategy_configs = strategy_configs)
-            preprocessing_object.save_preprocessed_images_on_disk()
-            preprocessing_object.save_preprocessed_rois_in_database()
-            preprocessing_object.update_database(mark_as_completed = True)
-            del preprocessing_object
-            if processing_configs['autosave'] == True:
-                self.save_status()
-                self.load_status()    
+        if processing_configs.get('tiled_processing', False) == True:
+            self._assert_tiled_processing_is_supported(strategies = strategies)
+            tile_size = processing_configs['tile_size']
+        else:
+            tile_size = None
+        preprocess_file = partial(self._preprocess_file,
+                                  strategies = strategies,
+                                  strategy_configs = strategy_configs,
+                                  microscopy_reader_configs = microscopy_reader_configs,
+                                  roi_reader_configs = roi_reader_configs,
+                                  tile_size = tile_size)
+        with Autosaver(api = self, processing_configs = processing_configs) as autosaver:
+            self._process_files(process_file = preprocess_file,
+                                file_ids = file_ids,
+                                processing_configs = processing_configs,
+                                autosaver = autosaver)
+    
+    
+    def _assert_tiled_processing_is_supported(self, strategies: List[PreprocessingStrategy]) -> None:
+        for strategy in strategies:
+            assert strategy().supports_tiled_processing == True, f'{strategy.__name__} does not support tiled processing!'
+        storage_format = getattr(self.project_configs, 'intermediate_storage_format', 'png')
+        assert storage_format in ['npy', 'zarr'], ('Tiled processing writes the preprocessed images tile by tile and therefore requires '
+                                                   f'"npy" or "zarr" as "intermediate_storage_format", not "{storage_format}"!')
+    
+    
+    @staticmethod
+    def _preprocess_file(file_id: str,
+                         database: Database,
+                         strategies: List[PreprocessingStrategy],
+                         strategy_configs: List[Dict],
+                         microscopy_reader_configs: Dict,
+                         roi_reader_configs: Dict,
+                         tile_size: Optional[int]=None
+                        ) -> Database:
+        """
+        Preprocesses a single file and returns the updated database. Defined as staticmethod, 
+        such that it can also be executed in a separate worker process on a database subset.
+        """
+        preprocessing_object = PreprocessingObject()
+        preprocessing_object.prepare_for_processing(file_ids = [file_id], database = database)
+        preprocessing_object.load_image_and_rois(microscopy_reader_configs = microscopy_reader_configs, 
+                                                 roi_reader_configs = roi_reader_configs,
+                                                 strategies = strategies,
+                                                 strategy_configs = strategy_configs,
+                                                 tile_size = tile_size)
+        preprocessing_object.run_all_strategies(strategies = strategies, strategy_configs = strategy_configs)
+        preprocessing_object.save_preprocessed_images_on_disk()
+        preprocessing_object.save_preprocessed_rois_in_database()
+        preprocessing_object.update_database(mark_as_completed = True)
+        del preprocessing_object
+        return database
     
     
     def segment(self,
@@ -176,16 +303,19 @@ class API:
                                                                                        processing_configs = processing_configs,
                                                                                        file_ids = file_ids)
         file_ids_per_batch = self._split_file_ids_into_batches(file_ids = file_ids, batch_size = processing_configs['batch_size'])
-        if processing_configs['run_strategies_individually'] == True:
-            self._segment_running_strategies_individually(strategies = strategies,
-                                                          strategy_configs = strategy_configs,
-                                                          processing_configs = processing_configs,
-                                                          file_ids_per_batch = file_ids_per_batch)
-        else:
-            self._segment_running_strategies_consecutively(strategies = strategies,
-                                                           strategy_configs = strategy_configs,
-                                                           processing_configs = processing_configs,
-                                                           file_ids_per_batch = file_ids_per_batch)
+        with Autosaver(api = self, processing_configs = processing_configs) as autosaver:
+            if processing_configs['run_strategies_individually'] == True:
+                self._segment_running_strategies_individually(strategies = strategies,
+                                                              strategy_configs = strategy_configs,
+                                                              processing_configs = processing_configs,
+                                                              file_ids_per_batch = file_ids_per_batch,
+                                                              autosaver = autosaver)
+            else:
+                self._segment_running_strategies_consecutively(strategies = strategies,
+                                                               strategy_configs = strategy_configs,
+                                                               processing_configs = processing_configs,
+                                                               file_ids_per_batch = file_ids_per_batch,
+                                                               autosaver = autosaver)
         if processing_configs['clear_tmp_data'] == True:
             all_files_done = self._check_if_all_files_have_finished_current_processing_step(processing_step_id = processing_step_id)
             if all_files_done == True:
@@ -213,17 +343,36 @@ class API:
                                                                                        strategy_configs = strategy_configs,
                                                                                        processing_configs = processing_configs,
                                                                                        file_ids = file_ids)
-        for file_id in tqdm(file_ids, display = processing_configs['show_progress']):
-            postprocessing_object = PostprocessingObject()
-            postprocessing_object.prepare_for_processing(file_ids = [file_id], database = self.database)
-            postprocessing_object.load_segmentations_masks_for_postprocessing(segmentations_to_use = processing_configs['segmentations_to_use'])
-            postprocessing_object.run_all_strategies(strategies = strategies, strategy_configs = strategy_configs)
-            postprocessing_object.save_postprocessed_segmentations()
-            postprocessing_object.update_database(mark_as_completed = True)
-            del postprocessing_object
-            if processing_configs['autosave'] == True:
-                self.save_status()
-                self.load_status()    
+        postprocess_file = partial(self._postprocess_file,
+                                   strategies = strategies,
+                                   strategy_configs = strategy_configs,
+                                   segmentations_to_use = processing_configs['segmentations_to_use'])
+        with Autosaver(api = self, processing_configs = processing_configs) as autosaver:
+            self._process_files(process_file = postprocess_file,
+                                file_ids = file_ids,
+                                processing_configs = processing_configs,
+                                autosaver = autosaver)
+    
+    
+    @staticmethod
+    def _postprocess_file(file_id: str,
+                          database: Database,
+                          strategies: List[PostprocessingStrategy],
+                          strategy_configs: List[Dict],
+                          segmentations_to_use: str
+                         ) -> Database:
+        """
+        Postprocesses a single file and returns the updated database. Defined as staticmethod, 
+        such that it can also be executed in a separate worker process on a database subset.
+        """
+        postprocessing_object = PostprocessingObject()
+        postprocessing_object.prepare_for_processing(file_ids = [file_id], database = database)
+        postprocessing_object.load_segmentations_masks_for_postprocessing(segmentations_to_use = segmentations_to_use)
+        postprocessing_object.run_all_strategies(strategies = strategies, strategy_configs = strategy_configs)
+        postprocessing_object.save_postprocessed_segmentations()
+        postprocessing_object.update_database(mark_as_completed = True)
+        del postprocessing_object
+        return database
     
     
     def quantify(self,
@@ -243,15 +392,120 @@ class API:
                                                                                        strategy_configs = strategy_configs,
                                                                                        processing_configs = processing_configs,
                                                                                        file_ids = file_ids)
-        for file_id in tqdm(file_ids, display = processing_configs['show_progress']):
-            quantification_object = QuantificationObject()
-            quantification_object.prepare_for_processing(file_ids = [file_id], database = self.database)
-            quantification_object.run_all_strategies(strategies = strategies, strategy_configs = strategy_configs)
-            quantification_object.update_database(mark_as_completed = True)
-            del quantification_object
-            if processing_configs['autosave'] == True:
-                self.save_status()
-                self.load_status()
+        quantify_file = partial(self._quantify_file, strategies = strategies, strategy_configs = strategy_configs)
+        with Autosaver(api = self, processing_configs = processing_configs) as autosaver:
+            self._process_files(process_file = quantify_file,
+                                file_ids = file_ids,
+                                processing_configs = processing_configs,
+                                autosaver = autosaver,
+                                merge_in_bulk = True)
+                
+                
+    @staticmethod
+    def _quantify_file(file_id: str,
+                       database: Database,
+                       strategies: List[QuantificationStrategy],
+                       strategy_configs: List[Dict]
+                      ) -> Database:
+        """
+        Quantifies a single file and returns the updated database. Defined as staticmethod, 
+        such that it can also be executed in a separate worker process on a database subset.
+        """
+        quantification_object = QuantificationObject()
+        quantification_object.prepare_for_processing(file_ids = [file_id], database = database)
+        quantification_object.run_all_strategies(strategies = strategies, strategy_configs = strategy_configs)
+        quantification_object.update_database(mark_as_completed = True)
+        del quantification_object
+        return database
+                
+                
+    def run_pipeline(self,
+                     strategies: Dict[str, List[ProcessingStrategy]], # keys: "preprocessing", "segmentation", "postprocessing", and "quantification"
+                     strategy_configs: Optional[Dict[str, List[Dict]]]=None,
+                     processing_configs: Optional[Dict[str, Dict]]=None,
+                     file_ids: Optional[List[str]]=None
+                    ) -> None:
+        """
+        Runs all processing steps (preprocessing, segmentation, postprocessing, and quantification) 
+        one after the other. Strategies, strategy configs, and processing configs are specified like 
+        for the individual processing methods, but as dictionaries with the processing step IDs as keys. 
+        Preprocessing and segmentation are run just like `API.preprocess()` and `API.segment()`, since 
+        the segmentation strategies (e.g. deepflash2) process batches of files on disk. Files that are 
+        both postprocessed and quantified are then passed from postprocessing to quantification in 
+        memory, which saves reloading their postprocessed segmentations. For these files, the processing 
+        configs of postprocessing apply (e.g. "n_workers", autosaving, and "show_progress"), whereas 
+        files that are only postprocessed or only quantified use the processing configs of their step.
+        """
+        processing_step_ids = ['preprocessing', 'segmentation', 'postprocessing', 'quantification']
+        assert type(strategies) == dict, '"strategies" has to be a dictionary with a list of strategies for each processing step!'
+        for processing_step_id in processing_step_ids:
+            assert processing_step_id in strategies.keys(), f'No strategies specified for "{processing_step_id}"!'
+        if strategy_configs == None:
+            strategy_configs = {}
+        if processing_configs == None:
+            processing_configs = {}
+        strategy_configs_per_step, processing_configs_per_step, file_ids_per_step = {}, {}, {}
+        for processing_step_id in processing_step_ids:
+            step_strategy_configs, step_processing_configs, step_file_ids = self._assert_and_update_input(processing_step_id = processing_step_id,
+                                                                                                          strategies = strategies[processing_step_id],
+                                                                                                          strategy_configs = strategy_configs.get(processing_step_id),
+                                                                                                          processing_configs = processing_configs.get(processing_step_id),
+                                                                                                          file_ids = file_ids)
+            strategy_configs_per_step[processing_step_id] = step_strategy_configs
+            processing_configs_per_step[processing_step_id] = step_processing_configs
+            file_ids_per_step[processing_step_id] = step_file_ids.copy()
+        file_ids_to_postprocess_and_quantify = [file_id for file_id in file_ids_per_step['postprocessing'] if file_id in file_ids_per_step['quantification']]
+        for processing_step_id in ['postprocessing', 'quantification']:
+            file_ids_per_step[processing_step_id] = [file_id for file_id in file_ids_per_step[processing_step_id] if file_id not in file_ids_to_postprocess_and_quantify]
+        processing_methods = {'preprocessing': self.preprocess, 'segmentation': self.segment, 'postprocessing': self.postprocess, 'quantification': self.quantify}
+        for processing_step_id in processing_step_ids:
+            if len(file_ids_per_step[processing_step_id]) > 0:
+                processing_methods[processing_step_id](strategies = strategies[processing_step_id],
+                                                       strategy_configs = strategy_configs_per_step[processing_step_id],
+                                                       processing_configs = processing_configs_per_step[processing_step_id],
+                                                       file_ids = file_ids_per_step[processing_step_id])
+            if (processing_step_id == 'postprocessing') and (len(file_ids_to_postprocess_and_quantify) > 0):
+                postprocess_and_quantify_file = partial(self._postprocess_and_quantify_file,
+                                                        postprocessing_strategies = strategies['postprocessing'],
+                                                        postprocessing_strategy_configs = strategy_configs_per_step['postprocessing'],
+                                                        segmentations_to_use = processing_configs_per_step['postprocessing']['segmentations_to_use'],
+                                                        quantification_strategies = strategies['quantification'],
+                                                        quantification_strategy_configs = strategy_configs_per_step['quantification'])
+                with Autosaver(api = self, processing_configs = processing_configs_per_step['postprocessing']) as autosaver:
+                    self._process_files(process_file = postprocess_and_quantify_file,
+                                        file_ids = file_ids_to_postprocess_and_quantify,
+                                        processing_configs = processing_configs_per_step['postprocessing'],
+                                        autosaver = autosaver)
+                
+                
+    @staticmethod
+    def _postprocess_and_quantify_file(file_id: str,
+                                       database: Database,
+                                       postprocessing_strategies: List[PostprocessingStrategy],
+                                       postprocessing_strategy_configs: List[Dict],
+                                       segmentations_to_use: str,
+                                       quantification_strategies: List[QuantificationStrategy],
+                                       quantification_strategy_configs: List[Dict]
+                                      ) -> Database:
+        """
+        Postprocesses and quantifies a single file and returns the updated database. The postprocessed 
+        segmentations are passed to quantification in memory, instead of being reloaded from disk. Defined 
+        as staticmethod, such that it can also be executed in a separate worker process on a database subset.
+        """
+        postprocessing_object = PostprocessingObject()
+        postprocessing_object.prepare_for_processing(file_ids = [file_id], database = database)
+        postprocessing_object.load_segmentations_masks_for_postprocessing(segmentations_to_use = segmentations_to_use)
+        postprocessing_object.run_all_strategies(strategies = postprocessing_strategies, strategy_configs = postprocessing_strategy_configs)
+        postprocessing_object.save_postprocessed_segmentations()
+        postprocessing_object.update_database(mark_as_completed = True)
+        quantification_object = QuantificationObject()
+        quantification_object.segmentations_per_area_roi_id = postprocessing_object.segmentations_per_area_roi_id
+        del postprocessing_object
+        quantification_object.prepare_for_processing(file_ids = [file_id], database = database)
+        quantification_object.run_all_strategies(strategies = quantification_strategies, strategy_configs = quantification_strategy_configs)
+        quantification_object.update_database(mark_as_completed = True)
+        del quantification_object
+        return database
                 
                 
     def initialize_inspection(self,
@@ -315,7 +569,8 @@ class API:
                                                  strategies: List[SegmentationStrategy],
                                                  strategy_configs: List[Dict],
                                                  processing_configs: Dict,
-                                                 file_ids_per_batch: List[List[str]]
+                                                 file_ids_per_batch: List[List[str]],
+                                                 autosaver: Autosaver
                                                 ) -> None:
         total_strategy_count = len(strategies)
         for i in tqdm(range(total_strategy_count), display = processing_configs['show_progress']):
@@ -333,16 +588,15 @@ class API:
                 else:
                     segmentation_object.update_database(mark_as_completed = False)
                 del segmentation_object
-                if processing_configs['autosave'] == True:
-                    self.save_status()
-                    self.load_status()
+                autosaver.files_processed(file_count = len(batch_file_ids))
 
 
     def _segment_running_strategies_consecutively(self,
                                                   strategies: List[SegmentationStrategy],
                                                   strategy_configs: List[Dict],
                                                   processing_configs: Dict,
-                                                  file_ids_per_batch: List[List[str]]
+                                                  file_ids_per_batch: List[List[str]],
+                                                  autosaver: Autosaver
                                                  ) -> None:
         for batch_file_ids in tqdm(file_ids_per_batch, display = processing_configs['show_progress']):
             segmentation_object = SegmentationObject()
@@ -350,9 +604,70 @@ class API:
             segmentation_object.run_all_strategies(strategies = strategies, strategy_configs = strategy_configs)
             segmentation_object.update_database(mark_as_completed = True)
             del segmentation_object
-            if processing_configs['autosave'] == True:
-                self.save_status()
-                self.load_status()
+            autosaver.files_processed(file_count = len(batch_file_ids))
+                
+
+    def _process_files(self,
+                       process_file: Callable[[str, Database], Database],
+                       file_ids: List[str],
+                       processing_configs: Dict,
+                       autosaver: Autosaver,
+                       merge_in_bulk: bool=False
+                      ) -> None:
+        """
+        Runs "process_file" for each file_id. If the processing configs specify more than one worker 
+        ("n_workers"), the files are processed in parallel worker processes, each on a database subset 
+        that holds only the information of the respective file. The processed subsets are merged back 
+        into the database in the order of "file_ids", regardless of which worker finished first - 
+        either one after the other, or all at once when all workers are done ("merge_in_bulk").
+        If a worker raises, all files that are still pending are cancelled, all subsets that were 
+        already processed are merged nevertheless, and the exception is re-raised afterwards.
+        """
+        if processing_configs.get('n_workers', 1) > 1:
+            finished_database_subsets = {}
+            next_position_to_merge = 0
+            first_exception = None
+            try:
+                with ProcessPoolExecutor(max_workers = processing_configs['n_workers']) as executor:
+                    positions_by_future = {}
+                    for position, file_id in enumerate(file_ids):
+                        database_subset = self.database.get_subset(file_ids = [file_id])
+                        positions_by_future[executor.submit(process_file, file_id, database_subset)] = position
+                    for future in tqdm(as_completed(positions_by_future),
+                                       total = len(file_ids),
+                                       display = processing_configs['show_progress']):
+                        if future.cancelled() == True:
+                            continue
+                        if future.exception() != None:
+                            if first_exception == None:
+                                first_exception = future.exception()
+                                for pending_future in positions_by_future.keys():
+                                    pending_future.cancel()
+                            continue
+                        finished_database_subsets[positions_by_future[future]] = future.result()
+                        if (merge_in_bulk == False) and (first_exception == None):
+                            while next_position_to_merge in finished_database_subsets.keys():
+                                self.database.merge_subset(subset = finished_database_subsets.pop(next_position_to_merge))
+                                autosaver.files_processed()
+                                next_position_to_merge += 1
+            finally:
+                # merge whatever finished but was not merged yet (all subsets in bulk mode, or those 
+                # that were held back by a failed or cancelled file), still in the order of file_ids:
+                remaining_database_subsets = [finished_database_subsets[position] for position in sorted(finished_database_subsets.keys())]
+                if len(remaining_database_subsets) > 0:
+                    if merge_in_bulk == True:
+                        self.database.merge_subsets(subsets = remaining_database_subsets)
+                        autosaver.files_processed(file_count = len(remaining_database_subsets))
+                    else:
+                        for processed_database_subset in remaining_database_subsets:
+                            self.database.merge_subset(subset = processed_database_subset)
+                            autosaver.files_processed()
+            if first_exception != None:
+                raise first_exception
+        else:
+            for file_id in tqdm(file_ids, display = processing_configs['show_progress']):
+                process_file(file_id, self.database)
+                autosaver.files_processed()
                 
 
     def _check_if_all_files_have_finished_current_processing_step(self, processing_step_id: str) -> bool:
@@ -368,15 +683,25 @@ class API:
 
         
     
-    def _save_attr_to_disk(self, attr_id: str, filename: str, child_attr_ids_to_del: List[str]) -> None:
-        filepath = self.project_configs.root_dir.joinpath(filename)
-        attribute_to_save = getattr(self, attr_id)
-        for attr_id_to_del in child_attr_ids_to_del:
-            delattr(attribute_to_save, attr_id_to_del)
-        filehandler = open(filepath, 'wb')
-        pickle.dump(attribute_to_save, filehandler)
-
-        
+    def _load_status_from_pickled_files(self,
+                                        project_configs_filepath: Optional[Union[PosixPath, WindowsPath]],
+                                        database_filepath: Optional[Union[PosixPath, WindowsPath]]
+                                       ) -> Tuple[ProjectConfigs, Database]:
+        if project_configs_filepath != None:
+            assert type(project_configs_filepath) in [PosixPath, WindowsPath], '"project_configs_filepath" must be pathlib.Path object referring to a .configs file.'
+            assert project_configs_filepath.suffix == '.configs', '"project_configs_filepath" must be pathlib.Path object referring to a .configs file.'
+        else:
+            project_configs_filepath = self._look_for_latest_status_file_in_dir(suffix = '.configs', dir_path = self.project_configs.root_dir)
+        if database_filepath != None:
+            assert type(database_filepath) in [PosixPath, WindowsPath], '"database_filepath" must be pathlib.Path object referring to a .dbase file'
+            assert database_filepath.suffix == '.dbase', '"database_filepath" must be pathlib.Path object referring to a .dbase file'
+        else:
+            database_filepath = self._look_for_latest_status_file_in_dir(suffix = '.dbase', dir_path = self.project_configs.root_dir)
+        project_configs = self._load_object_from_filepath(filepath = project_configs_filepath)
+        database = self._load_object_from_filepath(filepath = database_filepath)
+        return project_configs, database
+    
+    
     def _load_object_from_filepath(self, filepath: Union[PosixPath, WindowsPath]) -> Union[Database, ProjectConfigs]:
         filehandler = open(filepath, 'rb')
         loaded_object = pickle.load(filehandler)
@@ -498,10 +823,10 @@ class API:
                 all_final_configs.append(full_configs)
         return all_final_configs
 
-# %% ../nbs/api/03_interfaces.ipynb 23
+# %% ../nbs/api/03_interfaces.ipynb 25
 GUI_SPACER = w.Label(value = '', layout = {'height': '30px'})
 
-# %% ../nbs/api/03_interfaces.ipynb 24
+# %% ../nbs/api/03_interfaces.ipynb 26
 class StrategyConfigurator:
     
     """
@@ -652,7 +977,7 @@ class StrategyConfigurator:
         new_selection = change.new
         self.displayed_strat_widget.children = (new_selection.widget, )
 
-# %% ../nbs/api/03_interfaces.ipynb 26
+# %% ../nbs/api/03_interfaces.ipynb 28
 class PageButtonBundle(ABC):
     
     
@@ -683,7 +1008,7 @@ class PageButtonBundle(ABC):
         self.navigator_button.style.button_color = 'skyblue'
         self.gui_page_screen.children = (self.page_content, self.displayed_output)
 
-# %% ../nbs/api/03_interfaces.ipynb 28
+# %% ../nbs/api/03_interfaces.ipynb 30
 class SettingsPage(PageButtonBundle):
     
     """
@@ -891,8 +1216,8 @@ class SettingsPage(PageButtonBundle):
         save_description = w.HTML(value = ('Clicking the following "save" button will save '
                                            'your current project, including all configurations '
                                            'and processing progress. The file will automatically '
-                                           'be written as a ".configs" file to the root directory '
-                                           'you specified, with the current date as prefix.'))
+                                           'be written as a ".fmcdb" file to the root directory '
+                                           'you specified.'))
         self.save_project_button = w.Button(description = 'save project', icon = 'save')
         save_project_widget = w.VBox([save_description, self.save_project_button])
         return save_project_widget
@@ -1025,7 +1350,6 @@ class SettingsPage(PageButtonBundle):
             
     def _save_project_button_clicked(self, b) -> None:
         self.api.save_status()
-        self.api.load_status()
     
     
     def _load_project_button_clicked(self, b) -> None:
@@ -1088,7 +1412,7 @@ class SettingsPage(PageButtonBundle):
             self.processing_step_details_output.clear_output()
             display(processing_step_settings_df)
 
-# %% ../nbs/api/03_interfaces.ipynb 30
+# %% ../nbs/api/03_interfaces.ipynb 32
 class ProcessingStepPage(PageButtonBundle):
     
         
@@ -1240,7 +1564,7 @@ class ProcessingStepPage(PageButtonBundle):
             options = ['Please load files to your project first']
             value = ('Please load files to your project first', 'Please load files to your project first')
 
-# %% ../nbs/api/03_interfaces.ipynb 32
+# %% ../nbs/api/03_interfaces.ipynb 34
 class InspectionPage(PageButtonBundle):
     
     
@@ -1419,7 +1743,7 @@ class InspectionPage(PageButtonBundle):
             self.output_multi_match.clear_output()
             print(f'x: {int(x_coord)}, and y: {int(y_coord)}')
 
-# %% ../nbs/api/03_interfaces.ipynb 34
+# %% ../nbs/api/03_interfaces.ipynb 36
 class GUI:
     
     @property
@@ -1527,7 +1851,7 @@ class GUI:
     def _refresh_displayed_widget(self, new_widget: WidgetType) -> None:
         self.displayed_widget.children = (new_widget, )
 
-# %% ../nbs/api/03_interfaces.ipynb 38
+# %% ../nbs/api/03_interfaces.ipynb 40
 def launch_gui(project_root_dir: Optional[Union[PosixPath, WindowsPath]]=None) -> GUI:
     """
     Function to launch the GUI of *findmycells*. Comes, however, 
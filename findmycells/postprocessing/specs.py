@@ -6,7 +6,6 @@ __all__ = ['PostprocessingStrategy', 'PostprocessingObject']
 # %% ../../nbs/api/07_postprocessing_00_specs.ipynb 2
 from abc import abstractmethod
 from typing import Dict, List
-from skimage import io
 
 from ..core import ProcessingObject, ProcessingStrategy
 from ..configs import DefaultConfigs
@@ -39,6 +38,9 @@ class PostprocessingObject(ProcessingObject):
         widget_names = {'segmentations_to_use': 'Dropdown',
                         'overwrite': 'Checkbox',
                         'autosave': 'Checkbox',
+                        'autosave_policy': 'Dropdown',
+                        'autosave_interval': 'BoundedIntText',
+                        'n_workers': 'BoundedIntText',
                         'show_progress': 'Checkbox'}
         return widget_names
 
@@ -46,7 +48,10 @@ class PostprocessingObject(ProcessingObject):
     def descriptions(self):
         descriptions = {'segmentations_to_use': 'continue with semantic or instance segmentations',
                         'overwrite': 'overwrite previously processed files',
-                        'autosave': 'autosave progress after each file',
+                        'autosave': 'autosave progress',
+                        'autosave_policy': 'when to autosave progress (also upon errors)',
+                        'autosave_interval': 'autosave interval (N files or T seconds)',
+                        'n_workers': 'number of files to process in parallel',
                         'show_progress': 'show progress bar and estimated computation time'}
         return descriptions
     
@@ -59,14 +64,24 @@ class PostprocessingObject(ProcessingObject):
         default_values = {'segmentations_to_use': 'instance',
                           'overwrite': False,
                           'autosave': True,
+                          'autosave_policy': 'every N files',
+                          'autosave_interval': 1,
+                          'n_workers': 1,
                           'show_progress': True}
         valid_types = {'segmentations_to_use': [str],
                        'overwrite': [bool],
                        'autosave': [bool],
+                       'autosave_policy': [str],
+                       'autosave_interval': [int],
+                       'n_workers': [int],
                        'show_progress': [bool]}
-        valid_options = {'segmentations_to_use': ('semantic', 'instance')}
+        valid_value_ranges = {'autosave_interval': (1, 3600, 1),
+                              'n_workers': (1, 64, 1)}
+        valid_options = {'segmentations_to_use': ('semantic', 'instance'),
+                         'autosave_policy': ('every N files', 'every T seconds', 'on completion or exception')}
         default_configs = DefaultConfigs(default_values = default_values,
                                          valid_types = valid_types,
+                                         valid_value_ranges = valid_value_ranges,
                                          valid_value_options = valid_options)
         return default_configs
     
@@ -76,6 +91,7 @@ class PostprocessingObject(ProcessingObject):
         self.file_info = self.database.get_file_infos(file_id = self.file_id)
         self.rois_dict = self.database.area_rois_for_quantification[self.file_id]
         self.segmentations_per_area_roi_id = {}
+        self.label_geometry_index = None
         
         
     def load_segmentations_masks_for_postprocessing(self, segmentations_to_use: str) -> None:
@@ -84,18 +100,30 @@ class PostprocessingObject(ProcessingObject):
             masks_dir_path = self.database.project_configs.root_dir.joinpath(self.database.semantic_segmentations_dir)
         else:
             masks_dir_path = self.database.project_configs.root_dir.joinpath(self.database.instance_segmentations_dir)
-        self.postprocessed_segmentations = utils.load_zstack_as_array_from_single_planes(path = masks_dir_path, file_id = self.file_id)
+        self.postprocessed_segmentations = self.database.load_zstack(dir_path = masks_dir_path, file_id = self.file_id)
+            
+            
+    def get_label_geometry_index(self) -> utils.LabelGeometryIndex:
+        """
+        Returns the `LabelGeometryIndex` of the current postprocessed segmentations, such that the bounding boxes 
+        and polygons of all labels are shared between all strategies. A new index is only created, if the 
+        postprocessed segmentations were replaced (strategies that modify them in place have to reset the 
+        affected planes of the index instead).
+        """
+        if (self.label_geometry_index == None) or (self.label_geometry_index.zstack is not self.postprocessed_segmentations):
+            self.label_geometry_index = utils.LabelGeometryIndex(zstack = self.postprocessed_segmentations)
+        return self.label_geometry_index
             
     
     def save_postprocessed_segmentations(self) -> None:
         for area_roi_id in self.segmentations_per_area_roi_id.keys():
-            for plane_index in range(self.segmentations_per_area_roi_id[area_roi_id].shape[0]):
-                image = self.segmentations_per_area_roi_id[area_roi_id][plane_index]
-                target_dir_path = self.database.project_configs.root_dir.joinpath(self.database.quantified_segmentations_dir, area_roi_id)
-                if target_dir_path.is_dir() == False:
-                    target_dir_path.mkdir()
-                filepath = target_dir_path.joinpath(f'{self.file_id}-{str(plane_index).zfill(3)}_postprocessed_segmentations.png')
-                io.imsave(filepath, image, check_contrast=False)
+            target_dir_path = self.database.project_configs.root_dir.joinpath(self.database.quantified_segmentations_dir, area_roi_id)
+            if target_dir_path.is_dir() == False:
+                target_dir_path.mkdir()
+            self.database.save_zstack(zstack = self.segmentations_per_area_roi_id[area_roi_id],
+                                      dir_path = target_dir_path,
+                                      file_id = self.file_id,
+                                      plane_filename_suffix = '_postprocessed_segmentations')
 
 
     def _add_processing_specific_infos_to_updates(self, updates: Dict) -> Dict:
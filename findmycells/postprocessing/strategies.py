@@ -5,6 +5,7 @@ __all__ = ['ReconstructCellsIn3DFrom2DInstanceLabelsStrat', 'FillHolesStrat', 'A
 
 # %% ../../nbs/api/07_postprocessing_01_strategies.ipynb 2
 from typing import Tuple, List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import numpy as np
 from shapely.geometry import Polygon
@@ -49,282 +50,248 @@ class ReconstructCellsIn3DFrom2DInstanceLabelsStrat(PostprocessingStrategy):
         return {}
     
     def run(self, processing_object: PostprocessingObject, strategy_configs: Dict) -> PostprocessingObject:
-        processing_object.postprocessed_segmentations, roi_matching_results = self._run_3d_instance_reconstruction(zstack = processing_object.postprocessed_segmentations,
-                                                                                                                   strategy_configs = strategy_configs)
+        processing_object.postprocessed_segmentations, multi_matches_traceback = self._run_3d_instance_reconstruction(zstack = processing_object.postprocessed_segmentations,
+                                                                                                                      strategy_configs = strategy_configs)
         processing_object.database = self._save_multimatches_traceback_to_database(database = processing_object.database,
                                                                                       file_id = processing_object.file_id,
-                                                                                      results = roi_matching_results)
+                                                                                      multi_matches_traceback = multi_matches_traceback)
         return processing_object
     
     
     def _run_3d_instance_reconstruction(self, zstack: np.ndarray, strategy_configs: Dict) -> Tuple[np.ndarray, Dict]:
-        pad_width, lowest_final_label_id = 1, 2047 # lowest_final_label_id could be made adjustable via strategy_configs (might be usefull if more than 2048 features?)
-        zstack = np.pad(zstack, pad_width = pad_width, mode = 'constant', constant_values = 0)
-        zstack = zstack[pad_width : zstack.shape[0] - pad_width]
+        lowest_final_label_id = 2047 # could be made adjustable via strategy_configs (might be usefull if more than 2048 features?)
         if strategy_configs['show_progress'] == True:
             print('Matching features across planes...')
         roi_matching_results = self._get_plane_to_plane_roi_matching_results(zstack = zstack, verbose = strategy_configs['show_progress'])
         if strategy_configs['show_progress'] == True:
             print('Checking for best and multi matches for all labels per plane...')
-        for plane_id in tqdm(range(zstack.shape[0]), display = strategy_configs['show_progress']):
-            for label_id in roi_matching_results[plane_id].keys():
-                roi_matching_results[plane_id][label_id] = self._find_best_matches(all_results = roi_matching_results, 
-                                                                                   original_plane_id = plane_id,
-                                                                                   original_label_id = label_id)
+        best_matches = self._find_best_matches(matching_results = roi_matching_results, verbose = strategy_configs['show_progress'])
         if strategy_configs['show_progress'] == True:
             print('Applying changes and saving reconstructed results...')
-        final_ids, roi_matching_results = self._get_final_id_assignments(results = roi_matching_results,
-                                                                         lowest_final_label_id = lowest_final_label_id)
-        zstack = utils.unpad_x_y_dims_in_3d_array(padded_3d_array = zstack, pad_width = pad_width)
-        postprocessed_zstack = self._set_new_label_ids(zstack_with_old_label_ids = zstack, new_ids_assignment = final_ids)
-        return postprocessed_zstack, roi_matching_results
+        final_label_ids = self._get_final_id_assignments(best_matches = best_matches, lowest_final_label_id = lowest_final_label_id)
+        postprocessed_zstack = self._set_new_label_ids(zstack_with_old_label_ids = zstack, 
+                                                       label_ids_per_plane = roi_matching_results['label_ids_per_plane'],
+                                                       final_label_ids = final_label_ids)
+        multi_matches_traceback = self._get_multi_matches_traceback(matching_results = roi_matching_results, final_label_ids = final_label_ids)
+        return postprocessed_zstack, multi_matches_traceback
 
 
     def _get_plane_to_plane_roi_matching_results(self, zstack: np.ndarray, verbose: bool) -> Dict:
-        z_dim, x_dim, y_dim = zstack.shape
-        results = {}       
-        for plane_idx in tqdm(range(z_dim), display = verbose):
-            results[plane_idx] = {}
-            if plane_idx == 0:
-                previous_plane_info = (None, 'previous')
-                next_plane_info = (plane_idx + 1, 'next')
-            elif plane_idx == z_dim - 1:
-                previous_plane_info = (plane_idx - 1, 'previous')
-                next_plane_info = (None, 'next')
+        """
+        Determines all pairs of overlapping ROIs in adjacent planes. All ROIs of the z-stack are represented by 
+        consecutive indices (ordered by plane index and label ID), such that all matching results can be kept in 
+        compact arrays: the areas of all ROIs, and for each pair of overlapping ROIs the index of the ROI in the 
+        lower ("source") and in the upper plane ("target"), their IoU, and whether one ROI is fully within the 
+        other. All areas are taken directly from the label rasters: the area of each ROI is its pixel count, and 
+        the overlapping areas of all pairs of ROIs in two adjacent planes are counted at once (see 
+        `_get_overlapping_areas_of_adjacent_planes()`).
+        """
+        label_ids_per_plane, areas_per_plane = [], []
+        for plane_idx in range(zstack.shape[0]):
+            label_ids, label_areas = self._get_label_ids_and_areas(single_plane = zstack[plane_idx])
+            label_ids_per_plane.append(label_ids)
+            areas_per_plane.append(label_areas)
+        plane_offsets = np.cumsum([0] + [label_ids.shape[0] for label_ids in label_ids_per_plane])
+        sources, targets, overlapping_areas = [np.zeros(0, dtype = 'int64')], [np.zeros(0, dtype = 'int64')], [np.zeros(0, dtype = 'int64')]
+        for plane_idx in tqdm(range(zstack.shape[0] - 1), display = verbose):
+            next_plane_idx = plane_idx + 1
+            label_ids, next_plane_label_ids, overlapping_area = self._get_overlapping_areas_of_adjacent_planes(single_plane = zstack[plane_idx], 
+                                                                                                               adjacent_plane = zstack[next_plane_idx])
+            sources.append(plane_offsets[plane_idx] + np.searchsorted(label_ids_per_plane[plane_idx], label_ids))
+            targets.append(plane_offsets[next_plane_idx] + np.searchsorted(label_ids_per_plane[next_plane_idx], next_plane_label_ids))
+            overlapping_areas.append(overlapping_area)
+        areas = np.concatenate([np.zeros(0, dtype = 'int64')] + areas_per_plane)
+        sources, targets, overlapping_areas = np.concatenate(sources), np.concatenate(targets), np.concatenate(overlapping_areas)
+        matching_results = {'label_ids_per_plane': label_ids_per_plane,
+                            'plane_offsets': plane_offsets,
+                            'areas': areas,
+                            'sources': sources,
+                            'targets': targets,
+                            'IoUs': overlapping_areas / (areas[sources] + areas[targets] - overlapping_areas),
+                            'source_within_target': overlapping_areas == areas[sources],
+                            'target_within_source': overlapping_areas == areas[targets]}
+        return matching_results
+    
+    
+    def _get_label_ids_and_areas(self, single_plane: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        label_ids, label_areas = np.unique(single_plane, return_counts = True)
+        foreground = label_ids != 0
+        return label_ids[foreground], label_areas[foreground]
+    
+    
+    def _get_overlapping_areas_of_adjacent_planes(self, single_plane: np.ndarray, adjacent_plane: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Computes the sparse contingency table of the label IDs of two planes, i.e. the overlapping area (in pixels) 
+        of all pairs of labels that overlap with each other. Only pixels that belong to a label in both planes are 
+        considered. The labels of these pixels are mapped to compact indices, such that each pair of labels is 
+        represented by a single integer, and all pairs are counted in one pass. Returns the label IDs of both planes 
+        and the overlapping area of each pair, sorted by the label IDs of "single_plane" and then of "adjacent_plane".
+        """
+        overlap_mask = (single_plane != 0) & (adjacent_plane != 0)
+        label_ids, label_indices = np.unique(single_plane[overlap_mask], return_inverse = True)
+        adjacent_label_ids, adjacent_label_indices = np.unique(adjacent_plane[overlap_mask], return_inverse = True)
+        pair_indices = label_indices.astype('int64') * adjacent_label_ids.shape[0] + adjacent_label_indices
+        if label_ids.shape[0] * adjacent_label_ids.shape[0] <= 2**22: # dense table is small enough
+            overlapping_areas = np.bincount(pair_indices, minlength = label_ids.shape[0] * adjacent_label_ids.shape[0])
+            overlapping_pair_indices = np.flatnonzero(overlapping_areas)
+            overlapping_areas = overlapping_areas[overlapping_pair_indices]
+        else:
+            overlapping_pair_indices, overlapping_areas = np.unique(pair_indices, return_counts = True)
+        return (label_ids[overlapping_pair_indices // adjacent_label_ids.shape[0]], 
+                adjacent_label_ids[overlapping_pair_indices % adjacent_label_ids.shape[0]], 
+                overlapping_areas)
+    
+    
+    def _get_matches_in_adjacent_plane(self, matching_results: Dict, plane_indicator: str) -> Dict:
+        """
+        Groups all pairs of overlapping ROIs by the ROI in the current plane, such that the matches of each ROI in 
+        the previous or next plane ("plane_indicator") are found at "matching_ids[first_index[roi]:first_index[roi + 1]]"
+        (sorted by label ID). Returned as lists, since they are only accessed element-wise.
+        """
+        if plane_indicator == 'next':
+            rois, matching_rois = matching_results['sources'], matching_results['targets']
+            full_overlap, reciprocal_full_overlap = matching_results['source_within_target'], matching_results['target_within_source']
+        else:
+            rois, matching_rois = matching_results['targets'], matching_results['sources']
+            full_overlap, reciprocal_full_overlap = matching_results['target_within_source'], matching_results['source_within_target']
+        sorting_indices = np.lexsort((matching_rois, rois))
+        first_index = np.searchsorted(rois[sorting_indices], np.arange(matching_results['areas'].shape[0] + 1))
+        matches = {'first_index': first_index.tolist(),
+                   'matching_ids': matching_rois[sorting_indices].tolist(),
+                   'IoUs': matching_results['IoUs'][sorting_indices].tolist(),
+                   'full_overlap': full_overlap[sorting_indices].tolist(), # roi is within the matching roi
+                   'reciprocal_full_overlap': reciprocal_full_overlap[sorting_indices].tolist()} # matching roi is within the roi
+        return matches
+    
+    
+    def _find_best_matches(self, matching_results: Dict, verbose: bool) -> Dict[str, np.ndarray]:
+        """
+        Determines the best match of each ROI in the previous and in the next plane (index of the matching ROI or -1). 
+        """
+        matches_per_plane_indicator = {plane_indicator: self._get_matches_in_adjacent_plane(matching_results = matching_results, plane_indicator = plane_indicator)
+                                       for plane_indicator in ['previous', 'next']}
+        best_matches = {plane_indicator: np.full(matching_results['areas'].shape[0], -1, dtype = 'int64') for plane_indicator in ['previous', 'next']}
+        plane_offsets = matching_results['plane_offsets']
+        for plane_idx in tqdm(range(plane_offsets.shape[0] - 1), display = verbose):
+            for roi_idx in range(plane_offsets[plane_idx], plane_offsets[plane_idx + 1]):
+                for plane_indicator, reciprocal_plane_indicator in [('previous', 'next'), ('next', 'previous')]:
+                    best_matches[plane_indicator][roi_idx] = self._find_best_match(roi_idx = roi_idx,
+                                                                                   matches = matches_per_plane_indicator[plane_indicator],
+                                                                                   reciprocal_matches = matches_per_plane_indicator[reciprocal_plane_indicator])
+        return best_matches
+    
+    
+    def _get_matches_of_roi(self, matches: Dict, roi_idx: int) -> Tuple[List, List, List, List]:
+        first, last = matches['first_index'][roi_idx], matches['first_index'][roi_idx + 1]
+        return (matches['matching_ids'][first:last], matches['IoUs'][first:last], 
+                matches['full_overlap'][first:last], matches['reciprocal_full_overlap'][first:last])
+    
+    
+    def _find_best_match(self, roi_idx: int, matches: Dict, reciprocal_matches: Dict) -> int:
+        matching_ids, ious, full_overlap, reciprocal_full_overlap = self._get_matches_of_roi(matches = matches, roi_idx = roi_idx)
+        best_match = -1
+        if len(matching_ids) > 0:
+            # First exit: our ROI is fully within another ROI, obviously making it our best match:
+            if any(full_overlap):
+                index_of_reciprocal_roi = full_overlap.index(True)
+                reciprocal_roi_idx = matching_ids[index_of_reciprocal_roi]
+                max_iou = ious[index_of_reciprocal_roi]
+                best_matching_roi_idx = roi_idx
+                # unless another ROI of our plane is also within the reciprocal ROI and has a higher IoU:
+                other_roi_idxs, ious_other_rois, _, other_rois_within_reciprocal_roi = self._get_matches_of_roi(matches = reciprocal_matches, roi_idx = reciprocal_roi_idx)
+                for other_roi_idx, iou_other_roi, other_roi_within_reciprocal_roi in zip(other_roi_idxs, ious_other_rois, other_rois_within_reciprocal_roi):
+                    if other_roi_within_reciprocal_roi:
+                        if iou_other_roi > max_iou:
+                            best_matching_roi_idx = other_roi_idx
+                        elif iou_other_roi == max_iou:
+                            best_matching_roi_idx = min([best_matching_roi_idx, other_roi_idx])
+                if best_matching_roi_idx == roi_idx:
+                    best_match = reciprocal_roi_idx
             else:
-                previous_plane_info = (plane_idx - 1, 'previous')
-                next_plane_info = (plane_idx + 1, 'next')
-            plane = zstack[plane_idx]
-            unique_label_ids = list(np.unique(plane))
-            if 0 in unique_label_ids:
-                unique_label_ids.remove(0)
-            elif 0.0 in unique_label_ids:
-                unique_label_ids.remove(0.0)
-            for label_id in unique_label_ids:
-                roi = utils.get_polygon_from_instance_segmentation(single_plane = zstack[plane_idx], label_id = label_id)
-                roi_area = roi.area
-                results[plane_idx][label_id] = {'final_label_id_assigned': False,
-                                                'final_label_id': None,
-                                                'area': roi_area,
-                                                'matching_ids_previous_plane': [],
-                                                'full_overlap_previous_plane': [],
-                                                'overlapping_area_previous_plane': [],
-                                                'IoUs_previous_plane': [],
-                                                'matching_ids_next_plane': [],
-                                                'full_overlap_next_plane': [],
-                                                'overlapping_area_next_plane': [],
-                                                'IoUs_next_plane': [],
-                                                'best_match_previous_plane': None,
-                                                'overlapping_area_best_match_previous_plane': None,
-                                                'IoU_best_match_previous_plane': None,
-                                                'best_match_next_plane': None,
-                                                'overlapping_area_best_match_next_plane': None,
-                                                'IoU_best_match_next_plane': None}
-                for plane_to_compare_info in [previous_plane_info, next_plane_info]:
-                    if plane_to_compare_info[0] != None:
-                        plane_to_compare_idx, plane_indicator = plane_to_compare_info[0], plane_to_compare_info[1]
-                        labels_of_pixels_in_plane_to_compare = zstack[plane_to_compare_idx][np.where(plane == label_id)]
-                        labels_of_pixels_in_plane_to_compare = list(np.unique(labels_of_pixels_in_plane_to_compare))
-                        if 0 in labels_of_pixels_in_plane_to_compare:
-                            labels_of_pixels_in_plane_to_compare.remove(0)
-                        elif 0.0 in labels_of_pixels_in_plane_to_compare:
-                            labels_of_pixels_in_plane_to_compare.remove(0.0)
-                        for label_id_in_plane_to_compare in labels_of_pixels_in_plane_to_compare:
-                            roi_to_compare = utils.get_polygon_from_instance_segmentation(single_plane = zstack[plane_to_compare_idx], label_id = label_id_in_plane_to_compare)
-                            results[plane_idx][label_id] = self._roi_matching(original_roi = roi, 
-                                                                              roi_to_compare = roi_to_compare, 
-                                                                              label_id_roi_to_compare =  label_id_in_plane_to_compare, 
-                                                                              results = results[plane_idx][label_id], 
-                                                                              plane_indicator = plane_indicator)
-        return results                 
+                reciprocal_within_roi_idxs = []
+                reciprocal_roi_idxs_to_be_excluded = []
+                for reciprocal_roi_idx, reciprocal_roi_within_roi in zip(matching_ids, reciprocal_full_overlap):
+                    _, _, reciprocal_roi_within_other_rois, other_rois_within_reciprocal_roi = self._get_matches_of_roi(matches = reciprocal_matches, roi_idx = reciprocal_roi_idx)
+                    # Is the reciprocal roi within our original roi?
+                    if reciprocal_roi_within_roi:
+                        reciprocal_within_roi_idxs.append(reciprocal_roi_idx)
+                    # Is the reciprocal roi within another roi [not our original roi]?
+                    elif any(reciprocal_roi_within_other_rois):
+                        reciprocal_roi_idxs_to_be_excluded.append(reciprocal_roi_idx)
+                    # Is there a third roi (a roi that overlaps with the reciprocal roi) - that is fully within the reciprocal roi?
+                    # right now within´s are always prioritized over overlapping potential best matches. 
+                    # So if there is any ROI that has a full overlapt (=within) our potential best matching reciprocal ROI - this reciprocal ROI will be excluded
+                    elif any(other_rois_within_reciprocal_roi):
+                        reciprocal_roi_idxs_to_be_excluded.append(reciprocal_roi_idx)
+                # Second exit: (at least) one matching ROI is fully within our original ROI and, therefore, has to be considered as best match:
+                if len(reciprocal_within_roi_idxs) > 0:
+                    ious_of_reciprocal_within_rois = [ious[matching_ids.index(reciprocal_roi_idx)] for reciprocal_roi_idx in reciprocal_within_roi_idxs]
+                    best_match = reciprocal_within_roi_idxs[ious_of_reciprocal_within_rois.index(max(ious_of_reciprocal_within_rois))]
+                else: # neither an original within, nor a reciprocal within - time to look for the highest IOU then:
+                    reciprocal_roi_idx = matching_ids[ious.index(max(ious))]
+                    # Third exit: The best matching ROI of our original ROI is fully within another ROI within the same plane as our original ROI --> no match!
+                    if reciprocal_roi_idx not in reciprocal_roi_idxs_to_be_excluded:
+                        reciprocal_matching_ids, reciprocal_ious, _, _ = self._get_matches_of_roi(matches = reciprocal_matches, roi_idx = reciprocal_roi_idx)
+                        # Fourth exit: Our original ROI is also the best matching ROI for its´ own best matching ROI 
+                        # (otherwise, fifth and final exit: Our original ROI is not the best matching ROI of its´ own best match --> no match!):
+                        if reciprocal_matching_ids[reciprocal_ious.index(max(reciprocal_ious))] == roi_idx:
+                            best_match = reciprocal_roi_idx
+        return best_match
 
     
-    def _roi_matching(self, original_roi: Polygon, roi_to_compare: Polygon, label_id_roi_to_compare: int, results: Dict, plane_indicator: str) -> Dict:
-        iou = original_roi.intersection(roi_to_compare).area / original_roi.union(roi_to_compare).area
-        proportion = original_roi.intersection(roi_to_compare).area / original_roi.area
-        if original_roi.within(roi_to_compare): 
-            within = True
-        else: 
-            within = False
-        results[f'matching_ids_{plane_indicator}_plane'].append(label_id_roi_to_compare)
-        results[f'full_overlap_{plane_indicator}_plane'].append(within)
-        results[f'overlapping_area_{plane_indicator}_plane'].append(proportion)
-        results[f'IoUs_{plane_indicator}_plane'].append(iou)
-        return results
-    
-    
-    def _find_best_matches(self, all_results: Dict, original_plane_id: int, original_label_id: int) -> Dict:
-        results = all_results[original_plane_id][original_label_id].copy()
-        for plane_indicator in ['previous', 'next']:
-            if len(results[f'matching_ids_{plane_indicator}_plane']) > 0:
-                if plane_indicator == 'previous':
-                    reciprocal_plane_indicator = 'next'
-                    reciprocal_plane_id = original_plane_id - 1
-                else:
-                    reciprocal_plane_indicator = 'previous'
-                    reciprocal_plane_id = original_plane_id + 1
-                within = any(results[f'full_overlap_{plane_indicator}_plane'])
-                # First exit: our ROI is fully within another ROI, obviously making it our best match:
-                if within:
-                    index_of_reciprocal_label_id = results[f'full_overlap_{plane_indicator}_plane'].index(True)
-                    reciprocal_label_id = results[f'matching_ids_{plane_indicator}_plane'][index_of_reciprocal_label_id]
-                    reciprocal_results = all_results[reciprocal_plane_id][reciprocal_label_id].copy()
-                    other_label_ids_within_reciprocal_label_id = []
-                    for label_id_matching_with_reciprocal_label_id in reciprocal_results[f'matching_ids_{reciprocal_plane_indicator}_plane']:
-                        tmp_results = all_results[original_plane_id][label_id_matching_with_reciprocal_label_id].copy()
-                        index_reciprocal_label_id = tmp_results[f'matching_ids_{plane_indicator}_plane'].index(reciprocal_label_id)
-                        if tmp_results[f'full_overlap_{plane_indicator}_plane'][index_reciprocal_label_id]:
-                            iou_other_label_id_to_reciprocal_label_id = tmp_results[f'IoUs_{plane_indicator}_plane'][index_reciprocal_label_id]
-                            other_label_ids_within_reciprocal_label_id.append((label_id_matching_with_reciprocal_label_id, iou_other_label_id_to_reciprocal_label_id))
-                    index_reciprocal_label_id = results[f'matching_ids_{plane_indicator}_plane'].index(reciprocal_label_id)
-                    max_iou = results[f'IoUs_{plane_indicator}_plane'][index_reciprocal_label_id]
-                    best_matching_label_id = original_label_id
-                    if len(other_label_ids_within_reciprocal_label_id) > 0:
-                        for other_label_id, iou_other_label_id in other_label_ids_within_reciprocal_label_id:
-                            if iou_other_label_id > max_iou:
-                                best_matching_label_id = other_label_id
-                            elif iou_other_label_id == max_iou:
-                                best_matching_label_id = min([best_matching_label_id, other_label_id])
-                    if best_matching_label_id == original_label_id:
-                        best_match_index = results[f'full_overlap_{plane_indicator}_plane'].index(True)
-                    else:
-                        best_match_index = None
-                else:
-                    reciprocal_within_label_ids = []
-                    reciprocal_label_ids_to_be_excluded = []
-                    for reciprocal_label_id in results[f'matching_ids_{plane_indicator}_plane']:
-                        reciprocal_results = all_results[reciprocal_plane_id][reciprocal_label_id].copy()
-                        index_original_label_id = reciprocal_results[f'matching_ids_{reciprocal_plane_indicator}_plane'].index(original_label_id)
-                        # Is the reciprocal roi within our original roi?
-                        if reciprocal_results[f'full_overlap_{reciprocal_plane_indicator}_plane'][index_original_label_id]:
-                            reciprocal_within_label_ids.append(reciprocal_label_id)
-                        # Is the reciprocal roi within another roi [not our original roi]?
-                        elif any(reciprocal_results[f'full_overlap_{reciprocal_plane_indicator}_plane']):
-                            reciprocal_label_ids_to_be_excluded.append(reciprocal_label_id)
-                        # Is there a third roi (a roi that overlaps with the reciprocal roi) - that is fully within the reciprocal roi?
-                        else:
-                            other_label_ids_within_reciprocal_label_id = []
-                            for label_id_matching_with_reciprocal_label_id in reciprocal_results[f'matching_ids_{reciprocal_plane_indicator}_plane']:
-                                tmp_results = all_results[original_plane_id][label_id_matching_with_reciprocal_label_id].copy()
-                                index_reciprocal_label_id = tmp_results[f'matching_ids_{plane_indicator}_plane'].index(reciprocal_label_id)
-                                # right now within´s are always prioritized over overlapping potential best matches. 
-                                # So if there is any ROI that has a full overlapt (=within) our potential best matching reciprocal ROI - this reciprocal ROI will be excluded
-                                if tmp_results[f'full_overlap_{plane_indicator}_plane'][index_reciprocal_label_id]:
-                                    reciprocal_label_ids_to_be_excluded.append(reciprocal_label_id)
-                    # Second exit: (at least) one matching ROI is fully within our original ROI and, therefore, has to be considered as best match:
-                    if len(reciprocal_within_label_ids) > 0:
-                        max_iou = -1
-                        best_reciprocal_within_label_id = None
-                        for reciprocal_label_id in reciprocal_within_label_ids:
-                            index_reciprocal_label_id = results[f'matching_ids_{plane_indicator}_plane'].index(reciprocal_label_id)
-                            tmp_matching_iou = results[f'IoUs_{plane_indicator}_plane'][index_reciprocal_label_id]
-                            if tmp_matching_iou > max_iou:
-                                best_reciprocal_within_label_id = reciprocal_label_id
-                                max_iou = tmp_matching_iou
-                            elif tmp_matching_iou == max_iou:
-                                best_reciprocal_within_label_id = min([best_reciprocal_within_label_id, reciprocal_label_id])
-                        best_match_index = results[f'matching_ids_{plane_indicator}_plane'].index(best_reciprocal_within_label_id) 
-                    else: # neither an original within, nor a reciprocal within - time to look for the highest IOU then:
-                        max_iou = max(results[f'IoUs_{plane_indicator}_plane'])
-                        max_iou_index = results[f'IoUs_{plane_indicator}_plane'].index(max_iou)
-                        reciprocal_label_id = results[f'matching_ids_{plane_indicator}_plane'][max_iou_index]
-                        # Third exit: The best matching ROI of our original ROI is fully within another ROI within the same plane as our original ROI --> no match!
-                        if reciprocal_label_id in reciprocal_label_ids_to_be_excluded:
-                            best_match_index = None
-                        else:
-                            reciprocal_results = all_results[reciprocal_plane_id][reciprocal_label_id].copy()
-                            reciprocal_max_iou = max(reciprocal_results[f'IoUs_{reciprocal_plane_indicator}_plane'])
-                            reciprocal_max_iou_index = reciprocal_results[f'IoUs_{reciprocal_plane_indicator}_plane'].index(reciprocal_max_iou)
-                            # Fourth exit: Our original ROI is also the best matching ROI for its´ own best matching ROI: 
-                            if original_label_id == reciprocal_results[f'matching_ids_{reciprocal_plane_indicator}_plane'][reciprocal_max_iou_index]:
-                                best_match_index = max_iou_index
-                            # Fifth and final exit: Our original ROI is not the best matching ROI of its´ own best match --> no match!
-                            else:
-                                best_match_index = None                    
-                if type(best_match_index) == int:
-                    best_match_label_id = results[f'matching_ids_{plane_indicator}_plane'][best_match_index]
-                    best_match_iou = results[f'IoUs_{plane_indicator}_plane'][best_match_index]
-                    best_match_overlap = results[f'overlapping_area_{plane_indicator}_plane'][best_match_index]
-                else: 
-                    best_match_label_id, best_match_iou, best_match_overlap = None, None, None
-                results[f'best_match_{plane_indicator}_plane'] = best_match_label_id
-                results[f'overlapping_area_best_match_{plane_indicator}_plane'] = best_match_overlap
-                results[f'IoU_best_match_{plane_indicator}_plane'] = best_match_iou
-        return results
-
+    def _get_final_id_assignments(self, best_matches: Dict[str, np.ndarray], lowest_final_label_id: int) -> np.ndarray:
+        """
+        Links each ROI with its best match in the next plane, which has to share this best match in return, using 
+        a disjoint-set (union-find) structure over the ROI indices. Each resulting set of linked ROIs represents one 
+        feature in 3D, and the final label IDs are assigned in order of the first ROI of each feature (i.e. ordered 
+        by plane index and label ID), starting at "lowest_final_label_id".
+        """
+        parents = list(range(best_matches['next'].shape[0]))
+        for roi_idx in np.flatnonzero(best_matches['next'] >= 0).tolist():
+            best_match_next_plane = int(best_matches['next'][roi_idx])
+            if best_matches['previous'][best_match_next_plane] != roi_idx:
+                raise ValueError(f'ROI with index {best_match_next_plane} does not share best matching with ROI with index {roi_idx} in the previous plane!')
+            root, root_of_best_match = self._find_root(parents = parents, roi_idx = roi_idx), self._find_root(parents = parents, roi_idx = best_match_next_plane)
+            # the ROI with the lower index becomes the root, such that each root is the first ROI of its feature:
+            parents[max(root, root_of_best_match)] = min(root, root_of_best_match)
+        roots = np.asarray([self._find_root(parents = parents, roi_idx = roi_idx) for roi_idx in range(len(parents))], dtype = 'int64')
+        _, feature_indices = np.unique(roots, return_inverse = True)
+        return feature_indices + lowest_final_label_id
+    
+    
+    def _find_root(self, parents: List[int], roi_idx: int) -> int:
+        while parents[roi_idx] != roi_idx:
+            parents[roi_idx] = parents[parents[roi_idx]] # path halving
+            roi_idx = parents[roi_idx]
+        return roi_idx
+    
+    
+    def _set_new_label_ids(self, zstack_with_old_label_ids: np.ndarray, label_ids_per_plane: List[np.ndarray], final_label_ids: np.ndarray) -> np.ndarray:
+        zstack_with_new_label_ids = np.empty(zstack_with_old_label_ids.shape, dtype = 'uint16') # needs to be adaptable if lowest_final_label_id becomes adaptable
+        first_roi_idx = 0
+        for plane_index, label_ids in enumerate(label_ids_per_plane):
+            zstack_with_new_label_ids[plane_index] = utils.remap_label_ids(label_image = zstack_with_old_label_ids[plane_index],
+                                                                           old_label_ids = label_ids,
+                                                                           new_label_ids = final_label_ids[first_roi_idx : first_roi_idx + label_ids.shape[0]],
+                                                                           dtype = 'uint16')
+            first_roi_idx += label_ids.shape[0]
+        return zstack_with_new_label_ids    
     
-    def _get_final_id_assignments(self, results: Dict, lowest_final_label_id: int) -> Tuple[Dict, Dict]:
-        final_ids = {}
-        keep_going = True
-        final_label_id = lowest_final_label_id
-        for plane_idx in results.keys():
-            for label_id in results[plane_idx].keys():
-                if results[plane_idx][label_id]['final_label_id_assigned']:
-                    continue
-                else:
-                    final_ids[final_label_id] = {'plane_index': [],
-                                                 'original_label_id': []}
-                    results[plane_idx][label_id]['final_label_id_assigned'] = True
-                    results[plane_idx][label_id]['final_label_id'] = final_label_id
-                    final_ids[final_label_id]['plane_index'].append(plane_idx)
-                    final_ids[final_label_id]['original_label_id'].append(label_id)
-                    # Now start tracing:
-                    if results[plane_idx][label_id]['best_match_next_plane'] != None:
-                        keep_tracing = True
-                        while keep_tracing:
-                            results, final_ids, keep_tracing = self._trace_matches(matching_results = results, 
-                                                                                   final_ids_assignment = final_ids, 
-                                                                                   current_final_id = final_label_id)
-                    final_label_id += 1
-        return final_ids, results
     
-
-    def _trace_matches(self, matching_results: Dict, final_ids_assignment: Dict, current_final_id: int) -> Tuple[Dict, Dict, bool]:
-        current_plane_idx = final_ids_assignment[current_final_id]['plane_index'][-1]
-        current_plane_label_id = final_ids_assignment[current_final_id]['original_label_id'][-1]
-        best_match_next_plane = matching_results[current_plane_idx][current_plane_label_id]['best_match_next_plane']
-        next_plane_idx = current_plane_idx + 1
-        if matching_results[next_plane_idx][best_match_next_plane]['final_label_id_assigned']:
-            print(f'Was trying to trace down the matches of original_label_id: {current_plane_label_id} in plane {current_plane_idx}')
-            raise ValueError(f'ROI with ID {best_match_next_plane} in plane {next_plane_idx} was already assigned! :o')
-        else:
-            if matching_results[next_plane_idx][best_match_next_plane]['best_match_previous_plane'] != current_plane_label_id:
-                raise ValueError(f'ROI with ID {best_match_next_plane} in plane {next_plane_idx} does not share best matching with previous plane!')
-            else:
-                matching_results[next_plane_idx][best_match_next_plane]['final_label_id_assigned'] = True
-                matching_results[next_plane_idx][best_match_next_plane]['final_label_id'] = current_final_id
-                final_ids_assignment[current_final_id]['plane_index'].append(next_plane_idx)
-                final_ids_assignment[current_final_id]['original_label_id'].append(best_match_next_plane)
-                if matching_results[next_plane_idx][best_match_next_plane]['best_match_next_plane'] != None:
-                    keep_tracing = True
-                else:
-                    keep_tracing = False
-        return matching_results, final_ids_assignment, keep_tracing
-    
-    
-    def _set_new_label_ids(self, zstack_with_old_label_ids: np.ndarray, new_ids_assignment: Dict) -> np.ndarray:
-        zstack_with_new_label_ids = zstack_with_old_label_ids.copy()
-        zstack_with_new_label_ids = zstack_with_new_label_ids.astype('uint16') # needs to be adaptable if lowest_final_label_id becomes adaptable
-        for new_label_id in new_ids_assignment.keys():
-            for idx in range(len(new_ids_assignment[new_label_id]['plane_index'])):
-                plane_index = new_ids_assignment[new_label_id]['plane_index'][idx]
-                old_label_id = new_ids_assignment[new_label_id]['original_label_id'][idx]
-                zstack_with_new_label_ids[plane_index][np.where(zstack_with_new_label_ids[plane_index] == old_label_id)] = new_label_id
-        return zstack_with_new_label_ids    
+    def _get_multi_matches_traceback(self, matching_results: Dict, final_label_ids: np.ndarray) -> Dict:
+        n_rois = matching_results['areas'].shape[0]
+        n_matches_next_plane = np.bincount(matching_results['sources'], minlength = n_rois)
+        n_matches_previous_plane = np.bincount(matching_results['targets'], minlength = n_rois)
+        multi_match_roi_idxs = np.flatnonzero((n_matches_next_plane > 1) | (n_matches_previous_plane > 1))
+        plane_indices = np.searchsorted(matching_results['plane_offsets'], multi_match_roi_idxs, side = 'right') - 1
+        label_ids = np.concatenate([np.zeros(0, dtype = 'int64')] + matching_results['label_ids_per_plane'])
+        multi_matches_traceback = {'final_label_id': final_label_ids[multi_match_roi_idxs].tolist(),
+                                   'original_instance_label_id': label_ids[multi_match_roi_idxs].tolist(),
+                                   'plane_index': plane_indices.tolist()}
+        return multi_matches_traceback
     
 
-    def _save_multimatches_traceback_to_database(self, database: Database, file_id: str, results: Dict) -> Database:
-        multi_matches_traceback = {'final_label_id': [],
-                                   'original_instance_label_id': [],
-                                   'plane_index': []}
-        for plane_index in results.keys():
-            for label_id in results[plane_index].keys():
-                condition_a = len(results[plane_index][label_id]['matching_ids_next_plane']) > 1
-                condition_b = len(results[plane_index][label_id]['matching_ids_previous_plane']) > 1
-                if condition_a or condition_b:
-                    multi_matches_traceback['final_label_id'].append(results[plane_index][label_id]['final_label_id'])
-                    multi_matches_traceback['original_instance_label_id'].append(label_id)
-                    multi_matches_traceback['plane_index'].append(plane_index)
+    def _save_multimatches_traceback_to_database(self, database: Database, file_id: str, multi_matches_traceback: Dict) -> Database:
         if hasattr(database, 'multi_matches_traceback') == False:
             setattr(database, 'multi_matches_traceback', {})
         database.multi_matches_traceback[file_id] = multi_matches_traceback        
@@ -352,50 +319,70 @@ class FillHolesStrat(PostprocessingStrategy):
     
     @property
     def default_configs(self):
-        default_values = {}
-        valid_types = {}
-        default_configs = DefaultConfigs(default_values = default_values, valid_types = valid_types)
+        default_values = {'n_threads': 1}
+        valid_types = {'n_threads': [int]}
+        valid_ranges = {'n_threads': (1, 64, 1)}
+        default_configs = DefaultConfigs(default_values = default_values, valid_types = valid_types, valid_value_ranges = valid_ranges)
         return default_configs
         
     @property
     def widget_names(self):
-        return {}
+        return {'n_threads': 'BoundedIntText'}
 
     @property
     def descriptions(self):
-        return {}
+        return {'n_threads': 'number of planes to process in parallel (threads)'}
     
     @property
     def tooltips(self):
         return {}
     
     def run(self, processing_object: PostprocessingObject, strategy_configs: Dict) -> PostprocessingObject:
-        processing_object.postprocessed_segmentations = self._fill_holes_in_all_planes_of_mask_stack(zstack = processing_object.postprocessed_segmentations)
+        processing_object.postprocessed_segmentations = self._fill_holes_in_all_planes_of_mask_stack(zstack = processing_object.postprocessed_segmentations,
+                                                                                                     label_geometry_index = processing_object.get_label_geometry_index(),
+                                                                                                     n_threads = strategy_configs['n_threads'])
         return processing_object
     
     
-    def _fill_holes_in_all_planes_of_mask_stack(self, zstack: np.ndarray) -> np.ndarray:
-        for plane_index in range(zstack.shape[0]):
-            single_plane = zstack[plane_index]
-            unique_label_ids = list(np.unique(single_plane))
-            if 0 in unique_label_ids:
-                unique_label_ids.remove(0)
-            elif 0.0 in unique_label_ids:
-                unique_label_ids.remove(0.0)
-            for label_id in unique_label_ids:
-                # add additional check here, if the label_id is still present in the single plane
-                # Maybe it got overwritten by the filling process, if it was a small ROI within a ring-like bigger ROI
-                if label_id in np.unique(single_plane):
-                    roi = utils.get_polygon_from_instance_segmentation(single_plane = single_plane, label_id = label_id)
-                    bounding_box_coords = [int(elem) for elem in roi.bounds]
-                    cropped_mask = single_plane[bounding_box_coords[0]:bounding_box_coords[2], bounding_box_coords[1]:bounding_box_coords[3]]
-                    cropped_mask_copy = cropped_mask.copy()
-                    cropped_mask_copy[np.where(cropped_mask_copy != label_id)] = 0
-                    filled_holes = ndimage.binary_fill_holes(cropped_mask_copy)
-                    # since "cropped_mask" refers ultimately to the zstack (not a copy)
-                    # the changes are also made to the zstack itself:
-                    cropped_mask[np.where(filled_holes == True)] = label_id
+    def _fill_holes_in_all_planes_of_mask_stack(self, zstack: np.ndarray, label_geometry_index: utils.LabelGeometryIndex, n_threads: int=1) -> np.ndarray:
+        """
+        Fills the holes of all labels in all planes of "zstack" (in place). The planes are independent of each other 
+        and can therefore be processed in parallel threads, as the hole filling of scipy releases the GIL. The 
+        bounding boxes of all labels are taken from (and afterwards reset in) the label geometry index. 
+        """
+        bounding_boxes_per_plane = [label_geometry_index.get_bounding_boxes(plane_index = plane_index) for plane_index in range(zstack.shape[0])]
+        def fill_holes_in_plane(plane_index: int) -> bool:
+            return self._fill_holes_in_single_plane(single_plane = zstack[plane_index], bounding_boxes = bounding_boxes_per_plane[plane_index])
+        if n_threads > 1:
+            with ThreadPoolExecutor(max_workers = n_threads) as executor:
+                # list() to raise exceptions that occurred in any of the threads:
+                planes_modified = list(executor.map(fill_holes_in_plane, range(zstack.shape[0])))
+        else:
+            planes_modified = [fill_holes_in_plane(plane_index) for plane_index in range(zstack.shape[0])]
+        for plane_index, plane_modified in enumerate(planes_modified):
+            if plane_modified == True:
+                label_geometry_index.reset(plane_index = plane_index)
         return zstack
+    
+    
+    def _fill_holes_in_single_plane(self, single_plane: np.ndarray, bounding_boxes: Dict[int, Tuple[slice, slice]]) -> bool:
+        """
+        Fills the holes of each label within its bounding box (in place) and returns whether the plane was modified. 
+        The labels are processed in ascending order, and labels that were already overwritten entirely while the 
+        holes of another label were filled (e.g. a small label within a ring-like bigger label) are skipped.
+        """
+        plane_modified = False
+        for label_id in sorted(bounding_boxes.keys()):
+            # since "cropped_mask" refers ultimately to the zstack (not a copy)
+            # the changes are also made to the zstack itself:
+            cropped_mask = single_plane[bounding_boxes[label_id]]
+            label_mask = cropped_mask == label_id
+            if label_mask.any():
+                holes = ndimage.binary_fill_holes(label_mask) & ~label_mask
+                if holes.any():
+                    cropped_mask[holes] = label_id
+                    plane_modified = True
+        return plane_modified
 
     
     def _add_strategy_specific_infos_to_updates(self, updates: Dict) -> Dict:
@@ -505,29 +492,30 @@ class ApplyExclusionCriteriaStrat(PostprocessingStrategy):
         for background_label in [0, 0.0]:
             if background_label in instance_label_ids:
                 instance_label_ids.remove(background_label)
+        label_geometry_index = postprocessing_object.get_label_geometry_index()
         instance_label_info = {}
         for label_id in instance_label_ids:
             instance_label_info[label_id] = {}
-            plane_indices_with_label_id = list(set(np.where(postprocessing_object.postprocessed_segmentations == label_id)[0]))
+            plane_indices_with_label_id = label_geometry_index.get_plane_indices_with_label_id(label_id = label_id)
             instance_label_info[label_id]['plane_indices_with_label_id'] = plane_indices_with_label_id
-            instance_label_info[label_id]['max_roi_area'] = self._get_max_roi_area(zstack = postprocessing_object.postprocessed_segmentations,
+            instance_label_info[label_id]['max_roi_area'] = self._get_max_roi_area(label_geometry_index = label_geometry_index,
                                                                                    label_id = label_id,
                                                                                    all_plane_indices = instance_label_info[label_id]['plane_indices_with_label_id'])
         instance_label_info = self._extend_info_with_relative_positions(info = instance_label_info, 
                                                                         rois_dict = postprocessing_object.rois_dict,
-                                                                        zstack = postprocessing_object.postprocessed_segmentations)
+                                                                        label_geometry_index = label_geometry_index)
         return instance_label_info
     
     
-    def _get_max_roi_area(self, zstack: np.ndarray, label_id: int, all_plane_indices: List) -> int:
+    def _get_max_roi_area(self, label_geometry_index: utils.LabelGeometryIndex, label_id: int, all_plane_indices: List) -> int:
         all_area_sizes = []
         for plane_index in all_plane_indices:
-            roi = utils.get_polygon_from_instance_segmentation(single_plane = zstack[plane_index], label_id = label_id)
+            roi = label_geometry_index.get_polygon(plane_index = plane_index, label_id = label_id)
             all_area_sizes.append(roi.area)
         return max(all_area_sizes)
 
     
-    def _extend_info_with_relative_positions(self, info: Dict, rois_dict: Dict, zstack: np.ndarray) -> Dict:
+    def _extend_info_with_relative_positions(self, info: Dict, rois_dict: Dict, label_geometry_index: utils.LabelGeometryIndex) -> Dict:
         for label_id in info.keys():
             info[label_id]['area_roi_ids_with_matching_plane_index_and_id'] = []
             info[label_id]['relative_positions_per_area_roi_id'] = {}
@@ -541,7 +529,7 @@ class ApplyExclusionCriteriaStrat(PostprocessingStrategy):
                         if (area_roi_id, plane_index, 'all_planes') not in info[label_id]['area_roi_ids_with_matching_plane_index_and_id']:
                             info[label_id]['area_roi_ids_with_matching_plane_index_and_id'].append((area_roi_id, plane_index, 'all_planes'))
             for area_roi_id, plane_index, plane_id in info[label_id]['area_roi_ids_with_matching_plane_index_and_id']:
-                roi = utils.get_polygon_from_instance_segmentation(single_plane = zstack[plane_index], label_id = label_id)
+                roi = label_geometry_index.get_polygon(plane_index = plane_index, label_id = label_id)
                 area_roi = rois_dict[plane_id][area_roi_id]
                 relative_position = self._get_relative_position(roi_to_check = roi, reference = area_roi)
                 if area_roi_id not in info[label_id]['relative_positions_per_area_roi_id'].keys():
@@ -605,17 +593,21 @@ class ApplyExclusionCriteriaStrat(PostprocessingStrategy):
 
 
     def _apply_exclusion_criteria(self, zstack_prior_to_exclusion: np.ndarray, area_roi_id: str, info: Dict) -> np.ndarray:
-        zstack = zstack_prior_to_exclusion.copy()
+        excluded_label_ids = []
         for label_id in info.keys():
             relative_position = info[label_id]['relative_positions_per_area_roi_id'][area_roi_id]['final_relative_position_for_quantifications']
             max_z_expansion = self._get_max_z_expansion(planes = info[label_id]['plane_indices_with_label_id'])
             max_roi_area = info[label_id]['max_roi_area']
             if relative_position not in self.exclusion_criteria['allowed_relative_positions']:
-                zstack[np.where(zstack == label_id)] = 0
-            if max_z_expansion < self.exclusion_criteria['min_planes_covered']:
-                zstack[np.where(zstack == label_id)] = 0
-            if max_roi_area < self.exclusion_criteria['min_roi_area_size']:
-                zstack[np.where(zstack == label_id)] = 0
+                excluded_label_ids.append(label_id)
+            elif max_z_expansion < self.exclusion_criteria['min_planes_covered']:
+                excluded_label_ids.append(label_id)
+            elif max_roi_area < self.exclusion_criteria['min_roi_area_size']:
+                excluded_label_ids.append(label_id)
+        # all excluded labels are set to 0 at once:
+        zstack = utils.remap_label_ids(label_image = zstack_prior_to_exclusion, 
+                                       old_label_ids = excluded_label_ids, 
+                                       new_label_ids = np.zeros(len(excluded_label_ids)))
         return zstack      
         
         
@@ -1,19 +1,83 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/api/05_preprocessing_00_specs.ipynb.
 
 # %% auto 0
-__all__ = ['PreprocessingStrategy', 'PreprocessingObject']
+__all__ = ['TiledZStack', 'PreprocessingStrategy', 'PreprocessingObject']
 
 # %% ../../nbs/api/05_preprocessing_00_specs.ipynb 2
 import numpy as np
 from shapely.geometry import Polygon
-from typing import List, Dict
-from skimage.io import imsave
+from typing import List, Dict, Optional, Callable, Iterator, Tuple, Union
+from pathlib import PosixPath, WindowsPath
+from functools import partial
+import itertools
 
 from ..core import ProcessingObject, ProcessingStrategy, DataLoader
+from ..database import decoded_data_cache
 from ..configs import DefaultConfigs
 from .. import readers
+from .. import utils
 
-# %% ../../nbs/api/05_preprocessing_00_specs.ipynb 4
+# %% ../../nbs/api/05_preprocessing_00_specs.ipynb 3
+class TiledZStack:
+    
+    """
+    Lazily provides tiles ([imaging-planes, rows, columns, color-channels]) of a z-stack that is too large to be 
+    kept in memory entirely, like whole-slide images (see the tiled processing mode of the `PreprocessingObject`). 
+    Each tile is only read from its source (e.g. as window of the microscopy image file) when it is requested, and 
+    is then passed through all processing steps that were added so far (see `crop()` and `map_tiles()`).
+    """
+    
+    def __init__(self, 
+                 shape: Tuple[int, int, int, int], # [imaging-planes, rows, columns, color-channels]
+                 dtype: np.dtype,
+                 read_tile: Callable[[slice, slice], np.ndarray], # returns the tile of the given row & column slices
+                 tile_size: int # edge length of the tiles
+                ) -> None:
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        self.read_tile = read_tile
+        self.tile_size = tile_size
+        
+        
+    def get_tile_slices(self) -> List[Tuple[slice, slice]]:
+        rows, cols = self.shape[1:3]
+        return [(slice(lower_row_idx, min(lower_row_idx + self.tile_size, rows)), slice(lower_col_idx, min(lower_col_idx + self.tile_size, cols)))
+                for lower_row_idx in range(0, rows, self.tile_size) for lower_col_idx in range(0, cols, self.tile_size)]
+    
+    
+    def iter_tiles(self) -> Iterator[Tuple[slice, slice, np.ndarray]]:
+        for row_slice, col_slice in self.get_tile_slices():
+            yield row_slice, col_slice, self.read_tile(row_slice, col_slice)
+            
+            
+    def crop(self, cropping_indices: Dict[str, int]) -> 'TiledZStack':
+        """
+        Same as slicing with the cropping indices (like `PreprocessingObject.crop_rgb_zstack()`), 
+        i.e. negative indices are interpreted relative to the end of the respective axis.
+        """
+        lower_row_idx, upper_row_idx, _ = slice(cropping_indices['lower_row_cropping_idx'], cropping_indices['upper_row_cropping_idx']).indices(self.shape[1])
+        lower_col_idx, upper_col_idx, _ = slice(cropping_indices['lower_col_cropping_idx'], cropping_indices['upper_col_cropping_idx']).indices(self.shape[2])
+        def read_cropped_tile(row_slice: slice, col_slice: slice) -> np.ndarray:
+            return self.read_tile(slice(row_slice.start + lower_row_idx, row_slice.stop + lower_row_idx), 
+                                  slice(col_slice.start + lower_col_idx, col_slice.stop + lower_col_idx))
+        cropped_shape = (self.shape[0], max(0, upper_row_idx - lower_row_idx), max(0, upper_col_idx - lower_col_idx), self.shape[3])
+        return TiledZStack(shape = cropped_shape, dtype = self.dtype, read_tile = read_cropped_tile, tile_size = self.tile_size)
+    
+    
+    def map_tiles(self, 
+                  process_tile: Callable[[np.ndarray], np.ndarray], # must not depend on any pixels outside of the tile
+                  shape: Optional[Tuple[int, int, int, int]]=None, # if the processing changes the number of planes or color-channels
+                  dtype: Optional[np.dtype]=None # if the processing changes the dtype
+                 ) -> 'TiledZStack':
+        if shape == None:
+            shape = self.shape
+        if dtype == None:
+            dtype = self.dtype
+        def read_processed_tile(row_slice: slice, col_slice: slice) -> np.ndarray:
+            return process_tile(self.read_tile(row_slice, col_slice))
+        return TiledZStack(shape = shape, dtype = dtype, read_tile = read_processed_tile, tile_size = self.tile_size)
+
+# %% ../../nbs/api/05_preprocessing_00_specs.ipynb 5
 class PreprocessingStrategy(ProcessingStrategy):
     
     """
@@ -23,8 +87,82 @@ class PreprocessingStrategy(ProcessingStrategy):
     @property
     def processing_type(self):
         return 'preprocessing'
+    
+    
+    def determine_reading_window(self, rois_dict: Dict[str, Dict[str, Polygon]], strategy_configs: Dict) -> Optional[Dict[str, int]]:
+        """
+        Preprocessing strategies that crop the image to a region which can already be determined 
+        from the ROIs (i.e. before the microscopy image is loaded) can return the corresponding 
+        cropping indices here. If such a strategy is the first one that is run, only this window 
+        of the microscopy image will be read from disk (see `PreprocessingObject.load_image_and_rois`).
+        """
+        return None
+    
+    
+    @property
+    def supports_plane_streaming(self) -> bool:
+        """
+        Preprocessing strategies that process each image plane independently of the other planes (or that
+        reduce the planes into a single one, like intensity projections) can return True here and implement
+        `stream_planes()`. If such strategies are run first, the planes are streamed from the microscopy image
+        reader through them, such that the entire z-stack never has to be loaded (see `PreprocessingObject`).
+        """
+        return False
+    
+    
+    def stream_planes(self, 
+                      iterate_planes: Callable[[], Iterator[np.ndarray]], # returns a new iterator over all (so far preprocessed) planes on every call
+                      processing_object: ProcessingObject, 
+                      strategy_configs: Dict
+                     ) -> Callable[[], Iterator[np.ndarray]]: # returns a new iterator over the planes processed by this strategy on every call
+        """
+        Streaming variant of `run()` for strategies that support plane streaming. The planes have the structure
+        [rows, columns, color-channels]. The returned function may iterate over "iterate_planes" more than once 
+        (e.g. to first determine statistics of the entire z-stack), which will then read the planes again.
+        Strategies that change the shape of the z-stack (e.g. by cropping or projecting the planes) have to update
+        the "preprocessed_planes_shape" of the "processing_object" accordingly, since the planes are only read once
+        they are gathered (or written to disk), while the shape has to be known beforehand.
+        """
+        raise NotImplementedError(f'{self.strategy_name} does not support plane streaming.')
+    
+    
+    def compute_lookup_tables(self,
+                              histograms: np.ndarray, # [planes, color-channels, values]: how often each possible value occurs in the (so far preprocessed) image
+                              dtype: np.dtype, # dtype of the (so far preprocessed) image, either uint8 or uint16
+                              processing_object: ProcessingObject,
+                              strategy_configs: Dict
+                             ) -> np.ndarray: # [planes, color-channels, values]: the new value of each possible value, with the dtype of the processed image
+        """
+        Preprocessing strategies with "pointwise" as `processing_kind` have to implement this. Their processing 
+        is then fully described by a lookup table per plane and color-channel, which allows the `PreprocessingObject` 
+        to fuse consecutive pointwise strategies into a single pass over the image (see `run_all_strategies()`).
+        """
+        raise NotImplementedError(f'{self.strategy_name} does not provide lookup tables.')
+    
+    
+    @property
+    def supports_tiled_processing(self) -> bool:
+        """
+        Preprocessing strategies that can process an image tile by tile (i.e. that require only global statistics
+        of the image, which can be gathered tile by tile as well) can return True here and implement `process_tiles()`.
+        Strategies of the "pointwise" `processing_kind` are processed via their lookup tables (see `compute_lookup_tables()`).
+        """
+        return self.processing_kind == 'pointwise'
+    
+    
+    def process_tiles(self,
+                      tiled_zstack: TiledZStack, # the (so far preprocessed) image
+                      processing_object: ProcessingObject,
+                      strategy_configs: Dict
+                     ) -> TiledZStack: # the image processed by this strategy
+        """
+        Tiled variant of `run()` for strategies that support tiled processing. Statistics of the image can be gathered 
+        by iterating over the tiles of "tiled_zstack" (which reads them), whereas the processing of the pixels itself 
+        should only be added lazily to the returned `TiledZStack` (e.g. using `TiledZStack.map_tiles()`).
+        """
+        raise NotImplementedError(f'{self.strategy_name} does not support tiled processing.')
 
-# %% ../../nbs/api/05_preprocessing_00_specs.ipynb 5
+# %% ../../nbs/api/05_preprocessing_00_specs.ipynb 6
 class PreprocessingObject(ProcessingObject):
     
     """
@@ -46,14 +184,24 @@ class PreprocessingObject(ProcessingObject):
     def widget_names(self):
         widget_names = {'overwrite': 'Checkbox',
                         'autosave': 'Checkbox',
-                        'show_progress': 'Checkbox'}
+                        'autosave_policy': 'Dropdown',
+                        'autosave_interval': 'BoundedIntText',
+                        'n_workers': 'BoundedIntText',
+                        'show_progress': 'Checkbox',
+                        'tiled_processing': 'Checkbox',
+                        'tile_size': 'BoundedIntText'}
         return widget_names
 
     @property
     def descriptions(self):
         descriptions = {'overwrite': 'overwrite previously processed files',
-                        'autosave': 'autosave progress after each file',
-                        'show_progress': 'show progress bar and estimated computation time'}
+                        'autosave': 'autosave progress',
+                        'autosave_policy': 'when to autosave progress (also upon errors)',
+                        'autosave_interval': 'autosave interval (N files or T seconds)',
+                        'n_workers': 'number of files to process in parallel',
+                        'show_progress': 'show progress bar and estimated computation time',
+                        'tiled_processing': 'process images in tiles (e.g. whole-slide images that exceed memory)',
+                        'tile_size': 'edge length of the tiles (in pixels)'}
         return descriptions
     
     @property
@@ -65,39 +213,159 @@ class PreprocessingObject(ProcessingObject):
     def default_configs(self) -> DefaultConfigs:
         default_values = {'overwrite': False,
                           'autosave': True,
-                          'show_progress': True}
+                          'autosave_policy': 'every N files',
+                          'autosave_interval': 1,
+                          'n_workers': 1,
+                          'show_progress': True,
+                          'tiled_processing': False,
+                          'tile_size': 4096}
         valid_types = {'overwrite': [bool],
                        'autosave': [bool],
-                       'show_progress': [bool]}
-        default_configs = DefaultConfigs(default_values = default_values, valid_types = valid_types)
+                       'autosave_policy': [str],
+                       'autosave_interval': [int],
+                       'n_workers': [int],
+                       'show_progress': [bool],
+                       'tiled_processing': [bool],
+                       'tile_size': [int]}
+        valid_value_ranges = {'autosave_interval': (1, 3600, 1),
+                              'n_workers': (1, 64, 1),
+                              'tile_size': (256, 32768, 256)}
+        valid_options = {'autosave_policy': ('every N files', 'every T seconds', 'on completion or exception')}
+        default_configs = DefaultConfigs(default_values = default_values,
+                                         valid_types = valid_types,
+                                         valid_value_ranges = valid_value_ranges,
+                                         valid_value_options = valid_options)
         return default_configs
     
     
     def _processing_specific_preparations(self) -> None:
         self.file_id = self.file_ids[0]
         self.file_info = self.database.get_file_infos(file_id = self.file_id)
+        self.reading_window = None
+        self.preprocessed_planes = None
+        self.preprocessed_planes_shape = None
+        self.streamed_strategies_and_configs = []
+        self.preprocessed_zstack_shape = None # only set, if the streamed planes are directly written to disk
+        self.preprocessed_tiles = None
+        self.bit_depth = None
         
 
 
-    def load_image_and_rois(self, microscopy_reader_configs: Dict, roi_reader_configs: Dict) -> None:
-        self.preprocessed_image = self._load_microscopy_image(microscopy_reader_configs = microscopy_reader_configs)
-        self.preprocessed_rois = self._load_rois(roi_reader_configs = roi_reader_configs)
+    def load_image_and_rois(self, 
+                            microscopy_reader_configs: Dict, 
+                            roi_reader_configs: Dict,
+                            strategies: Optional[List[PreprocessingStrategy]]=None, # the preprocessing strategies that will be run
+                            strategy_configs: Optional[List[Dict]]=None, # the corresponding strategy configs
+                            tile_size: Optional[int]=None # edge length of the tiles, if the image shall be processed in tiles
+                           ) -> None:
+        """
+        Loads the microscopy image and the corresponding ROIs. If the ROIs are loaded from a file, they are 
+        loaded first, and if the first of the "strategies" determines a reading window from them (e.g. 
+        `CropToROIsBoundingBoxStrat`), only this window of the microscopy image will be read. The applied 
+        window is then stored as "reading_window", while the ROIs remain in the coordinates of the entire image.
+        If the first of the "strategies" supports plane streaming, the microscopy image is not loaded at once, but 
+        prepared to be streamed plane by plane as "preprocessed_planes" instead (see `run_all_strategies`).
+        If a "tile_size" is passed, the microscopy image will only be read tile by tile while it is processed, 
+        as described by the `TiledZStack` "preprocessed_tiles" (see `run_all_strategies`). Note: this requires
+        a microscopy image reader that can read windows of the image from disk (e.g. the `TiffStackReader`).
+        """
+        if (strategies != None) and (len(strategies) > 0) and (decoded_data_cache.is_enabled == False):
+            stream_planes = strategies[0]().supports_plane_streaming
+        else: # the DecodedDataCache holds entire images only
+            stream_planes = False
+        if tile_size != None:
+            self._prepare_tiled_microscopy_image(microscopy_reader_configs = microscopy_reader_configs, tile_size = tile_size)
+            self.preprocessed_rois = self._load_rois(roi_reader_configs = roi_reader_configs)
+        elif roi_reader_configs['create_rois'] == True:
+            self._load_microscopy_image(microscopy_reader_configs = microscopy_reader_configs, stream_planes = stream_planes)
+            self.preprocessed_rois = self._load_rois(roi_reader_configs = roi_reader_configs)
+        else:
+            self.preprocessed_rois = self._load_rois(roi_reader_configs = roi_reader_configs)
+            if (strategies != None) and (len(strategies) > 0):
+                requested_window = strategies[0]().determine_reading_window(rois_dict = self.preprocessed_rois, strategy_configs = strategy_configs[0])
+            else:
+                requested_window = None
+            self._load_microscopy_image(microscopy_reader_configs = microscopy_reader_configs, 
+                                        requested_window = requested_window, 
+                                        stream_planes = stream_planes)
         
         
         
-    def _load_microscopy_image(self, microscopy_reader_configs: Dict) -> np.ndarray:
+    def _load_microscopy_image(self, 
+                               microscopy_reader_configs: Dict, 
+                               requested_window: Optional[Dict[str, int]]=None, 
+                               stream_planes: bool=False
+                              ) -> None:
         microscopy_image_data_loader = DataLoader()
         microscopy_image_reader_class = microscopy_image_data_loader.determine_reader(file_extension = self.file_info['microscopy_filetype'],
                                                                                       data_reader_module = readers.microscopy_images)
-        microscopy_image = microscopy_image_data_loader.load(data_reader_class = microscopy_image_reader_class,
-                                                             filepath = self.file_info['microscopy_filepath'],
-                                                             reader_configs = microscopy_reader_configs)
-        return microscopy_image
+        if requested_window != None:
+            microscopy_reader_configs = microscopy_reader_configs.copy()
+            microscopy_reader_configs['spatial_window'] = requested_window
+        if stream_planes == True:
+            self.preprocessed_image = None
+            self.preprocessed_planes = partial(microscopy_image_data_loader.load_planes,
+                                               data_reader_class = microscopy_image_reader_class,
+                                               filepath = self.file_info['microscopy_filepath'],
+                                               reader_configs = microscopy_reader_configs)
+            self.preprocessed_planes_shape = microscopy_image_data_loader.load_shape(data_reader_class = microscopy_image_reader_class,
+                                                                                    filepath = self.file_info['microscopy_filepath'],
+                                                                                    reader_configs = microscopy_reader_configs)
+        else:
+            self.preprocessed_image = microscopy_image_data_loader.load(data_reader_class = microscopy_image_reader_class,
+                                                                        filepath = self.file_info['microscopy_filepath'],
+                                                                        reader_configs = microscopy_reader_configs)
+        if requested_window != None:
+            # the readers clip the window to the actual image dimensions:
+            rows, cols = self.get_rows_and_cols_of_image()
+            self.reading_window = {'lower_row_cropping_idx': requested_window['lower_row_cropping_idx'],
+                                   'upper_row_cropping_idx': requested_window['lower_row_cropping_idx'] + rows,
+                                   'lower_col_cropping_idx': requested_window['lower_col_cropping_idx'],
+                                   'upper_col_cropping_idx': requested_window['lower_col_cropping_idx'] + cols}
+    
+    
+    def _prepare_tiled_microscopy_image(self, microscopy_reader_configs: Dict, tile_size: int) -> None:
+        microscopy_image_data_loader = DataLoader()
+        microscopy_image_reader_class = microscopy_image_data_loader.determine_reader(file_extension = self.file_info['microscopy_filetype'],
+                                                                                      data_reader_module = readers.microscopy_images)
+        def read_tile(row_slice: slice, col_slice: slice) -> np.ndarray:
+            tile_reader_configs = microscopy_reader_configs.copy()
+            tile_reader_configs['spatial_window'] = {'lower_row_cropping_idx': row_slice.start,
+                                                     'upper_row_cropping_idx': row_slice.stop,
+                                                     'lower_col_cropping_idx': col_slice.start,
+                                                     'upper_col_cropping_idx': col_slice.stop}
+            return microscopy_image_data_loader.load(data_reader_class = microscopy_image_reader_class,
+                                                     filepath = self.file_info['microscopy_filepath'],
+                                                     reader_configs = tile_reader_configs,
+                                                     use_cache = False)
+        shape = microscopy_image_data_loader.load_shape(data_reader_class = microscopy_image_reader_class,
+                                                        filepath = self.file_info['microscopy_filepath'],
+                                                        reader_configs = microscopy_reader_configs)
+        self.preprocessed_image = None
+        self.preprocessed_tiles = TiledZStack(shape = shape,
+                                              dtype = read_tile(slice(0, 1), slice(0, 1)).dtype,
+                                              read_tile = read_tile,
+                                              tile_size = tile_size)
+    
+    
+    def get_rows_and_cols_of_image(self) -> Tuple[int, int]:
+        """
+        Returns the number of rows and columns of the (so far preprocessed) image. If its planes are 
+        streamed (i.e. "preprocessed_planes" is set), they are not read for this, but the shape is taken
+        from "preprocessed_planes_shape" (see `PreprocessingStrategy.stream_planes()`).
+        """
+        if self.preprocessed_tiles != None:
+            rows, cols = self.preprocessed_tiles.shape[1:3]
+        elif self.preprocessed_planes != None:
+            rows, cols = self.preprocessed_planes_shape[1:3]
+        else:
+            rows, cols = self.preprocessed_image.shape[1:3]
+        return rows, cols
     
 
     def _load_rois(self, roi_reader_configs: Dict) -> Dict[str, Dict[str, Polygon]]:
         if roi_reader_configs['create_rois'] == True:
-            max_row_idx, max_col_idx = self.preprocessed_image.shape[1:3]
+            max_row_idx, max_col_idx = self.get_rows_and_cols_of_image()
             roi_covering_whole_image = Polygon([(0, 0),
                                                 (max_row_idx, 0),
                                                 (max_row_idx, max_col_idx),
@@ -128,12 +396,280 @@ class PreprocessingObject(ProcessingObject):
         return extracted_roi_data
 
 
+    def run_all_strategies(self, strategies: List[PreprocessingStrategy], strategy_configs: List[Dict]) -> None:
+        """
+        Extends `ProcessingObject.run_all_strategies()`: as long as the microscopy image is streamed plane by 
+        plane (see `load_image_and_rois()`), all strategies that support plane streaming are chained on the 
+        streamed planes. Only before the first strategy that requires the entire z-stack (or after the last
+        strategy), the processed planes are gathered as "preprocessed_image". Moreover, consecutive strategies
+        of the "pointwise" `processing_kind` are fused into a single pass over the image (see 
+        `_run_fused_pointwise_strategies()`). Strategies of the "crop" kind select only a window of the image
+        (views of the preprocessed image, or slices of the streamed planes) and are thus anyways applied in the 
+        same pass as the following strategies. The tracking histories are nevertheless updated in the order of
+        the strategies. If the planes are still streamed after the last strategy and the "intermediate_storage_format"
+        is "npy" or "zarr", they are not gathered at all, but written one by one directly into the preprocessed z-stack
+        on disk (see `save_preprocessed_images_on_disk()`), which then also updates the remaining tracking histories.
+        In the tiled processing mode (i.e. if "preprocessed_tiles" is set, see `load_image_and_rois()`), all strategies
+        are instead added to the `TiledZStack`, such that they will only be applied tile by tile once the preprocessed
+        image is saved (see `save_preprocessed_images_on_disk()`), while only the statistics that the strategies require
+        are gathered here (again tile by tile).
+        """
+        if self.preprocessed_tiles != None:
+            self._run_all_strategies_on_tiles(strategies = strategies, strategy_configs = strategy_configs)
+        else:
+            for fused_strategies_and_configs in self._compile_processing_chain(strategies = strategies, strategy_configs = strategy_configs):
+                if len(fused_strategies_and_configs) > 1:
+                    self._run_fused_pointwise_strategies(strategies_and_configs = fused_strategies_and_configs,
+                                                         streamed_strategies_and_configs = self.streamed_strategies_and_configs)
+                else:
+                    processing_strategy, configs = fused_strategies_and_configs[0]
+                    self._run_single_strategy(processing_strategy = processing_strategy, 
+                                              configs = configs,
+                                              streamed_strategies_and_configs = self.streamed_strategies_and_configs)
+            storage_format = getattr(self.database.project_configs, 'intermediate_storage_format', 'png')
+            if storage_format not in ['npy', 'zarr']: # PNG planes can not be written before the entire z-stack is known
+                self._gather_streamed_planes(streamed_strategies_and_configs = self.streamed_strategies_and_configs)
+        
+        
+    def _compile_processing_chain(self, 
+                                  strategies: List[PreprocessingStrategy], 
+                                  strategy_configs: List[Dict]
+                                 ) -> List[List[Tuple[PreprocessingStrategy, Dict]]]:
+        """
+        Groups consecutive strategies of the "pointwise" `processing_kind`, which can be fused, while
+        all other strategies remain on their own.
+        """
+        processing_chain = []
+        for strategy, configs in zip(strategies, strategy_configs):
+            processing_strategy = strategy()
+            if (processing_strategy.processing_kind == 'pointwise') and (len(processing_chain) > 0):
+                previous_strategy = processing_chain[-1][-1][0]
+                if previous_strategy.processing_kind == 'pointwise':
+                    processing_chain[-1].append((processing_strategy, configs))
+                else:
+                    processing_chain.append([(processing_strategy, configs)])
+            else:
+                processing_chain.append([(processing_strategy, configs)])
+        return processing_chain
+    
+    
+    def _run_single_strategy(self, 
+                             processing_strategy: PreprocessingStrategy, 
+                             configs: Dict, 
+                             streamed_strategies_and_configs: List[Tuple[PreprocessingStrategy, Dict]]
+                            ) -> None:
+        if (self.preprocessed_planes != None) and (processing_strategy.supports_plane_streaming == True):
+            self.preprocessed_planes = processing_strategy.stream_planes(iterate_planes = self.preprocessed_planes,
+                                                                         processing_object = self,
+                                                                         strategy_configs = configs)
+            streamed_strategies_and_configs.append((processing_strategy, configs))
+        else:
+            self._gather_streamed_planes(streamed_strategies_and_configs = streamed_strategies_and_configs)
+            self = processing_strategy.run(processing_object = self, strategy_configs = configs)
+            self = processing_strategy.update_tracking_histories(processing_object = self, strategy_configs = configs)
+    
+    
+    def _run_fused_pointwise_strategies(self, 
+                                        strategies_and_configs: List[Tuple[PreprocessingStrategy, Dict]], 
+                                        streamed_strategies_and_configs: List[Tuple[PreprocessingStrategy, Dict]]
+                                       ) -> None:
+        """
+        For 8- and 16-bit images, a first pass computes the histograms of each plane and color-channel. From 
+        these, each strategy derives its lookup tables (see `PreprocessingStrategy.compute_lookup_tables()`), 
+        while the histograms are updated accordingly for the next strategy. The lookup tables of all strategies
+        are then composed and applied in a single pass, chunk by chunk, which writes directly into the output 
+        (or, if the dtype remains the same, back into "preprocessed_image"). Hence, no intermediate images are 
+        created. Images of other dtypes are processed by each strategy on its own.
+        """
+        if self.preprocessed_planes != None:
+            iterate_planes = self.preprocessed_planes
+        else:
+            iterate_planes = partial(iter, self.preprocessed_image)
+        planes = iterate_planes()
+        first_plane = next(planes)
+        dtype = first_plane.dtype
+        if dtype.name in ['uint8', 'uint16']:
+            histograms = np.stack([self._compute_histograms_of_plane(plane = first_plane)] + 
+                                  [self._compute_histograms_of_plane(plane = plane) for plane in planes], axis = 0)
+            del first_plane, planes
+            lookup_tables = self._compile_lookup_tables(strategies_and_configs = strategies_and_configs, histograms = histograms, dtype = dtype)
+            if self.preprocessed_planes != None:
+                self.preprocessed_planes = partial(self._iterate_planes_mapped_by_lookup_tables, 
+                                                   iterate_planes = iterate_planes, 
+                                                   lookup_tables = lookup_tables)
+                streamed_strategies_and_configs.extend(strategies_and_configs)
+            else:
+                if (lookup_tables.dtype == self.preprocessed_image.dtype) and (self.preprocessed_image.flags.writeable == True):
+                    mapped_zstack = self.preprocessed_image
+                else:
+                    mapped_zstack = np.empty(self.preprocessed_image.shape, dtype = lookup_tables.dtype)
+                for plane_index in range(self.preprocessed_image.shape[0]):
+                    self._map_plane_by_lookup_tables(plane = self.preprocessed_image[plane_index], 
+                                                     lookup_tables = lookup_tables[plane_index],
+                                                     out = mapped_zstack[plane_index])
+                self.preprocessed_image = mapped_zstack
+                for processing_strategy, configs in strategies_and_configs:
+                    self = processing_strategy.update_tracking_histories(processing_object = self, strategy_configs = configs)
+        else:
+            del first_plane, planes
+            for processing_strategy, configs in strategies_and_configs:
+                self._run_single_strategy(processing_strategy = processing_strategy, 
+                                          configs = configs,
+                                          streamed_strategies_and_configs = streamed_strategies_and_configs)
+    
+    
+    def _compile_lookup_tables(self, 
+                               strategies_and_configs: List[Tuple[PreprocessingStrategy, Dict]], 
+                               histograms: np.ndarray, 
+                               dtype: np.dtype
+                              ) -> np.ndarray:
+        """
+        Composes the lookup tables of all pointwise strategies into one lookup table per plane and color-channel.
+        """
+        lookup_tables = None
+        for processing_strategy, configs in strategies_and_configs:
+            strategy_lookup_tables = processing_strategy.compute_lookup_tables(histograms = histograms,
+                                                                               dtype = dtype,
+                                                                               processing_object = self,
+                                                                               strategy_configs = configs)
+            histograms = self._apply_lookup_tables_to_histograms(histograms = histograms, lookup_tables = strategy_lookup_tables)
+            if lookup_tables is None:
+                lookup_tables = strategy_lookup_tables
+            else:
+                lookup_tables = np.take_along_axis(strategy_lookup_tables, lookup_tables, axis = -1)
+            dtype = strategy_lookup_tables.dtype
+        return lookup_tables
+    
+    
+    def _run_all_strategies_on_tiles(self, strategies: List[PreprocessingStrategy], strategy_configs: List[Dict]) -> None:
+        for fused_strategies_and_configs in self._compile_processing_chain(strategies = strategies, strategy_configs = strategy_configs):
+            if fused_strategies_and_configs[0][0].processing_kind == 'pointwise':
+                self._run_pointwise_strategies_on_tiles(strategies_and_configs = fused_strategies_and_configs)
+            else:
+                processing_strategy, configs = fused_strategies_and_configs[0]
+                self.preprocessed_tiles = processing_strategy.process_tiles(tiled_zstack = self.preprocessed_tiles,
+                                                                            processing_object = self,
+                                                                            strategy_configs = configs)
+            for processing_strategy, configs in fused_strategies_and_configs:
+                self = processing_strategy.update_tracking_histories(processing_object = self, strategy_configs = configs)
+    
+    
+    def _run_pointwise_strategies_on_tiles(self, strategies_and_configs: List[Tuple[PreprocessingStrategy, Dict]]) -> None:
+        """
+        Like `_run_fused_pointwise_strategies()`, while the histograms are gathered tile by tile, and the composed 
+        lookup tables are only applied lazily to each tile.
+        """
+        tiled_zstack = self.preprocessed_tiles
+        if tiled_zstack.dtype.name not in ['uint8', 'uint16']:
+            raise NotImplementedError('Tiled processing of pointwise strategies (e.g. ConvertTo8BitStrat) is only available for 8- or 16-bit '
+                                      f'images, while the (so far preprocessed) image of file_id {self.file_id} is of dtype {tiled_zstack.dtype.name}.')
+        n_values = np.iinfo(tiled_zstack.dtype).max + 1
+        histograms = np.zeros((tiled_zstack.shape[0], tiled_zstack.shape[3], n_values), dtype = 'int64')
+        for row_slice, col_slice, tile in tiled_zstack.iter_tiles():
+            for plane_index in range(tile.shape[0]):
+                histograms[plane_index] += self._compute_histograms_of_plane(plane = tile[plane_index])
+        lookup_tables = self._compile_lookup_tables(strategies_and_configs = strategies_and_configs, histograms = histograms, dtype = tiled_zstack.dtype)
+        def map_tile_by_lookup_tables(tile: np.ndarray) -> np.ndarray:
+            mapped_tile = np.empty(tile.shape, dtype = lookup_tables.dtype)
+            for plane_index in range(tile.shape[0]):
+                self._map_plane_by_lookup_tables(plane = tile[plane_index], lookup_tables = lookup_tables[plane_index], out = mapped_tile[plane_index])
+            return mapped_tile
+        self.preprocessed_tiles = tiled_zstack.map_tiles(process_tile = map_tile_by_lookup_tables, dtype = lookup_tables.dtype)
+    
+    
+    def _compute_histograms_of_plane(self, plane: np.ndarray) -> np.ndarray:
+        n_values = np.iinfo(plane.dtype).max + 1
+        histograms = np.zeros((plane.shape[2], n_values), dtype = 'int64')
+        for row_slice in utils.get_row_chunks(image = plane):
+            for channel_index in range(plane.shape[2]):
+                histograms[channel_index] += np.bincount(plane[row_slice, :, channel_index].ravel(), minlength = n_values)
+        return histograms
+    
+    
+    def _apply_lookup_tables_to_histograms(self, histograms: np.ndarray, lookup_tables: np.ndarray) -> np.ndarray:
+        n_values = np.iinfo(lookup_tables.dtype).max + 1
+        mapped_histograms = np.zeros(histograms.shape[:2] + (n_values,), dtype = 'int64')
+        for plane_index in range(histograms.shape[0]):
+            for channel_index in range(histograms.shape[1]):
+                mapped_histograms[plane_index, channel_index] = np.bincount(lookup_tables[plane_index, channel_index],
+                                                                            weights = histograms[plane_index, channel_index],
+                                                                            minlength = n_values)
+        return mapped_histograms
+    
+    
+    def _iterate_planes_mapped_by_lookup_tables(self, iterate_planes: Callable[[], Iterator[np.ndarray]], lookup_tables: np.ndarray) -> Iterator[np.ndarray]:
+        for plane_index, plane in enumerate(iterate_planes()):
+            yield self._map_plane_by_lookup_tables(plane = plane, 
+                                                   lookup_tables = lookup_tables[plane_index], 
+                                                   out = np.empty(plane.shape, dtype = lookup_tables.dtype))
+    
+    
+    def _map_plane_by_lookup_tables(self, plane: np.ndarray, lookup_tables: np.ndarray, out: np.ndarray) -> np.ndarray:
+        same_lookup_table_for_all_channels = bool(np.all(lookup_tables == lookup_tables[0]))
+        for row_slice in utils.get_row_chunks(image = plane):
+            if same_lookup_table_for_all_channels == True:
+                np.take(lookup_tables[0], plane[row_slice], out = out[row_slice])
+            else:
+                for channel_index in range(plane.shape[2]):
+                    np.take(lookup_tables[channel_index], plane[row_slice, :, channel_index], out = out[row_slice, :, channel_index])
+        return out
+        
+        
+    def _gather_streamed_planes(self, streamed_strategies_and_configs: List[Tuple[PreprocessingStrategy, Dict]]) -> None:
+        """
+        The z-stack is preallocated once the first plane was processed, and then filled plane by plane. 
+        Hence, only a single processed plane has to be kept in memory in addition to the z-stack itself.
+        """
+        if self.preprocessed_planes != None:
+            planes = self.preprocessed_planes()
+            first_plane = next(planes)
+            self.preprocessed_image = np.empty((self.preprocessed_planes_shape[0],) + first_plane.shape, dtype = first_plane.dtype)
+            self._write_streamed_planes(zstack = self.preprocessed_image, planes = itertools.chain([first_plane], planes))
+            del first_plane, planes
+        self._finish_plane_streaming(streamed_strategies_and_configs = streamed_strategies_and_configs)
+        
+        
+    def _write_streamed_planes(self, 
+                               zstack: np.ndarray, # preallocated z-stack (in memory, or created on disk via `Database.create_zstack()`)
+                               planes: Iterator[np.ndarray]
+                              ) -> None:
+        assert tuple(zstack.shape[1:3]) == tuple(self.preprocessed_planes_shape[1:3]), ('The streamed planes do not match the "preprocessed_planes_shape" - '
+                                                                                       'please make sure that all streamed strategies keep it up to date!')
+        written_planes = 0
+        for plane_idx, plane in enumerate(planes):
+            assert plane_idx < zstack.shape[0], ('More planes were streamed than specified in "preprocessed_planes_shape" - '
+                                                 'please make sure that all streamed strategies keep it up to date!')
+            if zstack.ndim == 3: # single color-channel z-stacks are saved without the color-channel axis
+                plane = plane[..., 0]
+            zstack[plane_idx] = plane.astype(zstack.dtype, copy = False)
+            written_planes += 1
+        assert written_planes == zstack.shape[0], ('Fewer planes were streamed than specified in "preprocessed_planes_shape" - '
+                                                   'please make sure that all streamed strategies keep it up to date!')
+        
+        
+    def _finish_plane_streaming(self, streamed_strategies_and_configs: List[Tuple[PreprocessingStrategy, Dict]]) -> None:
+        self.preprocessed_planes = None
+        self.preprocessed_planes_shape = None
+        # the strategies may only know all infos for their tracking histories once the planes were processed:
+        for processing_strategy, configs in streamed_strategies_and_configs:
+            self = processing_strategy.update_tracking_histories(processing_object = self, strategy_configs = configs)
+        streamed_strategies_and_configs.clear()
+
+
     def _add_processing_specific_infos_to_updates(self, updates: Dict) -> Dict:
-        if self.preprocessed_image.shape[3] == 3:
+        if self.preprocessed_tiles != None:
+            preprocessed_image_shape = self.preprocessed_tiles.shape
+        elif self.preprocessed_image is None: # the streamed planes were directly written to disk
+            preprocessed_image_shape = self.preprocessed_zstack_shape
+        else:
+            preprocessed_image_shape = self.preprocessed_image.shape
+        if preprocessed_image_shape[3] == 3:
             updates['RGB'] = True
         else:
             updates['RGB'] = False
-        updates['total_planes'] = self.preprocessed_image.shape[0]
+        updates['total_planes'] = preprocessed_image_shape[0]
+        if self.bit_depth != None: # determined by the ConvertTo8BitStrat
+            updates['bit_depth'] = self.bit_depth
         return updates
 
 
@@ -156,14 +692,81 @@ class PreprocessingObject(ProcessingObject):
         min_col_idx = cropping_indices['lower_col_cropping_idx']
         max_col_idx = cropping_indices['upper_col_cropping_idx']
         return zstack[:, min_row_idx:max_row_idx, min_col_idx:max_col_idx, :]
+
+    
+    def crop_streamed_planes(self, 
+                             iterate_planes: Callable[[], Iterator[np.ndarray]], 
+                             cropping_indices: Dict[str, int]
+                            ) -> Callable[[], Iterator[np.ndarray]]:
+        """
+        Streaming variant of `crop_rgb_zstack()`, which also updates the "preprocessed_planes_shape" accordingly.
+        """
+        total_planes, rows, cols, color_channels = self.preprocessed_planes_shape
+        row_slice = slice(cropping_indices['lower_row_cropping_idx'], cropping_indices['upper_row_cropping_idx'])
+        col_slice = slice(cropping_indices['lower_col_cropping_idx'], cropping_indices['upper_col_cropping_idx'])
+        self.preprocessed_planes_shape = (total_planes, len(range(rows)[row_slice]), len(range(cols)[col_slice]), color_channels)
+        def iterate_cropped_planes() -> Iterator[np.ndarray]:
+            for plane in iterate_planes():
+                yield self.crop_rgb_zstack(zstack = plane[np.newaxis], cropping_indices = cropping_indices)[0]
+        return iterate_cropped_planes
     
 
     def save_preprocessed_images_on_disk(self) -> None:
-        for plane_index in range(self.preprocessed_image.shape[0]):
-            image = self.preprocessed_image[plane_index].astype('uint8')
-            out_dir_path = self.database.project_configs.root_dir.joinpath(self.database.preprocessed_images_dir)
-            filename = f'{self.file_id}-{str(plane_index).zfill(3)}.png'
-            imsave(out_dir_path.joinpath(filename), image)
+        out_dir_path = self.database.project_configs.root_dir.joinpath(self.database.preprocessed_images_dir)
+        if self.preprocessed_tiles != None:
+            self._save_preprocessed_tiles_on_disk(out_dir_path = out_dir_path)
+        elif self.preprocessed_planes != None:
+            self._save_streamed_planes_on_disk(out_dir_path = out_dir_path)
+        else:
+            zstack = self.preprocessed_image.astype('uint8', copy = False)
+            if zstack.shape[3] == 1:
+                zstack = zstack[..., 0]
+            self.database.save_zstack(zstack = zstack, dir_path = out_dir_path, file_id = self.file_id)
+            
+            
+    def _save_preprocessed_tiles_on_disk(self, out_dir_path: Union[PosixPath, WindowsPath]) -> None:
+        """
+        Processes the image tile by tile, while each tile is directly written into the 
+        intermediate z-stack on disk (see `Database.create_zstack()`).
+        """
+        if self.preprocessed_tiles.shape[3] == 1:
+            zstack_shape = self.preprocessed_tiles.shape[:3]
+        else:
+            zstack_shape = self.preprocessed_tiles.shape
+        zstack = self.database.create_zstack(dir_path = out_dir_path, 
+                                             file_id = self.file_id, 
+                                             shape = zstack_shape, 
+                                             dtype = 'uint8', 
+                                             tile_size = self.preprocessed_tiles.tile_size)
+        for row_slice, col_slice, tile in self.preprocessed_tiles.iter_tiles():
+            tile = tile.astype('uint8', copy = False)
+            if self.preprocessed_tiles.shape[3] == 1:
+                tile = tile[..., 0]
+            zstack[:, row_slice, col_slice] = tile
+        if isinstance(zstack, np.memmap):
+            zstack.flush()
+
+
+    def _save_streamed_planes_on_disk(self, out_dir_path: Union[PosixPath, WindowsPath]) -> None:
+        """
+        Processes the streamed planes one after another, while each plane is directly written into the 
+        intermediate z-stack on disk (see `Database.create_zstack()`). Afterwards, the tracking histories 
+        of the streamed strategies are updated (see `run_all_strategies()`).
+        """
+        self.preprocessed_zstack_shape = self.preprocessed_planes_shape
+        if self.preprocessed_planes_shape[3] == 1:
+            zstack_shape = self.preprocessed_planes_shape[:3]
+        else:
+            zstack_shape = self.preprocessed_planes_shape
+        zstack = self.database.create_zstack(dir_path = out_dir_path, 
+                                             file_id = self.file_id, 
+                                             shape = zstack_shape, 
+                                             dtype = 'uint8', 
+                                             tile_size = max(zstack_shape[1:3])) # i.e. one chunk per plane
+        self._write_streamed_planes(zstack = zstack, planes = self.preprocessed_planes())
+        if isinstance(zstack, np.memmap):
+            zstack.flush()
+        self._finish_plane_streaming(streamed_strategies_and_configs = self.streamed_strategies_and_configs)
 
 
     def save_preprocessed_rois_in_database(self) -> None:
@@ -5,15 +5,16 @@ __all__ = ['CropStitchingArtefactsRGBStrat', 'CropToROIsBoundingBoxStrat', 'Conv
            'MaximumIntensityProjectionStrat', 'MinimumIntensityProjectionStrat', 'AdjustBrightnessAndContrastStrat']
 
 # %% ../../nbs/api/05_preprocessing_01_strategies.ipynb 2
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Optional, Callable, Iterator, Iterable, Union
 from shapely.geometry import Polygon
 import numpy as np
 from skimage import exposure
 
 
-from .specs import PreprocessingObject, PreprocessingStrategy
+from .specs import PreprocessingObject, PreprocessingStrategy, TiledZStack
 from ..database import Database
 from ..configs import DefaultConfigs, GUIConfigs
+from .. import utils
 
 # %% ../../nbs/api/05_preprocessing_01_strategies.ipynb 4
 class CropStitchingArtefactsRGBStrat(PreprocessingStrategy):
@@ -59,14 +60,54 @@ class CropStitchingArtefactsRGBStrat(PreprocessingStrategy):
         return {}
 
     
+    @property
+    def supports_plane_streaming(self):
+        return True
+    
+    
+    @property
+    def processing_kind(self):
+        return 'crop'
+    
+    
+    @property
+    def supports_tiled_processing(self):
+        return True
+
+    
     def run(self, processing_object: PreprocessingObject, strategy_configs: Dict) -> PreprocessingObject:
-        self.cropping_indices = self._determine_cropping_indices_for_entire_zstack(preprocessing_object = processing_object, color_of_artefact_pixels = strategy_configs["color_of_artefact_pixels"])
+        self.cropping_indices = self._determine_cropping_indices_for_entire_zstack(zstack = processing_object.preprocessed_image, 
+                                                                                   color_of_artefact_pixels = strategy_configs["color_of_artefact_pixels"])
         processing_object.preprocessed_image = processing_object.crop_rgb_zstack(zstack = processing_object.preprocessed_image,
                                                                                  cropping_indices = self.cropping_indices)
         processing_object.preprocessed_rois = processing_object.adjust_rois(rois_dict = processing_object.preprocessed_rois,
                                                                             lower_row_cropping_idx = self.cropping_indices['lower_row_cropping_idx'],
                                                                             lower_col_cropping_idx = self.cropping_indices['lower_col_cropping_idx'])
         return processing_object
+    
+    
+    def stream_planes(self, 
+                      iterate_planes: Callable[[], Iterator[np.ndarray]], 
+                      processing_object: PreprocessingObject, 
+                      strategy_configs: Dict
+                     ) -> Callable[[], Iterator[np.ndarray]]:
+        # first pass: only the artefact pixel counts per row and column of each plane have to be kept in memory
+        self.cropping_indices = self._determine_cropping_indices_for_entire_zstack(zstack = iterate_planes(), 
+                                                                                   color_of_artefact_pixels = strategy_configs["color_of_artefact_pixels"])
+        iterate_cropped_planes = processing_object.crop_streamed_planes(iterate_planes = iterate_planes, cropping_indices = self.cropping_indices)
+        processing_object.preprocessed_rois = processing_object.adjust_rois(rois_dict = processing_object.preprocessed_rois,
+                                                                            lower_row_cropping_idx = self.cropping_indices['lower_row_cropping_idx'],
+                                                                            lower_col_cropping_idx = self.cropping_indices['lower_col_cropping_idx'])
+        return iterate_cropped_planes
+    
+    
+    def process_tiles(self, tiled_zstack: TiledZStack, processing_object: PreprocessingObject, strategy_configs: Dict) -> TiledZStack:
+        self.cropping_indices = self._determine_cropping_indices_from_tiles(tiled_zstack = tiled_zstack,
+                                                                            color_of_artefact_pixels = strategy_configs["color_of_artefact_pixels"])
+        processing_object.preprocessed_rois = processing_object.adjust_rois(rois_dict = processing_object.preprocessed_rois,
+                                                                            lower_row_cropping_idx = self.cropping_indices['lower_row_cropping_idx'],
+                                                                            lower_col_cropping_idx = self.cropping_indices['lower_col_cropping_idx'])
+        return tiled_zstack.crop(cropping_indices = self.cropping_indices)
 
 
     def _add_strategy_specific_infos_to_updates(self, updates: Dict) -> Dict:
@@ -77,24 +118,48 @@ class CropStitchingArtefactsRGBStrat(PreprocessingStrategy):
         return updates
 
 
-    def _determine_cropping_indices_for_entire_zstack(self, preprocessing_object: PreprocessingObject, color_of_artefact_pixels: str) -> Dict:
-        for plane_index in range(preprocessing_object.preprocessed_image.shape[0]):
-            rgb_image_plane = preprocessing_object.preprocessed_image[plane_index]
-            if color_of_artefact_pixels == "black":
-                rows_with_artefact_color_px, columns_with_artefact_color_px = np.where(np.all(rgb_image_plane == 0, axis = -1))
-            else: # color_of_artefact_pixels == "white"
-                max_value = rgb_image_plane.max()
-                if max_value <= 255: # 8-bit image
-                    white_value = 255
-                elif max_value <= 4095: # 16-bit image
-                    white_value = 4095
-                elif max_value <= 65535: # 32-bit image
-                    white_value = 65535
-                else:
-                    raise NotImplementedError("The supported bit-values are 8, 16 or 32!")
-                rows_with_artefact_color_px, columns_with_artefact_color_px = np.where(np.all(rgb_image_plane == white_value, axis = -1))
-            lower_row_idx, upper_row_idx = self._get_cropping_indices(rows_with_artefact_color_px)
-            lower_col_idx, upper_col_idx = self._get_cropping_indices(columns_with_artefact_color_px)  
+    def _determine_cropping_indices_for_entire_zstack(self, zstack: Union[np.ndarray, Iterable[np.ndarray]], color_of_artefact_pixels: str) -> Dict:
+        """
+        Determines the cropping indices in a single pass over the planes of "zstack", which can therefore also
+        be an iterator over the planes (see `stream_planes`). The indices are chosen such that the artefacts of
+        all planes are removed.
+        """
+        artefact_px_counts_per_plane = (self._count_artefact_pixels_per_row_and_column(rgb_image_plane = rgb_image_plane,
+                                                                                       artefact_value = self._get_artefact_value(color_of_artefact_pixels = color_of_artefact_pixels,
+                                                                                                                                 compute_max_value = rgb_image_plane.max))
+                                        for rgb_image_plane in zstack)
+        return self._get_cropping_indices_for_all_planes(artefact_px_counts_per_plane = artefact_px_counts_per_plane)
+    
+    
+    def _determine_cropping_indices_from_tiles(self, tiled_zstack: TiledZStack, color_of_artefact_pixels: str) -> Dict:
+        """
+        Gathers the counts of artefact pixels per row and column of each plane tile by tile. For white artefact 
+        pixels, the maximal value of each plane (which determines the artefact value) is determined in a first pass.
+        """
+        n_planes, n_rows, n_cols = tiled_zstack.shape[:3]
+        if color_of_artefact_pixels == "white":
+            max_value_per_plane = np.zeros(n_planes, dtype = tiled_zstack.dtype)
+            for row_slice, col_slice, tile in tiled_zstack.iter_tiles():
+                max_value_per_plane = np.maximum(max_value_per_plane, tile.max(axis = (1, 2, 3)))
+        else:
+            max_value_per_plane = [None] * n_planes
+        artefact_values = [self._get_artefact_value(color_of_artefact_pixels = color_of_artefact_pixels, compute_max_value = lambda: max_value)
+                           for max_value in max_value_per_plane]
+        artefact_px_per_row = np.zeros((n_planes, n_rows), dtype = 'int64')
+        artefact_px_per_column = np.zeros((n_planes, n_cols), dtype = 'int64')
+        for row_slice, col_slice, tile in tiled_zstack.iter_tiles():
+            for plane_index in range(n_planes):
+                artefact_px_per_tile_row, artefact_px_per_tile_column = self._count_artefact_pixels_per_row_and_column(rgb_image_plane = tile[plane_index],
+                                                                                                                     artefact_value = artefact_values[plane_index])
+                artefact_px_per_row[plane_index, row_slice] += artefact_px_per_tile_row
+                artefact_px_per_column[plane_index, col_slice] += artefact_px_per_tile_column
+        return self._get_cropping_indices_for_all_planes(artefact_px_counts_per_plane = zip(artefact_px_per_row, artefact_px_per_column))
+    
+    
+    def _get_cropping_indices_for_all_planes(self, artefact_px_counts_per_plane: Iterable[Tuple[np.ndarray, np.ndarray]]) -> Dict:
+        for plane_index, (artefact_px_per_row, artefact_px_per_column) in enumerate(artefact_px_counts_per_plane):
+            lower_row_idx, upper_row_idx = self._get_cropping_indices(artefact_px_per_row)
+            lower_col_idx, upper_col_idx = self._get_cropping_indices(artefact_px_per_column)  
             if plane_index == 0:
                 min_lower_row_cropping_idx, max_upper_row_cropping_idx = lower_row_idx, upper_row_idx
                 min_lower_col_cropping_idx, max_upper_col_cropping_idx = lower_col_idx, upper_col_idx
@@ -112,15 +177,49 @@ class CropStitchingArtefactsRGBStrat(PreprocessingStrategy):
                             'lower_col_cropping_idx': min_lower_col_cropping_idx,
                             'upper_col_cropping_idx': max_upper_col_cropping_idx}
         return cropping_indices
-    
-    
-    def _get_cropping_indices(self, a, min_artefact_px_stretch: int=100) -> Tuple[int, int]:
-        unique, counts = np.unique(a, return_counts=True)
-        indices_with_artefact_pixels = unique[np.where(counts >= min_artefact_px_stretch)]
+
+
+    def _get_artefact_value(self, color_of_artefact_pixels: str, compute_max_value: Callable[[], Union[int, float]]) -> int:
+        if color_of_artefact_pixels == "black":
+            artefact_value = 0
+        else: # color_of_artefact_pixels == "white"
+            max_value = compute_max_value()
+            if max_value <= 255: # 8-bit image
+                artefact_value = 255
+            elif max_value <= 4095: # 16-bit image
+                artefact_value = 4095
+            elif max_value <= 65535: # 32-bit image
+                artefact_value = 65535
+            else:
+                raise NotImplementedError("The supported bit-values are 8, 16 or 32!")
+        return artefact_value
+
+
+    def _count_artefact_pixels_per_row_and_column(self, rgb_image_plane: np.ndarray, artefact_value: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Counts the pixels of the plane in which all color channels match the artefact value along both image 
+        axes. The plane is processed in chunks of rows, such that the boolean mask of artefact pixels is never 
+        created for the entire plane and no pixel coordinates have to be collected.
+        """
+        artefact_px_per_row = np.zeros(rgb_image_plane.shape[0], dtype = 'int64')
+        artefact_px_per_column = np.zeros(rgb_image_plane.shape[1], dtype = 'int64')
+        for row_chunk in utils.get_row_chunks(image = rgb_image_plane[..., 0]):
+            # equivalent to np.all(== artefact_value, axis = -1), but without the intermediate mask of all color channels:
+            artefact_px_mask = rgb_image_plane[row_chunk, :, 0] == artefact_value
+            for color_channel_idx in range(1, rgb_image_plane.shape[-1]):
+                artefact_px_mask &= rgb_image_plane[row_chunk, :, color_channel_idx] == artefact_value
+            artefact_px_per_row[row_chunk] = artefact_px_mask.sum(axis = 1)
+            artefact_px_per_column += artefact_px_mask.sum(axis = 0)
+        return artefact_px_per_row, artefact_px_per_column
+    
+    
+    def _get_cropping_indices(self, artefact_px_counts: np.ndarray, min_artefact_px_stretch: int=100) -> Tuple[int, int]:
+        indices_with_artefact_pixels = np.flatnonzero(artefact_px_counts >= min_artefact_px_stretch)
         if indices_with_artefact_pixels.shape[0] > 0: 
-            if np.where(np.diff(indices_with_artefact_pixels) > 1)[0].shape[0] > 0:
-                lower_cropping_index = indices_with_artefact_pixels[np.where(np.diff(indices_with_artefact_pixels) > 1)[0]][0] + 1
-                upper_cropping_index = indices_with_artefact_pixels[np.where(np.diff(indices_with_artefact_pixels) > 1)[0] + 1][0]
+            gaps_between_artefact_stretches = np.flatnonzero(np.diff(indices_with_artefact_pixels) > 1)
+            if gaps_between_artefact_stretches.shape[0] > 0:
+                lower_cropping_index = indices_with_artefact_pixels[gaps_between_artefact_stretches[0]] + 1
+                upper_cropping_index = indices_with_artefact_pixels[gaps_between_artefact_stretches[0] + 1]
             else:
                 if indices_with_artefact_pixels[0] == 0:
                     lower_cropping_index = indices_with_artefact_pixels[-1]
@@ -173,21 +272,84 @@ class CropToROIsBoundingBoxStrat(PreprocessingStrategy):
         return {}
     
     
+    @property
+    def supports_plane_streaming(self):
+        return True
+    
+    
+    @property
+    def processing_kind(self):
+        return 'crop'
+    
+    
+    @property
+    def supports_tiled_processing(self):
+        return True
+    
+    
     def run(self, processing_object: PreprocessingObject, strategy_configs: Dict) -> PreprocessingObject:
-        self.cropping_indices = self._determine_bounding_box(preprocessing_object = processing_object,
-                                                             pad_size = strategy_configs['pad_size'])
-        processing_object.preprocessed_image = processing_object.crop_rgb_zstack(zstack = processing_object.preprocessed_image,
-                                                                                 cropping_indices = self.cropping_indices)
+        if processing_object.reading_window == None:
+            self.cropping_indices = self._determine_bounding_box(preprocessing_object = processing_object,
+                                                                 pad_size = strategy_configs['pad_size'])
+            processing_object.preprocessed_image = processing_object.crop_rgb_zstack(zstack = processing_object.preprocessed_image,
+                                                                                     cropping_indices = self.cropping_indices)
+        else: # only the bounding box was read from the microscopy image file already
+            self.cropping_indices = processing_object.reading_window
+            processing_object.reading_window = None
         processing_object.preprocessed_rois = processing_object.adjust_rois(rois_dict = processing_object.preprocessed_rois,
                                                                             lower_row_cropping_idx = self.cropping_indices['lower_row_cropping_idx'],
                                                                             lower_col_cropping_idx = self.cropping_indices['lower_col_cropping_idx'])
         return processing_object
+    
+    
+    def stream_planes(self, 
+                      iterate_planes: Callable[[], Iterator[np.ndarray]], 
+                      processing_object: PreprocessingObject, 
+                      strategy_configs: Dict
+                     ) -> Callable[[], Iterator[np.ndarray]]:
+        if processing_object.reading_window == None:
+            self.cropping_indices = self._determine_bounding_box(preprocessing_object = processing_object,
+                                                                 pad_size = strategy_configs['pad_size'])
+            iterate_processed_planes = processing_object.crop_streamed_planes(iterate_planes = iterate_planes, cropping_indices = self.cropping_indices)
+        else: # only the bounding box will be read from the microscopy image file anyways
+            self.cropping_indices = processing_object.reading_window
+            processing_object.reading_window = None
+            iterate_processed_planes = iterate_planes
+        processing_object.preprocessed_rois = processing_object.adjust_rois(rois_dict = processing_object.preprocessed_rois,
+                                                                            lower_row_cropping_idx = self.cropping_indices['lower_row_cropping_idx'],
+                                                                            lower_col_cropping_idx = self.cropping_indices['lower_col_cropping_idx'])
+        return iterate_processed_planes
+    
+    
+    def process_tiles(self, tiled_zstack: TiledZStack, processing_object: PreprocessingObject, strategy_configs: Dict) -> TiledZStack:
+        # the tiles are anyways read as windows from the microscopy image file, hence the entire image is represented here
+        self.cropping_indices = self._determine_bounding_box(preprocessing_object = processing_object, pad_size = strategy_configs['pad_size'])
+        processing_object.preprocessed_rois = processing_object.adjust_rois(rois_dict = processing_object.preprocessed_rois,
+                                                                            lower_row_cropping_idx = self.cropping_indices['lower_row_cropping_idx'],
+                                                                            lower_col_cropping_idx = self.cropping_indices['lower_col_cropping_idx'])
+        return tiled_zstack.crop(cropping_indices = self.cropping_indices)
+    
+    
+    def determine_reading_window(self, rois_dict: Dict[str, Dict[str, Polygon]], strategy_configs: Dict) -> Optional[Dict[str, int]]:
+        # upper indices can not be clipped yet, as the image dimensions are unknown - this is done by the reader
+        return self._get_cropping_indices_from_rois(rois_dict = rois_dict, pad_size = strategy_configs['pad_size'])
                                                   
     
     def _determine_bounding_box(self, preprocessing_object: PreprocessingObject, pad_size: int) -> Dict:
-        rois_dict = preprocessing_object.preprocessed_rois.copy()
-        max_row_idx = preprocessing_object.preprocessed_image.shape[1]
-        max_col_idx = preprocessing_object.preprocessed_image.shape[2]
+        max_row_idx, max_col_idx = preprocessing_object.get_rows_and_cols_of_image()
+        return self._get_cropping_indices_from_rois(rois_dict = preprocessing_object.preprocessed_rois,
+                                                    pad_size = pad_size,
+                                                    max_row_idx = max_row_idx,
+                                                    max_col_idx = max_col_idx)
+    
+    
+    def _get_cropping_indices_from_rois(self, 
+                                        rois_dict: Dict[str, Dict[str, Polygon]], 
+                                        pad_size: int, 
+                                        max_row_idx: Optional[int]=None, 
+                                        max_col_idx: Optional[int]=None
+                                       ) -> Dict:
+        rois_dict = rois_dict.copy()
         min_lower_row_cropping_idx, min_lower_col_cropping_idx, max_upper_row_cropping_idx, max_upper_col_cropping_idx = None, None, None, None
         for plane_id in rois_dict.keys():
             for roi_id in rois_dict[plane_id].keys():
@@ -213,11 +375,11 @@ class CropToROIsBoundingBoxStrat(PreprocessingStrategy):
         else:
             min_lower_col_cropping_idx -= pad_size
         
-        if max_upper_row_cropping_idx + pad_size >= max_row_idx:
+        if (max_row_idx != None) and (max_upper_row_cropping_idx + pad_size >= max_row_idx):
             max_upper_row_cropping_idx = max_row_idx
         else:
             max_upper_row_cropping_idx += pad_size
-        if max_upper_col_cropping_idx + pad_size >= max_col_idx:
+        if (max_col_idx != None) and (max_upper_col_cropping_idx + pad_size >= max_col_idx):
             max_upper_col_cropping_idx = max_col_idx
         else:
             max_upper_col_cropping_idx += pad_size        
@@ -269,27 +431,107 @@ class ConvertTo8BitStrat(PreprocessingStrategy):
         return {}
     
     
+    @property
+    def supports_plane_streaming(self):
+        return True
+    
+    
+    @property
+    def processing_kind(self):
+        return 'pointwise'
+    
+    
     def run(self, processing_object: PreprocessingObject, strategy_configs: Dict) -> PreprocessingObject:
         processing_object.preprocessed_image = self._convert_to_8bit(zstack = processing_object.preprocessed_image)
+        processing_object.bit_depth = self.bit_depth
         return processing_object
     
     
-    def _convert_to_8bit(self, zstack: np.ndarray) -> np.ndarray:
-        max_value = zstack.max()
-        if max_value <= 255:
-            pass
-        elif max_value <= 4095:
-            for plane_index in range(zstack.shape[0]):
-                zstack[plane_index] = (zstack[plane_index] / 4095 * 255).round(0)
-        elif max_value <= 65535:
+    def stream_planes(self, 
+                      iterate_planes: Callable[[], Iterator[np.ndarray]], 
+                      processing_object: PreprocessingObject, 
+                      strategy_configs: Dict
+                     ) -> Callable[[], Iterator[np.ndarray]]:
+        def iterate_converted_planes() -> Iterator[np.ndarray]:
+            # the bit depth may depend on the maximal value of the entire z-stack, which then requires a first pass:
+            planes = iterate_planes()
+            first_plane = next(planes)
+            bit_depth = self._determine_bit_depth(dtype = first_plane.dtype,
+                                                  compute_max_value = lambda: max([first_plane.max()] + [plane.max() for plane in planes]))
+            planes.close()
+            processing_object.bit_depth = bit_depth
+            for plane in iterate_planes():
+                yield self._convert_to_8bit(zstack = plane[np.newaxis], bit_depth = bit_depth)[0]
+        return iterate_converted_planes
+    
+    
+    def compute_lookup_tables(self, histograms: np.ndarray, dtype: np.dtype, processing_object: PreprocessingObject, strategy_configs: Dict) -> np.ndarray:
+        self.bit_depth = self._determine_bit_depth(dtype = dtype,
+                                                   compute_max_value = lambda: np.flatnonzero(np.any(histograms, axis = (0, 1)))[-1])
+        processing_object.bit_depth = self.bit_depth
+        if dtype.name == 'uint8':
+            lookup_table = np.arange(256, dtype = 'uint8')
+        else:
+            lookup_table = self._get_lookup_table(bit_depth = self.bit_depth)
+        return np.broadcast_to(lookup_table, histograms.shape)
+    
+    
+    def _convert_to_8bit(self, zstack: np.ndarray, bit_depth: Optional[int]=None) -> np.ndarray:
+        """
+        The converted z-stack is written chunk by chunk into a preallocated 8-bit array, such that 
+        "zstack" remains unchanged and only small temporary arrays are required. 16-bit images (i.e. 
+        also 12-bit images stored as 16-bit) are converted via a lookup table of all possible values.
+        """
+        if bit_depth == None:
+            bit_depth = self._determine_bit_depth(dtype = zstack.dtype, compute_max_value = zstack.max)
+        self.bit_depth = bit_depth
+        if zstack.dtype.name == 'uint8':
+            converted_zstack = zstack
+        else:
+            converted_zstack = np.empty(zstack.shape, dtype = 'uint8')
+            if zstack.dtype.name == 'uint16':
+                lookup_table = self._get_lookup_table(bit_depth = bit_depth)
             for plane_index in range(zstack.shape[0]):
-                zstack[plane_index] = (zstack[plane_index] / 65535 * 255).round(0)
-        if zstack.dtype.name != 'uint8':
-            zstack = zstack.astype('uint8')
-        return zstack
+                for row_slice in utils.get_row_chunks(image = zstack[plane_index]):
+                    if zstack.dtype.name == 'uint16':
+                        converted_zstack[plane_index, row_slice] = lookup_table[zstack[plane_index, row_slice]]
+                    else:
+                        converted_zstack[plane_index, row_slice] = self._rescale_to_8bit(image = zstack[plane_index, row_slice], bit_depth = bit_depth)
+        return converted_zstack
+    
+    
+    def _determine_bit_depth(self, dtype: np.dtype, compute_max_value: Callable[[], Union[int, float]]) -> Optional[int]:
+        """
+        Returns 8, 12, or 16, depending on the maximal value of the image. Note: no rescaling will be 
+        applied to images with larger values (None), and 8-bit images never have to be scanned.
+        """
+        if dtype.name == 'uint8':
+            bit_depth = 8
+        else:
+            max_value = compute_max_value()
+            if max_value <= 255:
+                bit_depth = 8
+            elif max_value <= 4095:
+                bit_depth = 12
+            elif max_value <= 65535:
+                bit_depth = 16
+            else:
+                bit_depth = None
+        return bit_depth
+    
+    
+    def _get_lookup_table(self, bit_depth: Optional[int]) -> np.ndarray:
+        return self._rescale_to_8bit(image = np.arange(65536, dtype = 'uint16'), bit_depth = bit_depth)
+    
+    
+    def _rescale_to_8bit(self, image: np.ndarray, bit_depth: Optional[int]) -> np.ndarray:
+        if bit_depth in [12, 16]:
+            image = (image / (2**bit_depth - 1) * 255).round(0).astype(image.dtype)
+        return image.astype('uint8')
     
 
     def _add_strategy_specific_infos_to_updates(self, updates: Dict) -> Dict:
+        updates['bit_depth'] = self.bit_depth
         return updates 
 
 # %% ../../nbs/api/05_preprocessing_01_strategies.ipynb 7
@@ -328,14 +570,57 @@ class MaximumIntensityProjectionStrat(PreprocessingStrategy):
         return {}
     
     
+    @property
+    def supports_plane_streaming(self):
+        return True
+    
+    
+    @property
+    def processing_kind(self):
+        return 'reduction'
+    
+    
+    @property
+    def supports_tiled_processing(self):
+        return True
+    
+    
     def run(self, processing_object: PreprocessingObject, strategy_configs: Dict) -> PreprocessingObject:
         processing_object.preprocessed_image = self._run_maximum_projection_on_zstack(zstack = processing_object.preprocessed_image)
         processing_object.preprocessed_rois = self._remove_all_single_plane_rois(rois_dict = processing_object.preprocessed_rois)
         return processing_object
     
     
-    def _run_maximum_projection_on_zstack(self, zstack: np.ndarray) -> np.ndarray:
-        max_projection = np.max(zstack, axis=0)
+    def stream_planes(self, 
+                      iterate_planes: Callable[[], Iterator[np.ndarray]], 
+                      processing_object: PreprocessingObject, 
+                      strategy_configs: Dict
+                     ) -> Callable[[], Iterator[np.ndarray]]:
+        processing_object.preprocessed_rois = self._remove_all_single_plane_rois(rois_dict = processing_object.preprocessed_rois)
+        processing_object.preprocessed_planes_shape = (1,) + processing_object.preprocessed_planes_shape[1:]
+        def iterate_projected_planes() -> Iterator[np.ndarray]:
+            yield self._run_maximum_projection_on_zstack(zstack = iterate_planes())[0]
+        return iterate_projected_planes
+    
+    
+    def process_tiles(self, tiled_zstack: TiledZStack, processing_object: PreprocessingObject, strategy_configs: Dict) -> TiledZStack:
+        processing_object.preprocessed_rois = self._remove_all_single_plane_rois(rois_dict = processing_object.preprocessed_rois)
+        return tiled_zstack.map_tiles(process_tile = lambda tile: self._run_maximum_projection_on_zstack(zstack = tile), 
+                                      shape = (1,) + tiled_zstack.shape[1:])
+    
+    
+    def _run_maximum_projection_on_zstack(self, zstack: Union[np.ndarray, Iterable[np.ndarray]]) -> np.ndarray:
+        """
+        Folds the planes one after another into a single plane that holds the maximum of each pixel. Hence,
+        only this accumulator has to be kept in memory, if "zstack" is an iterator over the planes (while they 
+        are read, see `stream_planes`), or a lazily loaded (e.g. memory-mapped) z-stack.
+        """
+        max_projection = None
+        for plane in zstack:
+            if max_projection is None:
+                max_projection = np.array(plane, copy = True)
+            else:
+                np.maximum(max_projection, plane, out = max_projection)
         return max_projection[np.newaxis, :]
     
     
@@ -388,14 +673,57 @@ class MinimumIntensityProjectionStrat(PreprocessingStrategy):
         return {}
     
 
+    @property
+    def supports_plane_streaming(self):
+        return True
+    
+    
+    @property
+    def processing_kind(self):
+        return 'reduction'
+    
+    
+    @property
+    def supports_tiled_processing(self):
+        return True
+    
+    
     def run(self, processing_object: PreprocessingObject, strategy_configs: Dict) -> PreprocessingObject:
         processing_object.preprocessed_image = self._run_minimum_projection_on_zstack(zstack = processing_object.preprocessed_image)
         processing_object.preprocessed_rois = self._remove_all_single_plane_rois(rois_dict = processing_object.preprocessed_rois)
         return processing_object
     
     
-    def _run_minimum_projection_on_zstack(self, zstack: np.ndarray) -> np.ndarray:
-        min_projection = np.min(zstack, axis=0)
+    def stream_planes(self, 
+                      iterate_planes: Callable[[], Iterator[np.ndarray]], 
+                      processing_object: PreprocessingObject, 
+                      strategy_configs: Dict
+                     ) -> Callable[[], Iterator[np.ndarray]]:
+        processing_object.preprocessed_rois = self._remove_all_single_plane_rois(rois_dict = processing_object.preprocessed_rois)
+        processing_object.preprocessed_planes_shape = (1,) + processing_object.preprocessed_planes_shape[1:]
+        def iterate_projected_planes() -> Iterator[np.ndarray]:
+            yield self._run_minimum_projection_on_zstack(zstack = iterate_planes())[0]
+        return iterate_projected_planes
+    
+    
+    def process_tiles(self, tiled_zstack: TiledZStack, processing_object: PreprocessingObject, strategy_configs: Dict) -> TiledZStack:
+        processing_object.preprocessed_rois = self._remove_all_single_plane_rois(rois_dict = processing_object.preprocessed_rois)
+        return tiled_zstack.map_tiles(process_tile = lambda tile: self._run_minimum_projection_on_zstack(zstack = tile), 
+                                      shape = (1,) + tiled_zstack.shape[1:])
+    
+    
+    def _run_minimum_projection_on_zstack(self, zstack: Union[np.ndarray, Iterable[np.ndarray]]) -> np.ndarray:
+        """
+        Folds the planes one after another into a single plane that holds the minimum of each pixel. Hence,
+        only this accumulator has to be kept in memory, if "zstack" is an iterator over the planes (while they 
+        are read, see `stream_planes`), or a lazily loaded (e.g. memory-mapped) z-stack.
+        """
+        min_projection = None
+        for plane in zstack:
+            if min_projection is None:
+                min_projection = np.array(plane, copy = True)
+            else:
+                np.minimum(min_projection, plane, out = min_projection)
         return min_projection[np.newaxis, :]
     
     
@@ -462,6 +790,16 @@ class AdjustBrightnessAndContrastStrat(PreprocessingStrategy):
     def tooltips(self):
         return {}
 
+    @property
+    def supports_plane_streaming(self):
+        return True
+    
+    
+    @property
+    def processing_kind(self):
+        return 'pointwise'
+    
+
     def run(self, processing_object: PreprocessingObject, strategy_configs: Dict) -> PreprocessingObject:
         processing_object.preprocessed_image = self._adjust_brightness_and_contrast(zstack = processing_object.preprocessed_image,
                                                                                     percentage_saturated_pixels = strategy_configs['percentage_saturated_pixels'], 
@@ -469,44 +807,174 @@ class AdjustBrightnessAndContrastStrat(PreprocessingStrategy):
         return processing_object
     
     
+    def stream_planes(self, 
+                      iterate_planes: Callable[[], Iterator[np.ndarray]], 
+                      processing_object: PreprocessingObject, 
+                      strategy_configs: Dict
+                     ) -> Callable[[], Iterator[np.ndarray]]:
+        self._assert_valid_configs(percentage_saturated_pixels = strategy_configs['percentage_saturated_pixels'],
+                                   channel_adjustment_method = strategy_configs['channel_adjustment_method'])
+        def iterate_adjusted_planes() -> Iterator[np.ndarray]:
+            self.min_max_ranges_per_plane_and_channel = []
+            for plane in iterate_planes():
+                yield self._adjust_plane(plane = self._get_writeable_array(array = plane),
+                                         percentage_saturated_pixels = strategy_configs['percentage_saturated_pixels'], 
+                                         channel_adjustment_method = strategy_configs['channel_adjustment_method'])
+        return iterate_adjusted_planes
+    
+    
+    def compute_lookup_tables(self, histograms: np.ndarray, dtype: np.dtype, processing_object: PreprocessingObject, strategy_configs: Dict) -> np.ndarray:
+        percentage_saturated_pixels = strategy_configs['percentage_saturated_pixels']
+        self._assert_valid_configs(percentage_saturated_pixels = percentage_saturated_pixels,
+                                   channel_adjustment_method = strategy_configs['channel_adjustment_method'])
+        self.min_max_ranges_per_plane_and_channel = []
+        lookup_tables = np.empty(histograms.shape, dtype = dtype)
+        for plane_index in range(histograms.shape[0]):
+            if strategy_configs['channel_adjustment_method'] == 'individually':
+                min_max_ranges = []
+                for channel_index in range(histograms.shape[1]):
+                    in_range = self._get_in_range_from_histogram(histogram = histograms[plane_index, channel_index], 
+                                                                 percentage_saturated_pixels = percentage_saturated_pixels)
+                    lookup_tables[plane_index, channel_index] = self._get_lookup_table(dtype = dtype, in_range = in_range)
+                    min_max_ranges.append(in_range)
+                self.min_max_ranges_per_plane_and_channel.append(min_max_ranges)
+            else: # 'globally'
+                in_range = self._get_in_range_from_histogram(histogram = histograms[plane_index].sum(axis = 0), 
+                                                             percentage_saturated_pixels = percentage_saturated_pixels)
+                lookup_tables[plane_index] = self._get_lookup_table(dtype = dtype, in_range = in_range)
+                self.min_max_ranges_per_plane_and_channel.append(in_range)
+        return lookup_tables
+    
+    
     def _adjust_brightness_and_contrast(self, zstack: np.ndarray, percentage_saturated_pixels: float, channel_adjustment_method: str) -> np.ndarray:
         """
         percentage_saturated_pixels: float, less than 50.0
         channel_adjustment_method: str, one of: 'individually', 'globally'
+        Note: the planes of "zstack" are adjusted in place (unless it is read-only).
         """
-        adjusted_zstack = zstack.copy()
+        self._assert_valid_configs(percentage_saturated_pixels = percentage_saturated_pixels, channel_adjustment_method = channel_adjustment_method)
+        adjusted_zstack = self._get_writeable_array(array = zstack)
+        self.min_max_ranges_per_plane_and_channel = []
+        for plane_index in range(adjusted_zstack.shape[0]):
+            self._adjust_plane(plane = adjusted_zstack[plane_index],
+                               percentage_saturated_pixels = percentage_saturated_pixels,
+                               channel_adjustment_method = channel_adjustment_method)
+        return adjusted_zstack
+    
+    
+    def _assert_valid_configs(self, percentage_saturated_pixels: float, channel_adjustment_method: str) -> None:
         if percentage_saturated_pixels >= 50:
             message_line0 = 'The percentage of saturated pixels cannot be set to values equal to or higher than 50.\n'
             message_line1 = 'Suggested default (also used by the ImageJ Auto Adjust method): 0.35'
             error_message = message_line0 + message_line1
             raise ValueError(error_message)
-        if channel_adjustment_method == 'individually':
-            self.min_max_ranges_per_plane_and_channel = []
-            for plane_index in range(adjusted_zstack.shape[0]):
-                min_max_ranges = []
-                for channel_index in range(adjusted_zstack.shape[3]):
-                    in_range_min = int(round(np.percentile(adjusted_zstack[plane_index, :, :, channel_index], percentage_saturated_pixels), 0))
-                    in_range_max = int(round(np.percentile(adjusted_zstack[plane_index, :, :, channel_index], 100 - percentage_saturated_pixels), 0))
-                    in_range = (in_range_min, in_range_max)
-                    adjusted_zstack[plane_index, :, :, channel_index] = exposure.rescale_intensity(image = adjusted_zstack[plane_index, :, :, channel_index], in_range = in_range)
-                    min_max_ranges.append(in_range)
-                self.min_max_ranges_per_plane_and_channel.append(min_max_ranges)
-        elif channel_adjustment_method == 'globally':
-            self.min_max_ranges_per_plane_and_channel = []
-            for plane_index in range(adjusted_zstack.shape[0]):
-                in_range_min = int(round(np.percentile(adjusted_zstack[plane_index], percentage_saturated_pixels), 0))
-                in_range_max = int(round(np.percentile(adjusted_zstack[plane_index], 100 - percentage_saturated_pixels), 0))
-                in_range = (in_range_min, in_range_max)
-                adjusted_zstack[plane_index] = exposure.rescale_intensity(image = adjusted_zstack[plane_index], in_range = in_range)
-                self.min_max_ranges_per_plane_and_channel.append(in_range)
-        else:
+        if channel_adjustment_method not in ['individually', 'globally']:
             raise NotImplementedError("The 'channel_adjustment_method' has to be one of: ['individually', 'globally'].\n",
                                       "-->'individually': the range of intensity values wil be calculated and scaled to the "
                                       "min and max values for each individual channel.\n"
                                       "-->'globally': the range of intensity values will be calculated from and scaled to the "
                                       "global min and max of all channels.\n"
                                       "Either way, min and max values will be determined for each image plane individually.")
-        return adjusted_zstack.copy()
+            
+            
+    def _get_writeable_array(self, array: np.ndarray) -> np.ndarray:
+        if array.flags.writeable == True:
+            writeable_array = array
+        else:
+            writeable_array = array.copy()
+        return writeable_array
+    
+    
+    def _adjust_plane(self, plane: np.ndarray, percentage_saturated_pixels: float, channel_adjustment_method: str) -> np.ndarray:
+        """
+        Adjusts a single plane ([rows, columns, color-channels]) in place and keeps 
+        track of the applied range(s) in "min_max_ranges_per_plane_and_channel".
+        """
+        if channel_adjustment_method == 'individually':
+            min_max_ranges = []
+            for channel_index in range(plane.shape[2]):
+                in_range = self._determine_in_range(image = plane[:, :, channel_index], percentage_saturated_pixels = percentage_saturated_pixels)
+                self._rescale_intensity_in_place(image = plane[:, :, channel_index], in_range = in_range)
+                min_max_ranges.append(in_range)
+            self.min_max_ranges_per_plane_and_channel.append(min_max_ranges)
+        else: # 'globally'
+            in_range = self._determine_in_range(image = plane, percentage_saturated_pixels = percentage_saturated_pixels)
+            self._rescale_intensity_in_place(image = plane, in_range = in_range)
+            self.min_max_ranges_per_plane_and_channel.append(in_range)
+        return plane
+    
+    
+    def _determine_in_range(self, image: np.ndarray, percentage_saturated_pixels: float) -> Tuple[int, int]:
+        """
+        For 8- and 16-bit images, both percentiles are derived from a single histogram of the image, which 
+        yields exactly the same values as `np.percentile` (that is used for all other dtypes), but without sorting.
+        """
+        if image.dtype.name in ['uint8', 'uint16']:
+            in_range = self._get_in_range_from_histogram(histogram = self._compute_histogram(image = image), 
+                                                         percentage_saturated_pixels = percentage_saturated_pixels)
+        else:
+            in_range_min = np.percentile(image, percentage_saturated_pixels)
+            in_range_max = np.percentile(image, 100 - percentage_saturated_pixels)
+            in_range = (int(round(in_range_min, 0)), int(round(in_range_max, 0)))
+        return in_range
+    
+    
+    def _get_in_range_from_histogram(self, histogram: np.ndarray, percentage_saturated_pixels: float) -> Tuple[int, int]:
+        cumulative_histogram = np.cumsum(histogram)
+        in_range_min = self._get_percentile_from_cumulative_histogram(cumulative_histogram = cumulative_histogram, 
+                                                                      percentile = percentage_saturated_pixels)
+        in_range_max = self._get_percentile_from_cumulative_histogram(cumulative_histogram = cumulative_histogram,
+                                                                      percentile = 100 - percentage_saturated_pixels)
+        return (int(round(in_range_min, 0)), int(round(in_range_max, 0)))
+    
+    
+    def _compute_histogram(self, image: np.ndarray) -> np.ndarray:
+        n_bins = np.iinfo(image.dtype).max + 1
+        histogram = np.zeros(n_bins, dtype = 'int64')
+        for row_slice in utils.get_row_chunks(image = image):
+            histogram += np.bincount(image[row_slice].ravel(), minlength = n_bins)
+        return histogram
+    
+    
+    def _get_percentile_from_cumulative_histogram(self, cumulative_histogram: np.ndarray, percentile: float) -> float:
+        """
+        Mirrors the default ("linear") method of `np.percentile`: the values at the two positions of 
+        the sorted pixel values that enclose the (virtual) position of the percentile are looked up in
+        the cumulative histogram, and are then linearly interpolated exactly like numpy does.
+        """
+        n_values = int(cumulative_histogram[-1])
+        virtual_idx = (n_values - 1) * np.true_divide(percentile, 100)
+        if virtual_idx >= n_values - 1:
+            lower_idx, upper_idx = n_values - 1, n_values - 1
+        else:
+            lower_idx = int(np.floor(virtual_idx))
+            upper_idx = lower_idx + 1
+        lower_value, upper_value = np.searchsorted(cumulative_histogram, [lower_idx, upper_idx], side = 'right')
+        gamma = virtual_idx - np.floor(virtual_idx)
+        difference = upper_value - lower_value
+        if gamma >= 0.5:
+            percentile_value = upper_value - difference * (1 - gamma)
+        else:
+            percentile_value = lower_value + difference * gamma
+        return percentile_value
+    
+    
+    def _rescale_intensity_in_place(self, image: np.ndarray, in_range: Tuple[int, int]) -> None:
+        """
+        For 8- and 16-bit images, `exposure.rescale_intensity` is applied only once to all possible pixel values, 
+        and the resulting lookup table is then used to rescale the image chunk by chunk.
+        """
+        if image.dtype.name in ['uint8', 'uint16']:
+            lookup_table = self._get_lookup_table(dtype = image.dtype, in_range = in_range)
+            for row_slice in utils.get_row_chunks(image = image):
+                image[row_slice] = lookup_table[image[row_slice]]
+        else:
+            image[:] = exposure.rescale_intensity(image = image, in_range = in_range)
+    
+    
+    def _get_lookup_table(self, dtype: np.dtype, in_range: Tuple[int, int]) -> np.ndarray:
+        return exposure.rescale_intensity(image = np.arange(np.iinfo(dtype).max + 1, dtype = dtype), in_range = in_range)
+
 
 
     def _add_strategy_specific_infos_to_updates(self, updates: Dict) -> Dict:
@@ -5,7 +5,6 @@ __all__ = ['QuantificationStrategy', 'QuantificationObject']
 
 # %% ../../nbs/api/08_quantification_00_specs.ipynb 2
 from typing import Dict, List
-from skimage import io
 
 from ..core import ProcessingObject, ProcessingStrategy
 from ..configs import DefaultConfigs
@@ -51,13 +50,19 @@ class QuantificationObject(ProcessingObject):
     def widget_names(self):
         widget_names = {'overwrite': 'Checkbox',
                         'autosave': 'Checkbox',
+                        'autosave_policy': 'Dropdown',
+                        'autosave_interval': 'BoundedIntText',
+                        'n_workers': 'BoundedIntText',
                         'show_progress': 'Checkbox'}
         return widget_names
 
     @property
     def descriptions(self):
         descriptions = {'overwrite': 'overwrite previously processed files',
-                        'autosave': 'autosave progress after each file',
+                        'autosave': 'autosave progress',
+                        'autosave_policy': 'when to autosave progress (also upon errors)',
+                        'autosave_interval': 'autosave interval (N files or T seconds)',
+                        'n_workers': 'number of files to process in parallel',
                         'show_progress': 'show progress bar and estimated computation time'}
         return descriptions
     
@@ -69,18 +74,30 @@ class QuantificationObject(ProcessingObject):
     def default_configs(self) -> DefaultConfigs:
         default_values = {'overwrite': False,
                           'autosave': True,
+                          'autosave_policy': 'every N files',
+                          'autosave_interval': 1,
+                          'n_workers': 1,
                           'show_progress': True}
         valid_types = {'overwrite': [bool],
                        'autosave': [bool],
+                       'autosave_policy': [str],
+                       'autosave_interval': [int],
+                       'n_workers': [int],
                        'show_progress': [bool]}
+        valid_value_ranges = {'autosave_interval': (1, 3600, 1),
+                              'n_workers': (1, 64, 1)}
+        valid_options = {'autosave_policy': ('every N files', 'every T seconds', 'on completion or exception')}
         default_configs = DefaultConfigs(default_values = default_values,
-                                         valid_types = valid_types)
+                                         valid_types = valid_types,
+                                         valid_value_ranges = valid_value_ranges,
+                                         valid_value_options = valid_options)
         return default_configs
     
     
     def _processing_specific_preparations(self) -> None:
         self.file_id = self.file_ids[0]
-        self.segmentations_per_area_roi_id = self._load_postprocessed_segmentations()
+        if hasattr(self, 'segmentations_per_area_roi_id') == False: # could already be passed in memory, e.g. in API.run_pipeline
+            self.segmentations_per_area_roi_id = self._load_postprocessed_segmentations()
 
 
     def _load_postprocessed_segmentations(self) -> Dict:
@@ -88,10 +105,9 @@ class QuantificationObject(ProcessingObject):
         quantified_segmentations_dir_path = self.database.project_configs.root_dir.joinpath(self.database.quantified_segmentations_dir)
         for elem in quantified_segmentations_dir_path.iterdir():
             if elem.is_dir():
-                matching_filepaths = [filepath for filepath in utils.list_dir_no_hidden(elem) if filepath.name.startswith(self.file_id)]
-                if len(matching_filepaths) > 0:
+                if self.database.contains_zstack(dir_path = elem, file_id = self.file_id):
                     area_roi_id = elem.name
-                    segmentations_per_area_roi_id[area_roi_id] = utils.load_zstack_as_array_from_single_planes(path = elem, file_id = self.file_id)
+                    segmentations_per_area_roi_id[area_roi_id] = self.database.load_zstack(dir_path = elem, file_id = self.file_id)
         return segmentations_per_area_roi_id
 
 
@@ -1,14 +1,18 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/api/04_readers_01_microscopy_images.ipynb.
 
 # %% auto 0
-__all__ = ['MicroscopyImageReaders', 'CZIReader', 'RegularImageFiletypeReader', 'FromExcelReader']
+__all__ = ['MicroscopyImageReaders', 'CZIReader', 'RegularImageFiletypeReader', 'TiffStackReader', 'FromExcelReader']
 
 # %% ../../nbs/api/04_readers_01_microscopy_images.ipynb 2
 from abc import abstractmethod
-from typing import List, Tuple, Optional, Dict, Any, Union
+from typing import List, Tuple, Optional, Dict, Any, Union, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import PosixPath, Path, WindowsPath
 import numpy as np
+import pandas as pd
 import czifile
+import tifffile
+import zarr
 from skimage.io import imread
 
 from ..core import DataReader, DataLoader
@@ -24,13 +28,45 @@ class MicroscopyImageReaders(DataReader):
     be used even if there is just a single plane. For instance, the shape of the array of a grayscale 
     2D image with 1024 x 1024 pixels will look like this:
     [1, 1024, 1024, 1]    
+    If the reader configs contain a "spatial_window" (i.e. a dictionary with the keys "lower_row_cropping_idx",
+    "upper_row_cropping_idx", "lower_col_cropping_idx", and "upper_col_cropping_idx"), only this window of the 
+    image has to be returned (clipped to the actual image dimensions), which enables the readers to read only 
+    the corresponding region from disk.
+    In addition, all MicroscopyImageReaders provide the `iter_planes` method, which yields the selected image planes
+    one after another (each with the structure [rows, columns, color-channels]). By default, the entire image is read 
+    first, but subclasses that can decode individual planes override it, such that z-stacks larger than the available
+    memory can be streamed plane by plane.
     """
 
     def assert_correct_output_format(self, output: np.ndarray) -> None:
-        assert type(output) == np.ndarray, 'The constructed output is not a numpy array!'
+        assert isinstance(output, np.ndarray), 'The constructed output is not a numpy array!' # also allows lazy numpy.memmap views
         assert len(output.shape) == 4, 'The shape of the to-be-returned array does not match the expected shape!'
         
         
+    def iter_planes(self,
+                    filepath: Union[PosixPath, WindowsPath], # filepath to the microscopy image file
+                    reader_configs: Dict # a dictionary based on the DefaultConfigs specified in the MicroscopyReaderSpecs
+                   ) -> Iterator[np.ndarray]: # numpy arrays with the structure: [rows, columns, imaging-channel]
+        """
+        Streaming variant of `read()`, which yields the selected planes one after another. This default 
+        implementation reads the entire image first - override it, if the filetype allows to decode planes individually.
+        """
+        read_image_using_configs = self.read(filepath = filepath, reader_configs = reader_configs)
+        for plane_index in range(read_image_using_configs.shape[0]):
+            yield read_image_using_configs[plane_index]
+            
+            
+    def read_shape(self,
+                   filepath: Union[PosixPath, WindowsPath], # filepath to the microscopy image file
+                   reader_configs: Dict # a dictionary based on the DefaultConfigs specified in the MicroscopyReaderSpecs
+                  ) -> Tuple[int, int, int, int]: # shape of the image that `read()` would return: [imaging-planes, rows, columns, imaging-channel]
+        """
+        Returns the shape of the image that would be read using the "reader_configs". This default implementation 
+        reads the entire image - override it, if the shape can be determined from the metadata of the filetype.
+        """
+        return self.read(filepath = filepath, reader_configs = reader_configs).shape
+        
+        
     def _get_color_channel_slice(self, reader_configs: Dict[str, Any]) -> slice:
         if reader_configs['all_color_channels'] == True:
             color_channel_slice = slice(None)
@@ -61,6 +97,16 @@ class MicroscopyImageReaders(DataReader):
                 upper_plane_idx += 1
             plane_idx_slice = slice(lower_plane_idx, upper_plane_idx)
         return plane_idx_slice
+    
+    
+    def _get_spatial_window_slices(self, reader_configs: Dict[str, Any]) -> Tuple[slice, slice]:
+        if 'spatial_window' in reader_configs.keys():
+            spatial_window = reader_configs['spatial_window']
+            row_slice = slice(spatial_window['lower_row_cropping_idx'], spatial_window['upper_row_cropping_idx'])
+            col_slice = slice(spatial_window['lower_col_cropping_idx'], spatial_window['upper_col_cropping_idx'])
+        else:
+            row_slice, col_slice = slice(None), slice(None)
+        return row_slice, col_slice
 
 # %% ../../nbs/api/04_readers_01_microscopy_images.ipynb 5
 class CZIReader(MicroscopyImageReaders):
@@ -84,33 +130,112 @@ class CZIReader(MicroscopyImageReaders):
              filepath: Path, # filepath to the microscopy image file
              reader_configs: Dict # a dictionary based on the DefaultConfigs specified in the MicroscopyReaderSpecs
             ) -> np.ndarray: # numpy array with the structure: [imaging-planes, rows, columns, imaging-channel]
+        with czifile.CziFile(filepath) as img:
+            selection, plane_axis_idx = self._get_selection(img = img, reader_configs = reader_configs)
+            read_image_using_configs = self._read_selected_subblocks(img = img, selection = selection)
+        if plane_axis_idx == None: # single plane image, tested
+            read_image_using_configs = np.expand_dims(read_image_using_configs, axis=[0])
+        return read_image_using_configs
+    
+    
+    def iter_planes(self,
+                    filepath: Union[PosixPath, WindowsPath], # filepath to the microscopy image file
+                    reader_configs: Dict # a dictionary based on the DefaultConfigs specified in the MicroscopyReaderSpecs
+                   ) -> Iterator[np.ndarray]: # numpy arrays with the structure: [rows, columns, imaging-channel]
+        """
+        Decodes and yields the selected planes one after another, i.e. only the subblocks of a single plane
+        have to be kept in memory at a time.
+        """
+        with czifile.CziFile(filepath) as img:
+            selection, plane_axis_idx = self._get_selection(img = img, reader_configs = reader_configs)
+            if plane_axis_idx == None:
+                yield self._read_selected_subblocks(img = img, selection = selection)
+            else:
+                for plane_idx in range(*selection[plane_axis_idx].indices(img.shape[plane_axis_idx])):
+                    plane_selection = selection[:plane_axis_idx] + (plane_idx,) + selection[plane_axis_idx + 1:]
+                    yield self._read_selected_subblocks(img = img, selection = plane_selection)
+                    
+                    
+    def read_shape(self,
+                   filepath: Union[PosixPath, WindowsPath], # filepath to the microscopy image file
+                   reader_configs: Dict # a dictionary based on the DefaultConfigs specified in the MicroscopyReaderSpecs
+                  ) -> Tuple[int, int, int, int]: # shape of the image that `read()` would return: [imaging-planes, rows, columns, imaging-channel]
+        """
+        Determines the shape from the subblock directory of the CZI file, i.e. without decoding any image data.
+        """
+        with czifile.CziFile(filepath) as img:
+            selection, plane_axis_idx = self._get_selection(img = img, reader_configs = reader_configs)
+            selection, selected_ranges = self._get_selected_ranges(img = img, selection = selection)
+        shape = [upper_idx - lower_idx for (lower_idx, upper_idx), idx_or_slice in zip(selected_ranges, selection) if type(idx_or_slice) == slice]
+        if plane_axis_idx == None: # single plane image
+            shape = [1] + shape
+        return tuple(shape)
+    
+    
+    def _get_selection(self, img: czifile.CziFile, reader_configs: Dict) -> Tuple[Tuple[Union[int, slice], ...], Optional[int]]:
+        """
+        Returns the indices & slices along the axes of CziFile.asarray() that correspond to the reader configs, 
+        as well as the index of the imaging plane axis in this selection (None for single plane images).
+        """
         color_channel_slice = self._get_color_channel_slice(reader_configs = reader_configs)
         plane_idx_slice = self._get_plane_idx_slice(reader_configs = reader_configs)
-        img = czifile.CziFile(filepath)
+        row_slice, col_slice = self._get_spatial_window_slices(reader_configs = reader_configs)
         meta = img.metadata(raw=False)["ImageDocument"]["Metadata"]["Information"]["Image"]
         if meta["SizeZ"] == 1: # single plane image, tested
-            single_plane_image=img.asarray()[reader_configs["tile_row_idx"],
-                                         reader_configs["tile_col_idx"], 
-                                         :, 
-                                         :, 
-                                         color_channel_slice]
-            read_image_using_configs = np.expand_dims(single_plane_image, axis=[0])
+            selection = (reader_configs["tile_row_idx"], reader_configs["tile_col_idx"], row_slice, col_slice, color_channel_slice)
+            plane_axis_idx = None
         elif meta["SizeS"] == 1: # single version image, tested
-            read_image_using_configs=img.asarray()[reader_configs["tile_row_idx"],
-                                         reader_configs["tile_col_idx"], 
-                                         plane_idx_slice, 
-                                         :, 
-                                         :, 
-                                         color_channel_slice]
+            selection = (reader_configs["tile_row_idx"], reader_configs["tile_col_idx"], plane_idx_slice, row_slice, col_slice, color_channel_slice)
+            plane_axis_idx = 2
         else: # not tested yet
-            read_image_using_configs=img.asarray()[reader_configs['version_idx'],
-                reader_configs['tile_row_idx'], 
-                reader_configs['tile_col_idx'], 
-                plane_idx_slice, 
-                :, 
-                :, 
-                color_channel_slice]
-        return read_image_using_configs
+            selection = (reader_configs['version_idx'], reader_configs['tile_row_idx'], reader_configs['tile_col_idx'], 
+                         plane_idx_slice, row_slice, col_slice, color_channel_slice)
+            plane_axis_idx = 3
+        return selection, plane_axis_idx
+    
+    
+    def _read_selected_subblocks(self, 
+                                 img: czifile.CziFile, # opened CziFile
+                                 selection: Tuple[Union[int, slice], ...] # indices & slices along the axes of CziFile.asarray()
+                                ) -> np.ndarray: # equivalent to: img.asarray()[selection]
+        """
+        Instead of decoding the entire image data via `CziFile.asarray()` and indexing it afterwards, 
+        the subblock directory is used to decode only those subblocks (e.g. tiles or planes) that 
+        intersect with the selection. They are directly copied into an array of the selected shape.
+        """
+        selection, selected_ranges = self._get_selected_ranges(img = img, selection = selection)
+        selected_image_data = np.zeros([upper_idx - lower_idx for lower_idx, upper_idx in selected_ranges], dtype = img.dtype)
+        for directory_entry in img.filtered_subblock_directory:
+            subblock_ranges = [(entry_start - img_start, entry_start - img_start + entry_size) 
+                               for entry_start, img_start, entry_size in zip(directory_entry.start, img.start, directory_entry.shape)]
+            intersecting_ranges = [(max(subblock_lower, selected_lower), min(subblock_upper, selected_upper)) 
+                                   for (subblock_lower, subblock_upper), (selected_lower, selected_upper) in zip(subblock_ranges, selected_ranges)]
+            if all([lower_idx < upper_idx for lower_idx, upper_idx in intersecting_ranges]):
+                tile = directory_entry.data_segment().data(resize = True, order = 0)
+                tile_index = tuple(slice(lower_idx - subblock_lower, upper_idx - subblock_lower) 
+                                   for (lower_idx, upper_idx), (subblock_lower, _) in zip(intersecting_ranges, subblock_ranges))
+                selection_index = tuple(slice(lower_idx - selected_lower, upper_idx - selected_lower) 
+                                        for (lower_idx, upper_idx), (selected_lower, _) in zip(intersecting_ranges, selected_ranges))
+                selected_image_data[selection_index] = tile[tile_index]
+        squeezed_axes = tuple(axis_idx for axis_idx, idx_or_slice in enumerate(selection) if type(idx_or_slice) != slice)
+        return np.squeeze(selected_image_data, axis = squeezed_axes)
+    
+    
+    def _get_selected_ranges(self, 
+                             img: czifile.CziFile, # opened CziFile
+                             selection: Tuple[Union[int, slice], ...] # indices & slices along the axes of CziFile.asarray()
+                            ) -> Tuple[Tuple[Union[int, slice], ...], List[Tuple[int, int]]]: # selection padded to all axes & the selected (lower, upper) index range per axis
+        selection = tuple(selection) + (slice(None),) * (len(img.shape) - len(selection))
+        selected_ranges = []
+        for axis_idx, (idx_or_slice, axis_size) in enumerate(zip(selection, img.shape)):
+            if type(idx_or_slice) == slice:
+                lower_idx, upper_idx, step = idx_or_slice.indices(axis_size)
+                assert step == 1, 'Only contiguous slices are supported for reading CZI files!'
+                selected_ranges.append((lower_idx, max(lower_idx, upper_idx)))
+            else:
+                assert 0 <= idx_or_slice < axis_size, f'Index {idx_or_slice} is out of bounds for axis {axis_idx} with size {axis_size}!'
+                selected_ranges.append((idx_or_slice, idx_or_slice + 1))
+        return selection, selected_ranges
 
 # %% ../../nbs/api/04_readers_01_microscopy_images.ipynb 6
 class RegularImageFiletypeReader(MicroscopyImageReaders):
@@ -122,8 +247,8 @@ class RegularImageFiletypeReader(MicroscopyImageReaders):
     
     @property
     def readable_filetype_extensions(self) -> List[str]:
-        # ToDo: figure out which formats are possible, probably many many more.. 
-        return ['.png', '.tif', '.tiff', '.jpg']
+        # ToDo: figure out which formats are possible, probably many many more.. (TIFF files are handled by the TiffStackReader)
+        return ['.png', '.jpg']
     
     
     def read(self,
@@ -132,7 +257,8 @@ class RegularImageFiletypeReader(MicroscopyImageReaders):
             ) -> np.ndarray: # numpy array with the structure: [imaging-planes, rows, columns, imaging-channel]
         image_with_correct_format = self._attempt_to_load_image_at_correct_format(filepath = filepath)
         color_channel_slice = self._get_color_channel_slice(reader_configs = reader_configs)
-        read_image_using_configs = image_with_correct_format[:, :, :, color_channel_slice]
+        row_slice, col_slice = self._get_spatial_window_slices(reader_configs = reader_configs)
+        read_image_using_configs = image_with_correct_format[:, row_slice, col_slice, color_channel_slice]
         return read_image_using_configs 
     
     
@@ -153,6 +279,136 @@ class RegularImageFiletypeReader(MicroscopyImageReaders):
         return image_with_correct_format
 
 # %% ../../nbs/api/04_readers_01_microscopy_images.ipynb 7
+class TiffStackReader(MicroscopyImageReaders):
+    
+    """
+    This reader enables loading of single- and multi-page TIFF files (including BigTIFFs and ImageJ hyperstacks),
+    using the tifffile package. Uncompressed image data is memory-mapped (copy-on-write, so the file itself is 
+    never modified) and returned as a view, such that only the selected planes, color channels (and spatial window)
+    will eventually be read from disk. Compressed or tiled image data is accessed via the zarr interface of tifffile 
+    instead, which decodes only the pages and tiles that are required for the selection.
+    Note: the image data has to contain at most one axis for planes (e.g. "Z", "T", or "I") and for color channels 
+    ("C" or "S"). Only the first series of the TIFF file will be read.
+    """
+    
+    @property
+    def readable_filetype_extensions(self) -> List[str]:
+        return ['.tif', '.tiff']
+    
+    
+    def read(self,
+             filepath: Union[PosixPath, WindowsPath], # filepath to the microscopy image file
+             reader_configs: Dict # a dictionary based on the DefaultConfigs specified in the MicroscopyReaderSpecs
+            ) -> np.ndarray: # numpy array with the structure: [imaging-planes, rows, columns, imaging-channel]
+        color_channel_slice = self._get_color_channel_slice(reader_configs = reader_configs)
+        with tifffile.TiffFile(filepath) as tif:
+            series = tif.series[0]
+            standardized_axes = self._get_standardized_axes(axes = series.axes)
+            selection = self._get_selection(standardized_axes = standardized_axes, reader_configs = reader_configs)
+            image_data = self._open_image_data(filepath = filepath, series = series)
+            read_image_using_configs = self._read_selection(image_data = image_data,
+                                                            selection = selection,
+                                                            standardized_axes = standardized_axes,
+                                                            color_channel_slice = color_channel_slice)
+        return read_image_using_configs
+    
+    
+    def iter_planes(self,
+                    filepath: Union[PosixPath, WindowsPath], # filepath to the microscopy image file
+                    reader_configs: Dict # a dictionary based on the DefaultConfigs specified in the MicroscopyReaderSpecs
+                   ) -> Iterator[np.ndarray]: # numpy arrays with the structure: [rows, columns, imaging-channel]
+        """
+        Reads and yields the selected planes one after another, i.e. only a single plane 
+        (and its pages or tiles, for compressed image data) has to be kept in memory at a time.
+        """
+        color_channel_slice = self._get_color_channel_slice(reader_configs = reader_configs)
+        with tifffile.TiffFile(filepath) as tif:
+            series = tif.series[0]
+            standardized_axes = self._get_standardized_axes(axes = series.axes)
+            selection = self._get_selection(standardized_axes = standardized_axes, reader_configs = reader_configs)
+            image_data = self._open_image_data(filepath = filepath, series = series)
+            if 'P' not in standardized_axes: # single plane image
+                plane_selections = [selection]
+            else:
+                plane_axis_idx = standardized_axes.index('P')
+                plane_selections = [selection[:plane_axis_idx] + (slice(plane_idx, plane_idx + 1),) + selection[plane_axis_idx + 1:]
+                                    for plane_idx in range(*selection[plane_axis_idx].indices(series.shape[plane_axis_idx]))]
+            for plane_selection in plane_selections:
+                yield self._read_selection(image_data = image_data,
+                                           selection = plane_selection,
+                                           standardized_axes = standardized_axes,
+                                           color_channel_slice = color_channel_slice)[0]
+    
+    
+    def read_shape(self,
+                   filepath: Union[PosixPath, WindowsPath], # filepath to the microscopy image file
+                   reader_configs: Dict # a dictionary based on the DefaultConfigs specified in the MicroscopyReaderSpecs
+                  ) -> Tuple[int, int, int, int]: # shape of the image that `read()` would return: [imaging-planes, rows, columns, imaging-channel]
+        """
+        Determines the shape from the metadata of the TIFF file, i.e. without reading any image data.
+        """
+        with tifffile.TiffFile(filepath) as tif:
+            series = tif.series[0]
+            standardized_axes = self._get_standardized_axes(axes = series.axes)
+            selection = self._get_selection(standardized_axes = standardized_axes, reader_configs = reader_configs)
+            selected_lengths = {axis: len(range(*axis_slice.indices(axis_length))) 
+                                for axis, axis_slice, axis_length in zip(standardized_axes, selection, series.shape)}
+        if 'P' not in selected_lengths.keys(): # single plane image
+            selected_lengths['P'] = 1
+        if 'C' not in selected_lengths.keys(): # single color channel
+            selected_lengths['C'] = len(range(*self._get_color_channel_slice(reader_configs = reader_configs).indices(1)))
+        return tuple(selected_lengths[axis] for axis in 'PYXC')
+    
+    
+    def _get_selection(self, standardized_axes: str, reader_configs: Dict) -> Tuple[slice, ...]:
+        slices_per_axis = {'P': self._get_plane_idx_slice(reader_configs = reader_configs),
+                           'C': self._get_color_channel_slice(reader_configs = reader_configs)}
+        slices_per_axis['Y'], slices_per_axis['X'] = self._get_spatial_window_slices(reader_configs = reader_configs)
+        return tuple(slices_per_axis[axis] for axis in standardized_axes)
+    
+    
+    def _open_image_data(self, filepath: Union[PosixPath, WindowsPath], series: tifffile.TiffPageSeries) -> Union[np.memmap, zarr.Array]:
+        if series.dataoffset != None: # contiguous, uncompressed image data
+            image_data = tifffile.memmap(filepath, mode = 'c')
+        else:
+            image_data = zarr.open_array(series.aszarr(), mode = 'r')
+        return image_data
+    
+    
+    def _read_selection(self, 
+                        image_data: Union[np.memmap, zarr.Array], 
+                        selection: Tuple[slice, ...], 
+                        standardized_axes: str, 
+                        color_channel_slice: slice
+                       ) -> np.ndarray: # numpy array with the structure: [imaging-planes, rows, columns, imaging-channel]
+        selected_image_data = image_data[selection]
+        if 'P' not in standardized_axes: # single plane image
+            selected_image_data = np.expand_dims(selected_image_data, axis = 0)
+            standardized_axes = 'P' + standardized_axes
+        if 'C' not in standardized_axes: # single color channel
+            selected_image_data = np.expand_dims(selected_image_data, axis = -1)[..., color_channel_slice]
+            standardized_axes = standardized_axes + 'C'
+        return np.transpose(selected_image_data, axes = [standardized_axes.index(axis) for axis in 'PYXC'])
+    
+    
+    def _get_standardized_axes(self, axes: str) -> str:
+        plane_axes = [axis for axis in axes if axis not in ['Y', 'X', 'C', 'S']]
+        color_channel_axes = [axis for axis in axes if axis in ['C', 'S']]
+        if (len(plane_axes) > 1) or (len(color_channel_axes) > 1) or ('Y' not in axes) or ('X' not in axes):
+            raise NotImplementedError('The TiffStackReader can only handle TIFF files with at most one axis for imaging planes '
+                                      'and at most one axis for color channels (in addition to the "Y" and "X" axes). However, '
+                                      f'the axes of the file you´d like to load are: "{axes}".')
+        standardized_axes = ''
+        for axis in axes:
+            if axis in plane_axes:
+                standardized_axes += 'P'
+            elif axis in color_channel_axes:
+                standardized_axes += 'C'
+            else:
+                standardized_axes += axis
+        return standardized_axes
+
+# %% ../../nbs/api/04_readers_01_microscopy_images.ipynb 8
 class FromExcelReader(MicroscopyImageReaders):
     
     """
@@ -171,20 +427,102 @@ class FromExcelReader(MicroscopyImageReaders):
              filepath: Union[PosixPath, WindowsPath], # filepath to the excel sheet that contains the filepaths to the corresponding image files
              reader_configs: Dict # a dictionary based on the DefaultConfigs specified in the MicroscopyReaderSpecs
             ) -> np.ndarray: # numpy array with the structure: [imaging-planes, rows, columns, imaging-channel]
-
-        import findmycells.readers as readers
+        """
+        The individual plane images are decoded concurrently in a thread pool and written directly 
+        into a preallocated array. The plane range specified in the reader configs refers to the 
+        rows of the excel sheet, i.e. only the selected plane images will be loaded.
+        """
+        plane_filepaths = self._get_selected_plane_filepaths(filepath = filepath, reader_configs = reader_configs)
+        readers_per_extension = self._get_readers_per_extension(plane_filepaths = plane_filepaths)
+        plane_reader_configs = self._get_plane_reader_configs(reader_configs = reader_configs)
+        first_plane_image = self._load_plane_image(plane_filepath = plane_filepaths[0],
+                                                   readers_per_extension = readers_per_extension,
+                                                   plane_reader_configs = plane_reader_configs)
+        planes_per_image = first_plane_image.shape[0]
+        read_image_using_configs = np.empty((len(plane_filepaths) * planes_per_image,) + first_plane_image.shape[1:], dtype = first_plane_image.dtype)
+        read_image_using_configs[:planes_per_image] = first_plane_image
+        del first_plane_image
+        
+        def load_plane_image_into_output(row_index: int) -> None:
+            plane_image = self._load_plane_image(plane_filepath = plane_filepaths[row_index],
+                                                 readers_per_extension = readers_per_extension,
+                                                 plane_reader_configs = plane_reader_configs)
+            assert plane_image.shape[0] == planes_per_image, f'All images listed in {filepath} need to have the same number of planes!'
+            read_image_using_configs[row_index * planes_per_image : (row_index + 1) * planes_per_image] = plane_image
         
+        with ThreadPoolExecutor() as executor:
+            # list() to raise exceptions that occurred in any of the threads:
+            list(executor.map(load_plane_image_into_output, range(1, len(plane_filepaths))))
+        return read_image_using_configs
+    
+    
+    def iter_planes(self,
+                    filepath: Union[PosixPath, WindowsPath], # filepath to the excel sheet that contains the filepaths to the corresponding image files
+                    reader_configs: Dict # a dictionary based on the DefaultConfigs specified in the MicroscopyReaderSpecs
+                   ) -> Iterator[np.ndarray]: # numpy arrays with the structure: [rows, columns, imaging-channel]
+        """
+        Streaming variant of `read()`, which loads and yields the selected planes one after another, 
+        such that only a single plane has to be kept in memory at a time.
+        """
+        plane_filepaths = self._get_selected_plane_filepaths(filepath = filepath, reader_configs = reader_configs)
+        readers_per_extension = self._get_readers_per_extension(plane_filepaths = plane_filepaths)
+        plane_reader_configs = self._get_plane_reader_configs(reader_configs = reader_configs)
+        for plane_filepath in plane_filepaths:
+            plane_image = self._load_plane_image(plane_filepath = plane_filepath,
+                                                 readers_per_extension = readers_per_extension,
+                                                 plane_reader_configs = plane_reader_configs)
+            for plane_index in range(plane_image.shape[0]):
+                yield plane_image[plane_index]
+                
+                
+    def read_shape(self,
+                   filepath: Union[PosixPath, WindowsPath], # filepath to the excel sheet that contains the filepaths to the corresponding image files
+                   reader_configs: Dict # a dictionary based on the DefaultConfigs specified in the MicroscopyReaderSpecs
+                  ) -> Tuple[int, int, int, int]: # shape of the image that `read()` would return: [imaging-planes, rows, columns, imaging-channel]
+        """
+        Determines the shape from the first selected plane image only (using the `read_shape()` method of its 
+        reader), since all plane images listed in the excel sheet need to have the same shape.
+        """
+        plane_filepaths = self._get_selected_plane_filepaths(filepath = filepath, reader_configs = reader_configs)
+        readers_per_extension = self._get_readers_per_extension(plane_filepaths = plane_filepaths)
+        plane_reader_configs = self._get_plane_reader_configs(reader_configs = reader_configs)
+        first_plane_image_shape = readers_per_extension[plane_filepaths[0].suffix].read_shape(filepath = plane_filepaths[0], reader_configs = plane_reader_configs)
+        return (len(plane_filepaths) * first_plane_image_shape[0],) + tuple(first_plane_image_shape[1:])
+    
+    
+    def _get_selected_plane_filepaths(self, filepath: Union[PosixPath, WindowsPath], reader_configs: Dict) -> List[Union[PosixPath, WindowsPath]]:
         df_single_plane_filepaths = pd.read_excel(filepath)
-        single_plane_images = []
-        for row_index in range(df_single_plane_filepaths.shape[0]):
-            single_plane_image_filepath = Path(df_single_plane_filepaths['plane_filepath'].iloc[row_index])
-            file_extension = single_plane_image_filepath.suffix
-            image_loader = DataLoader()
+        all_plane_filepaths = [Path(plane_filepath) for plane_filepath in df_single_plane_filepaths['plane_filepath']]
+        plane_idx_slice = self._get_plane_idx_slice(reader_configs = reader_configs)
+        selected_plane_filepaths = all_plane_filepaths[plane_idx_slice]
+        assert len(selected_plane_filepaths) > 0, f'None of the image filepaths listed in {filepath} match the selected plane indices!'
+        return selected_plane_filepaths
+    
+    
+    def _get_readers_per_extension(self, plane_filepaths: List[Union[PosixPath, WindowsPath]]) -> Dict[str, MicroscopyImageReaders]:
+        import findmycells.readers as readers
+        image_loader = DataLoader()
+        readers_per_extension = {}
+        for file_extension in set([plane_filepath.suffix for plane_filepath in plane_filepaths]):
             image_reader_class = image_loader.determine_reader(file_extension = file_extension,
                                                                data_reader_module = readers.microscopy_images)
-            loaded_image = image_loader.load(data_reader_class = image_reader_class,
-                                             filepath = single_plane_image_filepath,
-                                             reader_configs = reader_configs)
-            single_plane_images.append(loaded_image)
-        read_image_using_configs = np.stack(single_plane_images)
-        return read_image_using_configs
+            readers_per_extension[file_extension] = image_reader_class()
+        return readers_per_extension
+    
+    
+    def _get_plane_reader_configs(self, reader_configs: Dict) -> Dict:
+        # the plane selection was already applied to the rows of the excel sheet
+        plane_reader_configs = reader_configs.copy()
+        plane_reader_configs['all_planes'] = True
+        return plane_reader_configs
+    
+    
+    def _load_plane_image(self, 
+                          plane_filepath: Union[PosixPath, WindowsPath], 
+                          readers_per_extension: Dict[str, MicroscopyImageReaders], 
+                          plane_reader_configs: Dict
+                         ) -> np.ndarray:
+        image_reader = readers_per_extension[plane_filepath.suffix]
+        plane_image = image_reader.read(filepath = plane_filepath, reader_configs = plane_reader_configs)
+        image_reader.assert_correct_output_format(output = plane_image)
+        return plane_image
@@ -50,6 +50,8 @@ class SegmentationObject(ProcessingObject):
                         'clear_tmp_data': 'Checkbox',
                         'overwrite': 'Checkbox',
                         'autosave': 'Checkbox',
+                        'autosave_policy': 'Dropdown',
+                        'autosave_interval': 'BoundedIntText',
                         'show_progress': 'Checkbox'}
         return widget_names
 
@@ -61,7 +63,9 @@ class SegmentationObject(ProcessingObject):
                         'clear_tmp_data': ('delete temp. files as soon as possible (recommended '
                                            'for low memory)'),
                         'overwrite': 'overwrite previously processed files',
-                        'autosave': 'autosave progress after each file',
+                        'autosave': 'autosave progress',
+                        'autosave_policy': 'when to autosave progress (also upon errors)',
+                        'autosave_interval': 'autosave interval (N files or T seconds)',
                         'show_progress': 'show progress bar and estimated computation time'}
         return descriptions
     
@@ -76,17 +80,24 @@ class SegmentationObject(ProcessingObject):
                           'clear_tmp_data': True,
                           'overwrite': False,
                           'autosave': True,
+                          'autosave_policy': 'every N files',
+                          'autosave_interval': 1,
                           'show_progress': True}
         valid_types = {'batch_size': [int],
                        'run_strategies_individually': [bool],
                        'clear_tmp_data': [bool],
                        'overwrite': [bool],
                        'autosave': [bool],
+                       'autosave_policy': [str],
+                       'autosave_interval': [int],
                        'show_progress': [bool]}
-        valid_value_ranges = {'batch_size': (0, 25, 1)}
+        valid_value_ranges = {'batch_size': (0, 25, 1),
+                              'autosave_interval': (1, 3600, 1)}
+        valid_options = {'autosave_policy': ('every N files', 'every T seconds', 'on completion or exception')}
         default_configs = DefaultConfigs(default_values = default_values,
                                          valid_types = valid_types,
-                                         valid_value_ranges = valid_value_ranges)
+                                         valid_value_ranges = valid_value_ranges,
+                                         valid_value_options = valid_options)
         return default_configs
     
     
@@ -12,10 +12,10 @@ import shutil
 import tempfile
 import zarr
 import os
-from skimage import measure, segmentation, io
+from skimage import measure, segmentation
 
 from .specs import SegmentationObject, SegmentationStrategy
-from ..database import Database
+from ..database import Database, PNGPlanesZStackStore
 from ..configs import DefaultConfigs
 from .. import utils
 
@@ -103,27 +103,43 @@ class Deepflash2SemanticSegmentationStrat(SegmentationStrategy):
         root_dir_path = database.project_configs.root_dir
         segmentation_tool_dir = root_dir_path.joinpath(database.segmentation_tool_dir)
         temp_copies_path = segmentation_tool_dir.joinpath('copies_of_preprocessed_images')
+        preprocessed_images_dir = root_dir_path.joinpath(database.preprocessed_images_dir)
         for file_id in file_ids_in_batch:
-            preprocessed_images_dir = root_dir_path.joinpath(database.preprocessed_images_dir)
-            files_to_segment = [filepath for filepath in utils.list_dir_no_hidden(preprocessed_images_dir) if filepath.name.startswith(file_id)]
-            if len(files_to_segment) > 0:
+            if database.contains_zstack(dir_path = preprocessed_images_dir, file_id = file_id):
                 if temp_copies_path.is_dir() == False:
                     temp_copies_path.mkdir()
-                for filepath_source in files_to_segment:
-                    shutil.copy(filepath_source, temp_copies_path)
+                self._export_preprocessed_image_as_png_planes(database = database, file_id = file_id, target_dir_path = temp_copies_path)
+
+
+    def _export_preprocessed_image_as_png_planes(self, database: Database, file_id: str, target_dir_path: Union[PosixPath, WindowsPath]) -> None:
+        # deepflash2 expects one image file per plane, regardless of the intermediate storage format of the project
+        preprocessed_images_dir = database.project_configs.root_dir.joinpath(database.preprocessed_images_dir)
+        png_planes_store = PNGPlanesZStackStore()
+        if png_planes_store.contains(dir_path = preprocessed_images_dir, file_id = file_id):
+            for filepath_source in utils.list_dir_no_hidden(preprocessed_images_dir, only_files = True):
+                if filepath_source.name.startswith(file_id) and filepath_source.suffix == '.png':
+                    shutil.copy(filepath_source, target_dir_path)
+        else:
+            preprocessed_image = database.load_zstack(dir_path = preprocessed_images_dir, file_id = file_id)
+            png_planes_store.save(zstack = preprocessed_image, dir_path = target_dir_path, file_id = file_id)
                     
                     
     def _compute_stats(self, database: Database) -> Tuple:
         from deepflash2.learner import EnsembleLearner
         preprocessed_images_dir_path = database.project_configs.root_dir.joinpath(database.preprocessed_images_dir)
         expected_file_count = sum(filter(None, database.file_infos["total_planes"]))
-        actual_file_count = len([filepath for filepath in utils.list_dir_no_hidden(preprocessed_images_dir_path) if filepath.name.endswith('.png')])
-        if actual_file_count != expected_file_count:
-            raise ValueError('Actual and expected counts of preprocessed images don´t match.')
-        ensemble_learner = EnsembleLearner(image_dir = preprocessed_images_dir_path, 
-                                           ensemble_path = database.segmentation_tool_configs['df2']['ensemble_path'])
-        stats = ensemble_learner.stats
-        del ensemble_learner
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_dir_path = Path(temp_dir)
+            for file_id in database.file_infos['file_id']:
+                if database.contains_zstack(dir_path = preprocessed_images_dir_path, file_id = file_id):
+                    self._export_preprocessed_image_as_png_planes(database = database, file_id = file_id, target_dir_path = temp_dir_path)
+            actual_file_count = len([filepath for filepath in utils.list_dir_no_hidden(temp_dir_path) if filepath.name.endswith('.png')])
+            if actual_file_count != expected_file_count:
+                raise ValueError('Actual and expected counts of preprocessed images don´t match.')
+            ensemble_learner = EnsembleLearner(image_dir = temp_dir_path, 
+                                               ensemble_path = database.segmentation_tool_configs['df2']['ensemble_path'])
+            stats = ensemble_learner.stats
+            del ensemble_learner
         return stats
 
 
@@ -143,14 +159,17 @@ class Deepflash2SemanticSegmentationStrat(SegmentationStrategy):
 
 
     def _move_files(self, database: Database) -> None:
+        # deepflash2 exports one mask file per plane, which are saved as z-stack in the storage format of the project instead
         semantic_segmentations_target_dir_path = database.project_configs.root_dir.joinpath(database.semantic_segmentations_dir)
         segmentation_tool_dir_path = database.project_configs.root_dir.joinpath(database.segmentation_tool_dir)      
         current_semantic_masks_dir_path = segmentation_tool_dir_path.joinpath('masks')
-        for mask_filepath in utils.list_dir_no_hidden(current_semantic_masks_dir_path):
-            target_filepath = semantic_segmentations_target_dir_path.joinpath(mask_filepath.name)
-            if target_filepath.is_file() == True:
-                target_filepath.delete()
-            shutil.move(mask_filepath, semantic_segmentations_target_dir_path)
+        png_planes_store = PNGPlanesZStackStore()
+        for file_id in database.file_infos['file_id']:
+            if png_planes_store.contains(dir_path = current_semantic_masks_dir_path, file_id = file_id):
+                semantic_masks = png_planes_store.load(dir_path = current_semantic_masks_dir_path, file_id = file_id)
+                database.save_zstack(zstack = semantic_masks, dir_path = semantic_segmentations_target_dir_path, file_id = file_id)
+                for mask_filepath in png_planes_store.get_filepaths(dir_path = current_semantic_masks_dir_path, file_id = file_id):
+                    mask_filepath.unlink()
         shutil.rmtree(segmentation_tool_dir_path.joinpath('copies_of_preprocessed_images'))
 
 
@@ -241,7 +260,6 @@ class LosslessConversionOfDF2SemanticSegToInstanceSegWithCPStrat(SegmentationStr
 
     
     def _add_cellpose_as_segmentation_tool(self, database: Database, strategy_configs: Dict) -> Database:
-        semantic_masks_dir = database.project_configs.root_dir.joinpath(database.semantic_segmentations_dir)
         if hasattr(database, 'segmentation_tool_configs') == False:
             database.segmentation_tool_configs = {'cp': {}}
         elif 'cp' not in database.segmentation_tool_configs.keys():
@@ -250,19 +268,21 @@ class LosslessConversionOfDF2SemanticSegToInstanceSegWithCPStrat(SegmentationStr
         database.segmentation_tool_configs['cp']['model_type'] = strategy_configs['model_type']
         if strategy_configs['diameter'] == 0:
             self._assert_all_semantic_segmentations_are_done(database = database)
-            database.segmentation_tool_configs['cp']['diameter'] = self._compute_cellpose_diameter(semantic_masks_dir = semantic_masks_dir)
+            database.segmentation_tool_configs['cp']['diameter'] = self._compute_cellpose_diameter(database = database)
         else:
             database.segmentation_tool_configs['cp']['diameter'] = strategy_configs['diameter']
         return database
 
 
-    def _compute_cellpose_diameter(self, semantic_masks_dir: Union[PosixPath, WindowsPath]) -> float:
+    def _compute_cellpose_diameter(self, database: Database) -> float:
+        semantic_masks_dir = database.project_configs.root_dir.joinpath(database.semantic_segmentations_dir)
         all_median_equivalent_diameters = []
-        for mask_filepath in semantic_masks_dir.iterdir():
-            if mask_filepath.name.endswith('.png'):
-                mask = io.imread(mask_filepath)
-                median_equivalent_diameter = self._calculate_median_equivalent_diameter_of_features_in_mask(segmentation_mask = mask)
-                all_median_equivalent_diameters.append(median_equivalent_diameter)
+        for file_id in database.file_infos['file_id']:
+            if database.contains_zstack(dir_path = semantic_masks_dir, file_id = file_id):
+                semantic_masks = database.load_zstack(dir_path = semantic_masks_dir, file_id = file_id)
+                for plane_index in range(semantic_masks.shape[0]):
+                    median_equivalent_diameter = self._calculate_median_equivalent_diameter_of_features_in_mask(segmentation_mask = semantic_masks[plane_index])
+                    all_median_equivalent_diameters.append(median_equivalent_diameter)
         if len(all_median_equivalent_diameters) > 0:
             cellpose_diameter = np.nanmedian(all_median_equivalent_diameters)
             if np.isnan(cellpose_diameter):
@@ -297,9 +317,17 @@ class LosslessConversionOfDF2SemanticSegToInstanceSegWithCPStrat(SegmentationStr
         segmentation_tool_temp_dir_path = segmentation_tool_dir_path.joinpath(database.segmentation_tool_temp_dir)
         print(segmentation_tool_temp_dir_path)
         zarr_group = zarr.open(segmentation_tool_temp_dir_path, mode='r')
-        for image_filename in zarr_group['/smx'].__iter__():
+        image_filenames_per_file_id = {}
+        for image_filename in sorted(zarr_group['/smx'].__iter__()):
             file_id = image_filename[:4]
             if file_id in segmentation_object.file_ids:
+                if file_id not in image_filenames_per_file_id.keys():
+                    image_filenames_per_file_id[file_id] = []
+                image_filenames_per_file_id[file_id].append(image_filename)
+        instance_segmentations_dir_path = database.project_configs.root_dir.joinpath(database.instance_segmentations_dir)
+        for file_id, image_filenames in image_filenames_per_file_id.items():
+            instance_masks = []
+            for image_filename in image_filenames:
                 df2_softmax = zarr_group[f'/smx/{image_filename}'][..., 1]
                 df2_pred = np.zeros_like(df2_softmax)
                 df2_pred[np.where(df2_softmax >= 0.5)] = 1
@@ -312,9 +340,8 @@ class LosslessConversionOfDF2SemanticSegToInstanceSegWithCPStrat(SegmentationStr
                     instance_mask = self._lossless_conversion_of_df2_semantic_to_instance_seg_using_cp(df2_pred = df2_pred, cp_mask = cp_mask)
                 else: 
                     instance_mask = df2_pred.copy()
-                instance_mask = instance_mask.astype('uint16')
-                filepath = database.project_configs.root_dir.joinpath(database.instance_segmentations_dir, image_filename)
-                io.imsave(filepath, instance_mask, check_contrast=False)
+                instance_masks.append(instance_mask.astype('uint16'))
+            database.save_zstack(zstack = np.stack(instance_masks), dir_path = instance_segmentations_dir_path, file_id = file_id)
 
 
     def _compute_cellpose_mask(self, df2_softmax: np.ndarray, model_type: str, net_avg: bool, diameter: int) -> np.ndarray:
@@ -1,14 +1,15 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/api/99_utils.ipynb.
 
 # %% auto 0
-__all__ = ['list_dir_no_hidden', 'load_zstack_as_array_from_single_planes', 'unpad_x_y_dims_in_3d_array',
-           'get_polygon_from_instance_segmentation', 'download_sample_data']
+__all__ = ['list_dir_no_hidden', 'load_zstack_as_array_from_single_planes', 'unpad_x_y_dims_in_3d_array', 'get_row_chunks',
+           'get_polygon_from_instance_segmentation', 'LabelGeometryIndex', 'remap_label_ids', 'download_sample_data']
 
 # %% ../nbs/api/99_utils.ipynb 2
-from typing import List, Optional, Union
+from typing import List, Dict, Tuple, Optional, Union
 from pathlib import Path, PosixPath, WindowsPath
 
 import numpy as np
+from scipy import ndimage
 from skimage import io
 from skimage import measure
 from shapely.geometry import Polygon
@@ -40,7 +41,7 @@ def load_zstack_as_array_from_single_planes(path: Union[PosixPath, WindowsPath],
             raise TypeError("'minx', 'maxx', 'miny', and 'maxy' all have to be integers - or None if no cropping has to be done")
     else:
         cropping = False
-    matching_filepaths = [filepath for filepath in list_dir_no_hidden(path) if filepath.name.startswith(file_id)]
+    matching_filepaths = sorted([filepath for filepath in list_dir_no_hidden(path) if filepath.name.startswith(file_id)])
     cropped_zstack = []
     for single_plane_filepath in matching_filepaths:
         tmp_image = io.imread(single_plane_filepath)
@@ -55,17 +56,127 @@ def unpad_x_y_dims_in_3d_array(padded_3d_array: np.ndarray, pad_width: int) -> n
     return padded_3d_array[:, pad_width:padded_3d_array.shape[1]-pad_width, pad_width:padded_3d_array.shape[2]-pad_width]
 
 # %% ../nbs/api/99_utils.ipynb 7
-def get_polygon_from_instance_segmentation(single_plane: np.ndarray, label_id: int) -> Polygon:
-    x_dim, y_dim = single_plane.shape
-    tmp_array = np.zeros((x_dim, y_dim), dtype='uint8')
-    tmp_array[np.where(single_plane == label_id)] = 1
+def get_row_chunks(image: np.ndarray, max_pixels_per_chunk: int=2**20) -> List[slice]:
+    """
+    Splits the first axis (e.g. the rows of a single plane) of "image" into slices that each cover at most 
+    "max_pixels_per_chunk" elements (but at least one row), e.g. to limit the size of temporary arrays.
+    """
+    rows_per_chunk = max(1, max_pixels_per_chunk // max(1, int(np.prod(image.shape[1:]))))
+    return [slice(lower_row_idx, lower_row_idx + rows_per_chunk) for lower_row_idx in range(0, image.shape[0], rows_per_chunk)]
+
+# %% ../nbs/api/99_utils.ipynb 8
+def get_polygon_from_instance_segmentation(single_plane: np.ndarray, 
+                                           label_id: int, 
+                                           bounding_box: Optional[Tuple[slice, slice]]=None # e.g. from `ndimage.find_objects`, will be determined if not provided
+                                          ) -> Polygon:
+    """
+    Creates a polygon from the (first) contour of all pixels in "single_plane" that belong to "label_id". 
+    The contour is only traced within the bounding box of the label (padded by one pixel, as the contour 
+    runs through the adjacent background pixels) and is then shifted back to the coordinates of the plane.
+    """
+    if bounding_box == None:
+        bounding_box = ndimage.find_objects((single_plane == label_id).astype('uint8'))[0]
+    padded_bounding_box = tuple(slice(max(axis_slice.start - 1, 0), min(axis_slice.stop + 1, axis_length)) 
+                                for axis_slice, axis_length in zip(bounding_box, single_plane.shape))
+    tmp_array = (single_plane[padded_bounding_box] == label_id).astype('uint8')
     tmp_contours = measure.find_contours(tmp_array, level = 0)[0]
+    tmp_contours += [padded_bounding_box[0].start, padded_bounding_box[1].start]
     roi = Polygon(tmp_contours)
     if roi.is_valid == False:
         roi = make_valid(roi)
     return roi
 
-# %% ../nbs/api/99_utils.ipynb 8
+# %% ../nbs/api/99_utils.ipynb 9
+class LabelGeometryIndex:
+    
+    """
+    Provides the bounding boxes and polygons of all labels in an instance segmentation z-stack 
+    ([imaging-planes, rows, columns]). The bounding boxes of all labels in a plane are determined 
+    at once via `ndimage.find_objects` when the plane is accessed for the first time, such that 
+    each contour only has to be traced within the bounding box of its label. Polygons are memoized 
+    per plane and label ID. If the z-stack is modified, the affected planes have to be reset.
+    """
+    
+    def __init__(self, zstack: np.ndarray) -> None:
+        self.zstack = zstack
+        self.bounding_boxes_per_plane = {}
+        self.polygons = {}
+        
+        
+    def get_bounding_boxes(self, plane_index: int) -> Dict[int, Tuple[slice, slice]]:
+        if plane_index not in self.bounding_boxes_per_plane.keys():
+            single_plane = self.zstack[plane_index]
+            if single_plane.dtype.kind not in ['i', 'u']:
+                single_plane = single_plane.astype('int64')
+            self.bounding_boxes_per_plane[plane_index] = {label_idx + 1: bounding_box 
+                                                          for label_idx, bounding_box in enumerate(ndimage.find_objects(single_plane))
+                                                          if bounding_box != None}
+        return self.bounding_boxes_per_plane[plane_index]
+    
+    
+    def get_plane_indices_with_label_id(self, label_id: int) -> List[int]:
+        return [plane_index for plane_index in range(self.zstack.shape[0]) if label_id in self.get_bounding_boxes(plane_index = plane_index).keys()]
+    
+    
+    def get_polygon(self, plane_index: int, label_id: int) -> Polygon:
+        if (plane_index, label_id) not in self.polygons.keys():
+            self.polygons[(plane_index, label_id)] = get_polygon_from_instance_segmentation(single_plane = self.zstack[plane_index], 
+                                                                                           label_id = label_id,
+                                                                                           bounding_box = self.get_bounding_boxes(plane_index = plane_index)[label_id])
+        return self.polygons[(plane_index, label_id)]
+    
+    
+    def reset(self, plane_index: Optional[int]=None) -> None:
+        """
+        Discards the bounding boxes and polygons of the plane with "plane_index" (or of all planes, 
+        if no "plane_index" is passed), e.g. after the labels in this plane were modified.
+        """
+        if plane_index == None:
+            self.bounding_boxes_per_plane, self.polygons = {}, {}
+        else:
+            self.bounding_boxes_per_plane.pop(plane_index, None)
+            self.polygons = {key: polygon for key, polygon in self.polygons.items() if key[0] != plane_index}
+
+# %% ../nbs/api/99_utils.ipynb 10
+def remap_label_ids(label_image: np.ndarray, 
+                    old_label_ids: Union[List, np.ndarray], 
+                    new_label_ids: Union[List, np.ndarray], # same length as "old_label_ids"
+                    dtype: Optional[Union[str, np.dtype]]=None # dtype of the returned array, defaults to the dtype of "label_image"
+                   ) -> np.ndarray:
+    """
+    Returns a copy of "label_image", in which all "old_label_ids" were replaced by the corresponding "new_label_ids" 
+    in a single vectorized pass, while all other values remain unchanged. All label IDs are replaced simultaneously, 
+    so a new label ID that is also an old label ID is not remapped again. For non-negative integer labels that do 
+    not exceed 2**24, a dense lookup table with one entry per label ID is used. Otherwise, the (sparse) old label 
+    IDs are sorted and looked up via `np.searchsorted`.
+    """
+    if dtype == None:
+        dtype = label_image.dtype
+    old_label_ids = np.asarray(old_label_ids)
+    new_label_ids = np.asarray(new_label_ids).astype(dtype)
+    assert old_label_ids.shape == new_label_ids.shape, '"old_label_ids" and "new_label_ids" must have the same length!'
+    if (label_image.dtype.kind == 'u') and (label_image.dtype.itemsize <= 2):
+        lookup_table_size = 2**(8 * label_image.dtype.itemsize)
+    elif (label_image.dtype.kind in ['i', 'u']) and (label_image.size > 0) and (label_image.min() >= 0) and (label_image.max() < 2**24):
+        lookup_table_size = int(label_image.max()) + 1
+    else:
+        lookup_table_size = None
+    if lookup_table_size != None:
+        lookup_table = np.arange(lookup_table_size).astype(dtype)
+        in_lookup_table = (old_label_ids >= 0) & (old_label_ids < lookup_table_size) & (old_label_ids == np.round(old_label_ids))
+        lookup_table[old_label_ids[in_lookup_table].astype('int64')] = new_label_ids[in_lookup_table]
+        remapped_label_image = lookup_table[label_image]
+    else:
+        remapped_label_image = label_image.astype(dtype)
+        if old_label_ids.shape[0] > 0:
+            sorting_indices = np.argsort(old_label_ids)
+            sorted_old_label_ids, sorted_new_label_ids = old_label_ids[sorting_indices], new_label_ids[sorting_indices]
+            positions = np.searchsorted(sorted_old_label_ids, label_image).clip(max = sorted_old_label_ids.shape[0] - 1)
+            is_old_label_id = sorted_old_label_ids[positions] == label_image
+            remapped_label_image[is_old_label_id] = sorted_new_label_ids[positions[is_old_label_id]]
+    return remapped_label_image
+
+# %% ../nbs/api/99_utils.ipynb 11
 def download_sample_data(destination_dir_path: Union[PosixPath, WindowsPath]) -> None:
     """
     Test data for findmycells can be found here: https://zenodo.org/record/7655292#.Y_LI1R-ZNhE